@@ -1,39 +1,33 @@
 """Module maintains the alien."""
 
-import pygame
-from pygame.sprite import Sprite
+from assets import assets
+from entity import Entity
 
 
-class Alien(Sprite):
+class Alien(Entity):
     """A class to represent a single alien in the fleet."""
 
+    # The fleet arrays hold the positions, so an alien is only its shared image, its rect and its index
+    __slots__ = ("index",)
+
     def __init__(self, ai_game, *groups):
         """Initialize the alien and set its starting position."""
         super().__init__(*groups)
-        self.screen = ai_game.screen
-        self.settings = ai_game.settings
 
-        # Load the alien image and get its associated rectangle
-        self.image = pygame.image.load("images/alien.bmp")  # Returns a surface representing the alien
+        # Get the alien image shared by the whole fleet and its associated rectangle
+        self.image = assets.load_image("images/alien.bmp")  # Returns a surface representing the alien
         self.rect = self.image.get_rect()
 
         # Initialize new alien near the top left of the screen
-        # It will later be overwritten by `_create_alien` in `alien_invasion`
+        # It will later be overwritten by `Fleet.sync_rects` from the exact position stored in the fleet arrays
         self.rect.x = self.rect.width  # Leave offset of (width x height) for easy observation
         self.rect.y = self.rect.height
 
-        # Store the alien's exact horizontal position
-        self.x = float(self.rect.x)
-
-    def update(self, *args):
-        """Move the alien left or right based on the fleet direction."""
-        self.x += self.settings.alien_speed * self.settings.fleet_direction  # Move alien left or right
-        self.rect.x = self.x  # Update the rect position for further surface rendering
-
-    def hit_edges(self):
-        """Return True if alien hits the edge of the screen."""
-        screen_rect = self.screen.get_rect()
-        if self.rect.right >= screen_rect.right or self.rect.left <= screen_rect.left:
-            return True
-        else:
-            return False
+        self.index = None  # Index of the alien in the arrays of its `Fleet`
+
+    def reset(self, index):
+        """
+        Assign the alien to an entry of the fleet arrays, e.g. when it is reused from the pool for a new fleet.
+        :param index: Index of the alien in the arrays of its `Fleet`.
+        """
+        self.index = index
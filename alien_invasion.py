@@ -1,268 +1,489 @@
 """Main routine for alien invasion game."""
 
+import os
+import random
 import sys
-from time import sleep
 
 import pygame
 
-from alien import Alien
+import config
+import inputs
+from assets import assets
 from bullet import Bullet
 from button import Button
+from controls import create_controls
+from entity import Context
+from enemy_fire import EnemyProjectiles
+from fleet import Fleet
+from game_clock import GameClock
+from game_state import GameState
 from game_stats import GameStats
+from level_loader import LevelLoader
+from particles import create_particles
+from pool import SpritePool
+from profiler import create_profiler
+from renderer import NullRenderer, create_renderer
+from replay import ReplayWriter
 from scoreboard import Scoreboard
 from settings import Settings
 from ship import Ship
+from sound import NullSoundEffects, create_sound_effects
+from viewport import create_viewport
 
 
 class AlienInvasion:
     """Overall class to manage game assets and behavior."""
 
-    def __init__(self):
-        """Initialize the game, and create game resources."""
-        pygame.init()  # Initialize background settings that Pygame needs to work properly
-        self.settings = Settings()
-
-        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
-        # Full screen mode
-        # self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        # self.settings.screen_width = self.screen.get_rect().width
-        # self.settings.screen_height = self.screen.get_rect().height
-
-        pygame.display.set_caption("Alien Invasion")
+    def __init__(self, settings=None, headless=False):
+        """
+        Initialize the game, and create game resources.
+        :param settings: Instance of `Settings` to play with, default to a new one.
+        :param headless: Run without any window or audio device, e.g. for batch simulations.
+        """
+        self.settings = settings if settings is not None else Settings()
+        self.headless = headless
+        if self.settings.seed is None:
+            self.settings.seed = random.randrange(2 ** 32)  # Pick a seed, but keep it so the session can be replayed
+        self.rng = random.Random(self.settings.seed)  # Source of all game randomness, seeded for reproducible games
+        self.sim_time = 0.0  # Seconds of game time simulated so far, including pauses
+        self.session_start = 0.0  # Game time at which the current game started
+        self.ticks = 0  # Number of fixed simulation steps run so far, whether the game is active or not
+        self.input_state = 0  # Bit mask of the `inputs` flags currently held down
+        self.profiler = create_profiler(self)  # Time the phases of each frame, a no-op unless `Settings.profile`
+
+        if headless:
+            # Draw on an off-screen surface: no display is opened at all, only the font module is needed
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            pygame.font.init()
+            self.screen = pygame.Surface((self.settings.screen_width, self.settings.screen_height))
+            self.display = self.screen
+        else:
+            # Only bring up the modules drawing needs: `pygame.init` would also start the mixer, joysticks and so on,
+            # the mixer is started with the sound effects after the first frame
+            pygame.display.init()
+            pygame.font.init()
+            self.display = self._set_display_mode()
+            pygame.display.set_caption("Alien Invasion")
+            # The game is laid out at the logical resolution, only the renderer draws on the display through the
+            # viewport; when both sizes match the display itself is the screen and nothing is mapped
+            logical_size = (self.settings.screen_width, self.settings.screen_height)
+            self.screen = self.display if self.display.get_size() == logical_size else pygame.Surface(logical_size)
+        self.viewport = create_viewport(self)  # Scale and offset from the logical resolution to the display
+        assets.preload()  # Decode and convert all images once so that respawns cost no file I/O
+
+        self.sounds = NullSoundEffects(self)  # Silent until `_finish_startup` decodes the sound effects
 
         self.stats = GameStats(self)  # Create an instance to record the game statistics
+        self.state = GameState()  # Phase of the game in progress: playing, or a timed pause such as a ship lost
 
         self.score_board = Scoreboard(self)  # Create an instance of scoreboard
 
         self.play_button = Button(self, "Play")  # Create an instance of start button
 
+        self.context = Context(self)  # References shared by all the entities instead of one copy in each of them
         self.ship = Ship(self)  # Create an instance of spaceship
 
         self.bullets = pygame.sprite.Group()  # A group of bullets that have been fired by spaceship
+        self.bullet_pool = SpritePool(lambda: Bullet(self), self.bullets)  # Bullets are recycled instead of allocated
 
         self.aliens = pygame.sprite.Group()  # A group of aliens that generated by computer
+        self.fleet = Fleet(self)  # Positions of the aliens, moved as a whole
+        self.enemy_fire = EnemyProjectiles(self)  # Shots fired down at the ship by the fleet
+        self.particles = create_particles(self)  # Explosion effects, purely cosmetic so they are updated per frame
+        self.levels = LevelLoader(self)  # Fleet layouts and settings of each level, read when the level starts
+        self.levels.get(self.stats.level).apply(self.settings)
         self._create_fleet()  # Initialize the fleet of aliens
 
+        self.clock = GameClock(self)  # Schedule fixed simulation steps and cap the frame rate
+        self.controls = create_controls(self)  # Map keyboard, gamepad and mouse events to the game actions
+        self.renderer = NullRenderer(self) if headless else create_renderer(self)  # Present the scene to the display
+
+        # Stream the session inputs to a replay file if requested
+        self.recorder = ReplayWriter(self.settings.replay_path, self.settings) if self.settings.replay_path else None
+
+    def _set_display_mode(self):
+        """Helper to open the window, or the full screen at its native resolution, with vsync if requested."""
+        settings = self.settings
+        size, flags = settings.display_size or (settings.screen_width, settings.screen_height), 0
+        if settings.fullscreen:
+            size, flags = (0, 0), pygame.FULLSCREEN
+        if settings.vsync:
+            try:
+                screen = pygame.display.set_mode(size, flags | pygame.SCALED, vsync=1)  # Vsync requires `SCALED`
+            except pygame.error as error:
+                print(f"Vsync not available ({error}), falling back to the frame rate cap", file=sys.stderr)
+                settings.vsync = False
+                screen = pygame.display.set_mode(size, flags)
+        else:
+            screen = pygame.display.set_mode(size, flags)
+        return screen
+
     def run_game(self):
         """Start the main loop for the game."""
+        profiler = self.profiler
+        self._update_screen()  # Show the first frame as soon as possible, then do the work it doesn't need
+        self._finish_startup()
+        controls = self.controls
         while True:
-            self._check_events()  # Pooling over key and mouse events
-            if self.stats.game_active:
-                self.ship.update()  # Update ship position
-                self._update_bullets()  # Update bullets position
-                self._update_aliens()  # Update aliens position
-            self._update_screen()  # Update screen display
-
-    def _check_events(self):
-        """Helper to respond to the key-presses and mouse events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.stats.store_highest_score()  # Store the highest score
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                self._check_keydown_events(event)
-            elif event.type == pygame.KEYUP:
-                self._check_keyup_event(event)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()  # Get a tuple of mouse position when pressed down
-                self._check_play_button(mouse_pos)
-
-    def _check_keydown_events(self, event):
-        """Helper to respond to key-press events."""
-        if event.key == pygame.K_RIGHT:
-            self.ship.moving_right = True  # Start moving ship to the right
-        elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = True  # Start moving ship to the left
-        elif event.key == pygame.K_q or event.key == pygame.K_ESCAPE:
-            self.stats.store_highest_score()  # Store the highest score
-            sys.exit()  # Exit games using keypress `Q` or `ESC`
-        elif event.key == pygame.K_SPACE:
+            profiler.begin_frame()
+            low_latency = self.settings.low_latency_input
+            if not low_latency:
+                profiler.start()
+                controls.poll()  # Apply the key, gamepad and mouse events
+                profiler.stop("events")
+            profiler.start()
+            # Sleep until next frame, then catch up with the simulation; in low-latency mode events are time-stamped
+            # during the wait and only applied after it, right before the simulation
+            steps = self.clock.advance(controls.ingest if low_latency else None)
+            profiler.stop("wait")
+            if low_latency:
+                profiler.start()
+                controls.poll()
+                profiler.stop("events")
+            for _ in range(steps):
+                self._tick(self.clock.dt)
+            if self.settings.level_hot_reload and self.clock.frames % 30 == 0:
+                self._reload_level()  # Pick up balance changes made while playing
+            profiler.start()
+            self.particles.update(steps * self.clock.dt)  # One vectorized step for the whole frame
+            profiler.stop("particles")
+            profiler.start()
+            self._update_screen(self.clock.alpha)  # Update screen display
+            profiler.stop("render")
+            profiler.end_frame(self)
+
+    def _finish_startup(self):
+        """Helper to initialize what the first frame doesn't need, once it is on the screen."""
+        self.sounds = create_sound_effects(self)  # Start the mixer and decode all the sound effects once
+        self.controls.start_gamepads()  # Gamepads plugged in are reported as events from now on
+
+    def _tick(self, dt):
+        """
+        Run a single fixed simulation step, which only advances the game while it is active.
+        :param dt: Seconds elapsed in this simulation step.
+        """
+        if self.stats.game_active:
+            if self.state.playing:
+                self._update(dt)
+            else:
+                # Rendering and input go on during a pause, only the simulation is frozen
+                self.sim_time += dt
+                if self.state.advance(dt):
+                    self._end_pause()
+        self.ticks += 1
+
+    def _update(self, dt):
+        """
+        Advance the game simulation by a single fixed step.
+        :param dt: Seconds elapsed in this simulation step.
+        """
+        self.sim_time += dt
+        profiler = self.profiler
+        profiler.start()
+        self.ship.update(dt)  # Update ship position
+        profiler.stop("ship")
+        profiler.start()
+        self._update_bullets(dt)  # Update bullets position
+        profiler.stop("bullets")
+        if not self.state.playing:  # The last alien was shot, the level-up pause freezes the rest of the step
+            return
+        profiler.start()
+        self._update_aliens(dt)  # Update aliens position
+        profiler.stop("aliens")
+        if not self.state.playing:  # The aliens hit the ship or reached the bottom, the shots freeze with them
+            return
+        profiler.start()
+        self._update_enemy_fire(dt)  # Fire, move and cull the shots of the aliens
+        profiler.stop("enemy_fire")
+
+    def set_input_state(self, state):
+        """
+        Apply a new player input state, reacting to the actions pressed or released since the previous one.
+        :param state: Bit mask of the `inputs` flags held down.
+        """
+        previous, self.input_state = self.input_state, state
+        if self.recorder is not None and state != previous:
+            self.recorder.record(self.ticks, state)
+        self.ship.moving_right = bool(state & inputs.MOVE_RIGHT)
+        self.ship.moving_left = bool(state & inputs.MOVE_LEFT)
+        pressed = inputs.pressed(state, previous)
+        if pressed & inputs.FIRE:
             self._fire_bullet()
-        elif event.key == pygame.K_p:  # We can also start game by pressing `p`
+        if pressed & inputs.START:
             self._start_game()
 
-    def _check_keyup_event(self, event):
-        """Helper to respond to key-release events."""
-        if event.key == pygame.K_RIGHT:
-            self.ship.moving_right = False  # Stop moving ship to the right
-        elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = False  # Stop moving ship to the left
+    def _quit(self):
+        """Helper to store the highest score and exit the game."""
+        self._end_session()  # Keep the game in progress in the history
+        self.stats.store_highest_score()  # Store the highest score
+        self.stats.store.close()  # Wait for the background writes to reach the disk
+        if self.settings.profile_export:
+            self.profiler.export(self.settings.profile_export)
+        latency = self.controls.latency_summary()
+        if self.profiler.enabled and latency["samples"]:
+            print(f"Input latency over {latency['samples']} events: p50 {latency['ms_p50']:.1f} ms, "
+                  f"p95 {latency['ms_p95']:.1f} ms, max {latency['ms_max']:.1f} ms")
+        if self.recorder is not None:
+            self.recorder.close(self.ticks, self.stats)  # Seal the replay with the final statistics
+        sys.exit()
+
+    def _pause(self, phase, seconds):
+        """
+        Helper to freeze the ship and the fleet in a timed phase, ending it right away if `seconds` is not positive.
+        :param phase: One of the `GameState` pause phases.
+        :param seconds: Duration of the pause in game time.
+        """
+        self.state.enter(phase, seconds)
+        if seconds <= 0:
+            self._end_pause()
+
+    def _end_pause(self):
+        """Helper to leave the current pause phase and carry out what it was waiting for."""
+        phase = self.state.phase
+        self.state.enter(GameState.PLAYING)
+        if phase == GameState.SHIP_LOST:
+            # Get rid of any remaining bullets in the group and of the shots of the aliens
+            self.bullet_pool.release_all()
+            self.enemy_fire.clear()
+            # Create a new fleet of aliens, which recycles the remaining ones, and re-center the ship
+            self._create_fleet()
+            self.ship.center_ship()
+        elif phase == GameState.LEVEL_UP:
+            self.enemy_fire.clear()
+            self._create_fleet()
+        elif phase == GameState.GAME_OVER:
+            self._end_session()
+            self.stats.game_active = False  # Back to the Play button
+            self._set_mouse_visible(True)  # Show the mouse cursor after game overs
+
+    def _end_session(self):
+        """Helper to record the game in progress, if any, in the session history."""
+        if self.stats.game_active:
+            self.stats.record_session(self.sim_time - self.session_start)
+
+    def _set_mouse_visible(self, visible):
+        """Helper to show or hide the mouse cursor, if there is a window."""
+        if not self.headless:
+            pygame.mouse.set_visible(visible)
 
     def _check_play_button(self, mouse_pos):
-        """Start a new game when the player clicks Play button."""
+        """Start a new game when the player clicks Play button, return whether it did."""
         button_clicked = self.play_button.rect.collidepoint(mouse_pos)  # Returns True when a point is inside the rect
         if button_clicked and not self.stats.game_active:  # Make sure the click event is valid when game is inactive
-            self._start_game()
+            # Click the button like a press and release of START so the click is part of the input state history
+            self.set_input_state(self.input_state | inputs.START)
+            self.set_input_state(self.input_state & ~inputs.START)
+            return True
+        return False
 
     def _start_game(self):
         """Helper to start the game by reset game statistics and re-initializes all aliens and ships."""
+        self._end_session()  # A restart abandons the game in progress
         self.stats.game_active = True
+        self.session_start = self.sim_time
+        self.state.enter(GameState.PLAYING)
 
         # Reset the game statistics and re-initialize all aliens and ship for new game round
         self.stats.reset_stats()
-        self.aliens.empty()
-        self.bullets.empty()
+        self.bullet_pool.release_all()
+        self.enemy_fire.clear()
+        self.particles.clear()
         self.ship.center_ship()
-        self._create_fleet()
         # Reset the game settings to restore the initial game level
         self.settings.initialize_dynamic_settings()
+        self.levels.reset(self.settings)  # Undo what the levels of the previous game overrode
+        self.levels.get(self.stats.level).apply(self.settings)
+        self._create_fleet()
         # Update the scoreboard after reset score statistics
         self.score_board.prep_scoreboard()
 
         # Hide the mouse cursor after game starts
-        pygame.mouse.set_visible(False)
+        self._set_mouse_visible(False)
 
     def _fire_bullet(self):
         """Helper to create a new bullet and add it to the bullets group."""
-        if self.stats.game_active and len(self.bullets) < self.settings.bullet_allowed:
-            new_bullet = Bullet(self)
-            self.bullets.add(new_bullet)
-            # Add bullet shoot sound effect
-            pygame.mixer_music.load('sounds/shoot.mp3')
-            pygame.mixer_music.play()
-
-    def _update_bullets(self):
+        if self.stats.game_active and self.state.playing and len(self.bullets) < self.settings.bullet_allowed:
+            self.bullet_pool.acquire(self.ship.rect)
+            self.profiler.start()
+            self.sounds.play("shoot")  # Add bullet shoot sound effect
+            self.profiler.stop("audio")
+
+    def _update_bullets(self, dt):
         """Helper to update position of bullets and get rid of bullets shoot out-of-screen."""
         # Update bullet positions
-        self.bullets.update()
-        # Get rid of bullets that have been disappeared (off screen)
-        for bullet in self.bullets.copy():  # Use copy to avoid modifying `bullets` when iteration
-            if bullet.rect.bottom <= 0:
-                self.bullets.remove(bullet)
+        self.bullets.update(dt)
+        # Get rid of bullets that have been disappeared (off screen), recycling them without copying the group
+        self.bullet_pool.release_where(lambda bullet: bullet.rect.bottom <= 0)
         # Handle bullet-alien collision
+        self.profiler.start()
         self._check_bullet_alien_collision()
+        self.profiler.stop("collision")
 
     def _check_bullet_alien_collision(self):
         """Respond to bullet-alien collisions."""
         # Check for any bullets that have hit aliens
         # If so, remove any bullets and aliens that have collided
-        collisions = pygame.sprite.groupcollide(self.bullets, self.aliens, True, True)
+        collisions = self.fleet.groupcollide(self.bullets)
 
         if collisions:  # Increment scores for bullets hit aliens
+            self.bullet_pool.release_where(lambda bullet: not bullet.alive())  # Recycle the bullets that hit
             for hit_aliens in collisions.values():
                 self.stats.score += self.settings.alien_points * len(hit_aliens)
+                # Blow up every alien of the hit in a single burst
+                self.particles.burst(self.fleet.centers(hit_aliens), "alien", self.settings.particles_per_alien)
+            self.profiler.start()
             self.score_board.prep_score()  # Update rendered image of the score
             self.score_board.check_high_score()  # Update the highest score if possible
-            # Add bullet alien collision sound effect
-            pygame.mixer_music.load('sounds/explosion.mp3')
-            pygame.mixer_music.play()
+            self.profiler.stop("hud")
+            self.profiler.start()
+            self.sounds.play("explosion")  # Add bullet alien collision sound effect
+            self.profiler.stop("audio")
 
         if not self.aliens:
             self.start_new_level()
 
     def start_new_level(self):
         """Helper to start a new level of game round."""
-        # Destroy existing bullets and create new fleet if we shoot all aliens in a fleet
-        self.bullets.empty()
-        self._create_fleet()
+        # Destroy existing bullets if we shoot all aliens in a fleet
+        self.bullet_pool.release_all()
         # Level-up the difficulty of games
         self.settings.increase_speed()
         # Update the level info on the scoreboard
         self.stats.level += 1
         self.score_board.prep_level()
+        # Then apply what the next level overrides, its fleet is created at the end of the pause
+        self.levels.get(self.stats.level).apply(self.settings)
+        # Announce the level before the new fleet appears
+        self._pause(GameState.LEVEL_UP, self.settings.level_up_delay)
 
-    def _update_aliens(self):
+    def _update_aliens(self, dt):
         """Helper to update the position of all aliens in the fleet."""
         self._check_fleet_hit_edges()  # Update the moving direction if any alien hits either edge
-        self.aliens.update()  # Update the position of aliens in the fleet
+        self.fleet.update(dt)  # Update the position of aliens in the fleet
 
         # Look for alien-ship collision
-        if pygame.sprite.spritecollideany(self.ship, self.aliens):
+        self.profiler.start()
+        ship_hit = bool(self.fleet.collide_rect(self.ship.rect, self.ship.mask))
+        self.profiler.stop("collision")
+        if ship_hit:
             self._ship_hit()
 
         # Look for aliens hitting the bottom of the screen
         self._check_aliens_hit_bottom()
 
-    def _update_screen(self):
-        """Helper to update images on the screen and flip to new screen."""
-        self.screen.fill(self.settings.bg_color)  # Draw screen background color
-
-        self.ship.blitme()  # Draw spaceship to screen
-
-        for bullet in self.bullets.sprites():  # `sprites` returns a list of all sprites in group for iteration
-            bullet.draw_bullet()
-
-        self.aliens.draw(self.screen)  # Draw the group of aliens
-
-        # Draw the play button if the game is inactive
+    def _update_screen(self, alpha=1.0):
+        """
+        Helper to update images on the screen and flip to new screen.
+        :param alpha: Fraction of the simulation step elapsed since the last update, used to interpolate sprites.
+        """
+        self._interpolate(alpha)  # Move the rects between the previous and current simulated positions
+        self.fleet.sync_rects(alpha)  # Aliens' rects are only used for drawing, so they are never restored
+        self.enemy_fire.sync_rects(alpha)  # Same for the shots of the aliens
+        self.renderer.render(self.viewport.map(self._scene()))
+        self.controls.presented(self.renderer.pixels_pushed)  # The input applied so far is now on the display
+        self._interpolate(1.0)  # Restore the rects to the simulated positions for collision checks
+
+    def _scene(self):
+        """Helper to list the (surface, rect) pairs to draw this frame, from the back to the front."""
+        scene = []
+        # Draw spaceship to screen, blinking while it is lost
+        if self.state.phase != GameState.SHIP_LOST or int(self.state.remaining * 10) % 2:
+            scene.append((self.ship.image, self.ship.rect))
+        # `sprites` returns a list of all sprites in group for iteration
+        scene.extend((bullet.image, bullet.rect) for bullet in self.bullets.sprites())
+        scene.extend((alien.image, alien.rect) for alien in self.aliens.sprites())
+        scene.extend(self.enemy_fire.scene())
+        scene.extend(self.particles.scene())
+
+        # Draw the play button if the game is inactive, or the banner of the current pause
         if not self.stats.game_active:
-            self.play_button.draw_button()
-
-        self.score_board.show_score()  # Draw the score board
-
-        # Make the most recently drawn screen visible
-        pygame.display.flip()
+            scene.append((self.play_button.image, self.play_button.rect))
+        elif self.state.phase == GameState.SHIP_LOST:
+            scene.append(self.score_board.banner("Ship lost!"))
+        elif self.state.phase == GameState.LEVEL_UP:
+            scene.append(self.score_board.banner(f"Level {self.stats.level}: {self.levels.get(self.stats.level).name}"))
+        elif self.state.phase == GameState.GAME_OVER:
+            scene.append(self.score_board.banner("Game Over"))
+
+        scene.extend(self.score_board.scene())  # Draw the score board
+        scene.extend(self.profiler.scene())  # Draw the profiler overlay if enabled
+        return scene
+
+    def _interpolate(self, alpha):
+        """Helper to place the rect of the ship and bullets at the fraction `alpha` of their last step."""
+        self.ship.interpolate(alpha)
+        for bullet in self.bullets.sprites():
+            bullet.interpolate(alpha)
 
     def _create_fleet(self):
-        """Helper to create the fleet of aliens."""
-        # Create an alien and find the number of aliens in a row and in a column
-        # Space between each alien is equal to one alien width and height
-        alien = Alien(self)
-        alien_width, alien_height = alien.rect.size
-        available_space_x = self.settings.screen_width - 2 * alien_width  # Margin of an alien at left & right edges
-        num_aliens_x = available_space_x // (2 * alien_width)
-
-        # Determine the number of rows of aliens can fit on the screen
-        ship_height = self.ship.rect.height
-        # We leave 2 aliens empty space above spaceship so the player has some time to shoot aliens
-        available_space_y = self.settings.screen_height - ship_height - 3 * alien_height
-        num_aliens_y = available_space_y // (2 * alien_height)
-
-        for alien_idx_y in range(num_aliens_y):  # Iterate over rows of aliens
-            for alien_idx_x in range(num_aliens_x):  # Iterate over cols of aliens on the row `alien_idx_y`
-                self._create_alien(alien_idx_x, alien_idx_y)
-
-    def _create_alien(self, alien_idx_x, alien_idx_y):
-        """Helper to create an alien and place it in the row with the specified index in X and Y coordination."""
-        alien = Alien(self)
-        alien_width, alien_height = alien.rect.size
-        alien.x = alien_width + alien_idx_x * 2 * alien_width  # Offset of one alien with stride of one alien
-        alien.rect.x = alien.x
-        alien.rect.y = alien_height + alien_idx_y * 2 * alien_height
-        self.aliens.add(alien)
+        """Helper to create the fleet of aliens of the current level, from its precomputed layout."""
+        self.fleet.spawn(self.levels.layout(self.stats.level))
+
+    def _reload_level(self):
+        """Helper to re-apply the current level file if it was edited, its fleet shape shows on the next spawn."""
+        if self.levels.changed(self.stats.level):
+            self.levels.get(self.stats.level).apply(self.settings)
 
     def _check_fleet_hit_edges(self):
         """Helper to check if any aliens have hit an edge."""
-        for alien in self.aliens.sprites():
-            if alien.hit_edges():
-                self._change_fleet_direction()
-                break
+        if self.fleet.hit_edges():
+            self._change_fleet_direction()
 
     def _change_fleet_direction(self):
         """Change the fleet's direction and drop the entire fleet."""
-        for alien in self.aliens.sprites():
-            alien.rect.y += self.settings.fleet_drop_speed
+        self.fleet.drop(self.settings.fleet_drop_speed)
         self.settings.fleet_direction *= -1  # Multiply -1 to flip the left to right direction, and vice versa
 
     def _ship_hit(self):
         """Respond to the ship being hit by an alien."""
+        if not self.state.playing:  # Already hit during this step
+            return
+        self.particles.burst(self.ship.rect.center, "ship", self.settings.particles_per_ship)
         if self.stats.ship_left > 0:
             # Decrement ship_left in statistics
             self.stats.ship_left -= 1
             self.score_board.prep_ships_left()
-            # Get rid of any remaining aliens and bullets in the group
-            self.aliens.empty()
-            self.bullets.empty()
-            # Create a new fleet of aliens and re-center the ship
-            self._create_fleet()
-            self.ship.center_ship()
-            # Sleep for 0.5s so that player notices the collision and regroup before new fleet appears
-            sleep(0.5)
+            # Pause so that player notices the collision, then regroup before new fleet appears
+            self._pause(GameState.SHIP_LOST, self.settings.ship_lost_delay)
         else:
-            self.stats.game_active = False  # We don't have any spaceship left and game over :-(
-            pygame.mouse.set_visible(True)  # Show the mouse cursor after game overs
+            # We don't have any spaceship left and game over :-(
+            self._pause(GameState.GAME_OVER, self.settings.game_over_delay)
+
+    def _update_enemy_fire(self, dt):
+        """Helper to update the shots of the aliens and respond to the ship being hit by one of them."""
+        self.enemy_fire.update(dt)
+        self.profiler.start()
+        ship_hit = self.enemy_fire.collide_rect(self.ship.rect, self.ship.mask)
+        self.profiler.stop("collision")
+        if ship_hit:
+            self._ship_hit()
 
     def _check_aliens_hit_bottom(self):
         """Check if any alien in the group have reached the bottom edge of the screen."""
-        screen_rect = self.screen.get_rect()
-        for alien in self.aliens.sprites():
-            if alien.rect.bottom >= screen_rect.bottom:
-                # Treat this the same as if ship got hit
-                self._ship_hit()
-                break
+        if self.fleet.hit_bottom():
+            # Treat this the same as if ship got hit
+            self._ship_hit()
+
+
+def main(argv=None):
+    """Command-line entry point: build the settings from the config layers, then play or simulate a game."""
+    try:
+        settings, sources, args = config.load_settings(argv)
+    except config.ConfigError as error:
+        sys.exit(f"alien_invasion: {error}")
+    if not args.quiet:
+        print("\n".join(config.describe(settings, sources)))
+
+    if settings.headless:
+        from simulation import Simulation  # Imported here since the simulation itself imports this module
+
+        result = Simulation(settings, seed=settings.seed or 0).run()
+        print(", ".join(f"{name} {value}" for name, value in result.items()))
+    else:
+        # Make a game instance, and run the game
+        ai = AlienInvasion(settings)
+        ai.run_game()
 
 
 if __name__ == "__main__":
-    # Make a game instance, and run the game
-    ai = AlienInvasion()
-    ai.run_game()
+    main()
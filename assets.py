@@ -0,0 +1,119 @@
+"""
+Module maintains the process-wide asset cache.
+Note: Every sprite used to call `pygame.image.load` in its initializer, so a new fleet re-read and re-decoded the same
+bitmap dozens of times. The cache loads each image once, converts it to the display pixel format and shares the
+resulting surface between all the sprites that draw it. Sprites must treat shared surfaces as read-only.
+"""
+
+import pygame
+
+
+class AssetCache:
+    """A registry of decoded surfaces shared by every sprite of the game."""
+
+    # Images used by the game, loaded up front by `preload` so the frame loop never touches the disk
+    DEFAULT_IMAGES = ("images/alien.bmp", "images/ship.bmp")
+
+    def __init__(self):
+        """Initialize an empty cache and its hit/miss counters."""
+        self._images = {}  # Map of image path to its converted surface
+        self._solids = {}  # Map of (size, color) to a surface filled with that color
+        self._masks = {}  # Map of image path or size to its collision mask
+        self._fonts = {}  # Map of (font name, size) to its font
+        self.hits = 0  # Number of lookups served from memory
+        self.misses = 0  # Number of lookups that had to load the file from disk
+
+    def load_image(self, path):
+        """
+        Return the shared surface of the image stored at `path`, loading it on the first request.
+        :param path: Path of the image file relative to the working directory.
+        """
+        image = self._images.get(path)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = pygame.image.load(path)
+        # `convert` requires a display mode; without one (e.g. early at startup) keep the raw surface
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        self._images[path] = image
+        return image
+
+    def solid(self, size, color):
+        """
+        Return a shared surface of `size` filled with `color`, e.g. for bullets drawn as plain rectangles.
+        :param size: Tuple of (width, height) in pixels.
+        :param color: Tuple of (R,G,B).
+        """
+        key = (tuple(size), tuple(color))
+        surface = self._solids.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            self._solids[key] = surface
+        return surface
+
+    def mask(self, path):
+        """
+        Return the shared collision mask of the image stored at `path`, built on the first request.
+        Pixels of the image background, i.e. its colorkey or else the color of its top-left pixel, are left out.
+        :param path: Path of the image file relative to the working directory.
+        """
+        mask = self._masks.get(path)
+        if mask is None:
+            image = self.load_image(path)
+            background = image.get_colorkey() or image.get_at((0, 0))
+            mask = pygame.mask.from_threshold(image, background, (1, 1, 1, 255))
+            mask.invert()
+            self._masks[path] = mask
+        return mask
+
+    def solid_mask(self, size):
+        """
+        Return a shared collision mask of `size` with every pixel set, e.g. for bullets drawn as plain rectangles.
+        :param size: Tuple of (width, height) in pixels.
+        """
+        key = tuple(size)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = pygame.Mask(key, fill=True)
+        return mask
+
+    def font(self, name, size):
+        """
+        Return the shared font `name` at `size`, looked up once.
+        :param name: Name of a system font, or None for the default font bundled with pygame, which needs no lookup.
+        :param size: Size of the font in pixels.
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            # `SysFont` scans every font installed on the system on its first call, only pay for it when needed
+            font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+        return font
+
+    def preload(self, paths=None):
+        """
+        Load a batch of images ahead of time, typically right after the display mode is set.
+        :param paths: Iterable of image paths, default to `DEFAULT_IMAGES`.
+        """
+        for path in paths if paths is not None else AssetCache.DEFAULT_IMAGES:
+            self.load_image(path)
+
+    def clear(self):
+        """Drop every cached surface, e.g. after the display mode changes and surfaces need re-conversion."""
+        self._images.clear()
+        self._solids.clear()
+        self._masks.clear()
+        self._fonts.clear()
+
+    def stats(self):
+        """Return a dictionary of the cache counters to confirm the disk goes quiet after warm-up."""
+        return {"images": len(self._images), "masks": len(self._masks), "hits": self.hits, "misses": self.misses}
+
+
+# Shared instance used across the game
+assets = AssetCache()
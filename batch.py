@@ -0,0 +1,112 @@
+"""
+Batch runner of headless Alien Invasion games for balance testing.
+Games are fanned out over a process pool and their score, level and duration are aggregated per settings value, e.g.
+    python batch.py --games 1000 --policy tracker --sweep speedup_scale=1.05,1.1,1.2 --set score_point_scale=1.5
+"""
+
+import argparse
+import ast
+import os
+import statistics
+from multiprocessing import Pool
+from time import perf_counter
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Don't greet from every worker process
+
+from settings import Settings  # noqa: E402
+from simulation import POLICIES, Simulation  # noqa: E402
+
+
+def make_settings(overrides):
+    """
+    Return new settings with the static attributes in `overrides` replaced.
+    :param overrides: Dictionary of `Settings` attribute name to value.
+    """
+    settings = Settings()
+    for name, value in overrides.items():
+        if not hasattr(settings, name):
+            raise ValueError(f"Unknown setting {name!r}")
+        setattr(settings, name, value)
+    return settings
+
+
+def run_game(job):
+    """
+    Play a single headless game in a worker process.
+    :param job: Tuple of (settings overrides, seed, policy name, max simulated seconds).
+    """
+    overrides, seed, policy, max_seconds = job
+    return Simulation(make_settings(overrides), seed, policy, max_seconds).run()
+
+
+def summarize(results):
+    """Return the mean, median, min and max of the score, level and duration of a list of game results."""
+    summary = {"games": len(results)}
+    for key in ("score", "level", "duration"):
+        values = [result[key] for result in results]
+        summary[key] = {
+            "mean": statistics.fmean(values),
+            "median": statistics.median(values),
+            "min": min(values),
+            "max": max(values),
+        }
+    return summary
+
+
+def run_batch(games, overrides=None, policy="tracker", max_seconds=600.0, processes=None, first_seed=0):
+    """
+    Play `games` games with consecutive seeds over a process pool and return the aggregated statistics.
+    :param games: Number of games to play.
+    :param overrides: Dictionary of `Settings` attribute name to value, applied to every game.
+    :param policy: Name of the policy in `simulation.POLICIES`.
+    :param max_seconds: Simulated time after which a game is stopped even if not over.
+    :param processes: Number of worker processes, default to the number of CPUs.
+    :param first_seed: Seed of the first game.
+    """
+    jobs = [(overrides or {}, seed, policy, max_seconds) for seed in range(first_seed, first_seed + games)]
+    with Pool(processes) as pool:
+        results = pool.map(run_game, jobs, chunksize=max(1, games // (4 * (processes or os.cpu_count() or 1))))
+    return summarize(results)
+
+
+def _parse_assignment(text):
+    """Helper to parse `NAME=VALUE` into a (name, value) pair, evaluating VALUE as a Python literal if possible."""
+    name, _, value = text.partition("=")
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
+
+def main(argv=None):
+    """Parse the command line, run the batches and print one line of statistics per swept value."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=100, help="number of games per swept value")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="tracker", help="input policy of the player")
+    parser.add_argument("--max-seconds", type=float, default=600.0, help="simulated time limit of a game")
+    parser.add_argument("--processes", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="override a setting")
+    parser.add_argument("--sweep", metavar="NAME=V1,V2,...", help="run one batch per value of a setting")
+    args = parser.parse_args(argv)
+
+    overrides = dict(_parse_assignment(text) for text in args.set)
+    sweep_name, sweep_values = None, [None]
+    if args.sweep:
+        sweep_name, text = args.sweep.split("=", 1)
+        sweep_values = [_parse_assignment(f"{sweep_name}={value}")[1] for value in text.split(",")]
+
+    for value in sweep_values:
+        if sweep_name is not None:
+            overrides[sweep_name] = value
+        start = perf_counter()
+        summary = run_batch(args.games, overrides, args.policy, args.max_seconds, args.processes)
+        elapsed = perf_counter() - start
+        label = f"{sweep_name}={value}" if sweep_name is not None else "defaults"
+        print(f"{label}: {summary['games']} games in {elapsed:.1f}s ({summary['games'] / elapsed * 60:.0f}/min) | "
+              f"score mean {summary['score']['mean']:.0f} median {summary['score']['median']:.0f} | "
+              f"level mean {summary['level']['mean']:.2f} max {summary['level']['max']} | "
+              f"duration mean {summary['duration']['mean']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
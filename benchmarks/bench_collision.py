@@ -0,0 +1,78 @@
+"""
+Benchmark bullet-alien collision detection while sweeping bullet and alien counts.
+It compares `pygame.sprite.groupcollide` over alien rects with the brute-force and the spatial hash queries of `Fleet`,
+and checks that both `Fleet` modes find the same hits. Run with `python benchmarks/bench_collision.py`.
+"""
+
+import os
+import random
+import sys
+from time import perf_counter_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from fleet import Fleet  # noqa: E402
+from settings import Settings  # noqa: E402
+
+
+class _Game:
+    """Minimal stand-in of `AlienInvasion` exposing what `Fleet` needs."""
+
+    def __init__(self):
+        self.settings = Settings()
+        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+        self.aliens = pygame.sprite.Group()
+
+
+def _bullets(count, rng, settings):
+    """Return a group of `count` bullets scattered over the screen."""
+    bullets = pygame.sprite.Group()
+    for _ in range(count):
+        bullet = pygame.sprite.Sprite()
+        bullet.rect = pygame.Rect(rng.randrange(settings.screen_width), rng.randrange(settings.screen_height),
+                                  settings.bullet_width, settings.bullet_height)
+        bullets.add(bullet)
+    return bullets
+
+
+def _time(function, repeat):
+    """Return the mean time of `function()` in microseconds."""
+    start = perf_counter_ns()
+    for _ in range(repeat):
+        function()
+    return (perf_counter_ns() - start) / repeat / 1e3
+
+
+def main(repeat=50):
+    """Sweep bullet and alien counts and print a table."""
+    game = _Game()
+    fleet = Fleet(game)
+    rng = random.Random(0)
+    print(f"{'aliens':>7} {'bullets':>8} {'groupcollide':>14} {'brute':>12} {'grid':>12}")
+    for num_aliens in (50, 500, 2000):
+        positions = np.column_stack(([rng.uniform(0, 1140) for _ in range(num_aliens)],
+                                     [rng.uniform(0, 740) for _ in range(num_aliens)]))
+        fleet.spawn(positions)
+        for num_bullets in (3, 30, 300):
+            bullets = _bullets(num_bullets, rng, game.settings)
+
+            def query():
+                return [fleet.collide_rect(bullet.rect) for bullet in bullets]
+
+            game.settings.collision_grid = False
+            brute_us, brute_hits = _time(query, repeat), query()
+            game.settings.collision_grid = True
+            grid_us, grid_hits = _time(query, repeat), query()
+            assert brute_hits == grid_hits, "Spatial hash and brute force disagree"
+            group_us = _time(lambda: pygame.sprite.groupcollide(bullets, game.aliens, False, False), repeat)
+            print(f"{num_aliens:>7} {num_bullets:>8} {group_us:>11.1f} us {brute_us:>9.1f} us {grid_us:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
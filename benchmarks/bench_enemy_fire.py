@@ -0,0 +1,118 @@
+"""
+Benchmark a frame of alien shots (move, cull, ship collision, rect sync) with hundreds of shots in flight.
+It compares one sprite per shot in a group, as the player bullets are handled, with the array-backed
+`EnemyProjectiles`, and reports the share of a 60 FPS frame budget each one takes.
+Run with `python benchmarks/bench_enemy_fire.py`; it uses the SDL dummy video driver.
+"""
+
+import math
+import os
+import random
+import sys
+from time import perf_counter_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from enemy_fire import EnemyProjectiles  # noqa: E402
+from settings import Settings  # noqa: E402
+
+FRAME_BUDGET_NS = 1e9 / 60
+
+
+class _Fleet:
+    """Minimal stand-in of `Fleet`, no alien fires during the benchmark."""
+
+    alive = ()
+
+
+class _Game:
+    """Minimal stand-in of `AlienInvasion` exposing what `EnemyProjectiles` needs."""
+
+    def __init__(self, limit):
+        self.settings = Settings()
+        self.settings.enemy_bullet_limit = limit
+        self.settings.alien_fire_rate = 0.0
+        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+        self.rng = random.Random(0)
+        self.fleet = _Fleet()
+        self.ship_rect = pygame.Rect(0, 0, 60, 48)
+        self.ship_rect.midbottom = self.screen.get_rect().midbottom
+
+
+class _Shot(pygame.sprite.Sprite):
+    """A shot as a sprite, with its exact position and velocity."""
+
+    def __init__(self, image, x, y, vx, vy):
+        super().__init__()
+        self.image = image
+        self.rect = image.get_rect(topleft=(x, y))
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+
+    def update(self, dt):
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.rect.topleft = (self.x, self.y)
+
+
+def _volley(count, rng):
+    """Return `count` shots spread over the upper screen, fanning down."""
+    shots = []
+    for _ in range(count):
+        angle = math.radians(rng.uniform(-60, 60))
+        shots.append((rng.uniform(0, 1190), rng.uniform(0, 600), 250 * math.sin(angle), 250 * math.cos(angle)))
+    return shots
+
+
+def bench_sprites(game, shots, frames, dt):
+    """Time a group of shot sprites: update, cull with a group copy, then collide with the ship."""
+    image = pygame.Surface((game.settings.enemy_bullet_width, game.settings.enemy_bullet_height))
+    screen_rect = game.screen.get_rect()
+    group = pygame.sprite.Group(_Shot(image, *shot) for shot in shots)
+    ship = pygame.sprite.Sprite()
+    ship.rect = game.ship_rect
+    start = perf_counter_ns()
+    for _ in range(frames):
+        group.update(dt)
+        for shot in group.copy():
+            if not screen_rect.colliderect(shot.rect):
+                group.remove(shot)
+        pygame.sprite.spritecollide(ship, group, True)
+        [(shot.image, shot.rect) for shot in group.sprites()]
+    return (perf_counter_ns() - start) / frames
+
+
+def bench_arrays(game, shots, frames, dt):
+    """Time `EnemyProjectiles`: vectorized update and cull, bounding box collision, rect sync."""
+    projectiles = EnemyProjectiles(game)
+    for shot in shots:
+        projectiles._spawn(*shot)
+    start = perf_counter_ns()
+    for _ in range(frames):
+        projectiles.update(dt)
+        projectiles.collide_rect(game.ship_rect)
+        projectiles.sync_rects(0.5)
+        projectiles.scene()
+    return (perf_counter_ns() - start) / frames
+
+
+def main(frames=60):
+    """Run both benchmarks for a sweep of shot counts and print a table."""
+    rng = random.Random(0)
+    dt = 1 / 60
+    print(f"{'shots':>8} {'sprites':>14} {'budget':>7} {'arrays':>14} {'budget':>7}")
+    for count in (100, 300, 1000, 3000):
+        game = _Game(count)
+        shots = _volley(count, rng)
+        sprite_ns = bench_sprites(game, shots, frames, dt)
+        array_ns = bench_arrays(game, shots, frames, dt)
+        print(f"{count:>8} {sprite_ns / 1e3:>11.1f} us {sprite_ns / FRAME_BUDGET_NS:>7.1%} "
+              f"{array_ns / 1e3:>11.1f} us {array_ns / FRAME_BUDGET_NS:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
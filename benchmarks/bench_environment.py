@@ -0,0 +1,58 @@
+"""
+Benchmark the throughput of the training environments in environment steps per second.
+It steps a single `AlienInvasionEnv` in this process, then a `VectorEnv` of growing size over the available CPUs,
+for both feature vector and downsampled frame observations, with random actions. Run with
+`python benchmarks/bench_environment.py [STEPS]`; no window is opened.
+"""
+
+import os
+import sys
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np  # noqa: E402
+
+from environment import AlienInvasionEnv, VectorEnv  # noqa: E402
+
+
+def bench_single(observation, steps):
+    """Return the steps per second of a single environment."""
+    env = AlienInvasionEnv(observation=observation)
+    env.reset()
+    actions = np.random.default_rng(0).integers(env.action_count, size=steps).tolist()
+    start = perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+    return steps / (perf_counter() - start)
+
+
+def bench_vector(observation, count, steps):
+    """Return the total steps per second of `count` environments stepped together in worker processes."""
+    with VectorEnv(count, observation=observation) as envs:
+        envs.reset()
+        actions = np.random.default_rng(0).integers(envs.action_count, size=(steps // count, count))
+        start = perf_counter()
+        for batch in actions:
+            envs.step(batch)
+        return len(actions) * count / (perf_counter() - start)
+
+
+def main(steps=2000):
+    """Run the benchmarks for both observations and print a table."""
+    counts = (1, 2, 4, 8)
+    print(f"{os.cpu_count()} CPUs, {steps} steps of {AlienInvasionEnv().frame_skip} simulation steps each")
+    print(f"{'observation':>11} {'single':>9} " + " ".join(f"{f'vector x{count}':>11}" for count in counts))
+    for observation in ("features", "frame"):
+        single = bench_single(observation, steps)
+        vector = [bench_vector(observation, count, steps) for count in counts]
+        print(f"{observation:>11} {single:>9.0f} " + " ".join(f"{rate:>11.0f}" for rate in vector))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
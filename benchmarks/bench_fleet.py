@@ -0,0 +1,132 @@
+"""
+Benchmark `_update_aliens` (edge check, move, ship collision, bottom check) for growing fleet sizes.
+It compares the game's original update, a group of `Sprite` aliens each moved by its own `update`, with the current
+one on the vectorized `Fleet`. Run with `python benchmarks/bench_fleet.py [STEPS]`; no window is opened.
+`Fleet` pays a fixed cost of a few NumPy calls per step, so it only pays off for large fleets: it is no faster than the
+sprite group at the 36 aliens of the default settings, and several times faster from a few hundred aliens.
+"""
+
+import os
+import sys
+from time import perf_counter_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+from pygame.sprite import Sprite  # noqa: E402
+
+from alien_invasion import AlienInvasion  # noqa: E402
+from assets import assets  # noqa: E402
+from settings import Settings  # noqa: E402
+
+
+class _LegacyAlien(Sprite):
+    """Alien sprite moving itself, as the game had it before `Fleet`."""
+
+    def __init__(self, settings, screen, x, y):
+        """Place the alien at (x, y)."""
+        super().__init__()
+        self.settings = settings
+        self.screen = screen
+        self.image = assets.load_image("images/alien.bmp")
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.x, self.y = float(x), float(y)
+        self.prev_x, self.prev_y = self.x, self.y
+
+    def update(self, dt, *args):
+        """Move the alien left or right based on the fleet direction."""
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.settings.alien_speed * self.settings.fleet_direction * dt
+        self.rect.x = self.x
+
+    def drop(self, distance):
+        """Move the alien down by `distance` pixels."""
+        self.y += distance
+        self.rect.y = self.y
+
+    def hit_edges(self):
+        """Return True if alien hits the edge of the screen."""
+        screen_rect = self.screen.get_rect()
+        if self.rect.right >= screen_rect.right or self.rect.left <= screen_rect.left:
+            return True
+        else:
+            return False
+
+
+class _LegacyGame:
+    """The original `_update_aliens` of `AlienInvasion` and its helpers, over a group of `_LegacyAlien`."""
+
+    def __init__(self, game, positions):
+        """Build the sprite fleet at `positions`, sharing the screen and ship of `game`."""
+        self.settings = Settings()  # Own fleet direction, independent of the vectorized game
+        self.screen = game.screen
+        self.ship = game.ship
+        self.aliens = pygame.sprite.Group(_LegacyAlien(self.settings, self.screen, x, y) for x, y in positions)
+
+    def _update_aliens(self, dt):
+        """Update the position of all aliens in the fleet."""
+        self._check_fleet_hit_edges()
+        self.aliens.update(dt)
+        if pygame.sprite.spritecollideany(self.ship, self.aliens):
+            raise AssertionError("the benchmark fleet never reaches the ship")
+        self._check_aliens_hit_bottom()
+
+    def _check_fleet_hit_edges(self):
+        """Check if any aliens have hit an edge."""
+        for alien in self.aliens.sprites():
+            if alien.hit_edges():
+                self._change_fleet_direction()
+                break
+
+    def _change_fleet_direction(self):
+        """Change the fleet's direction and drop the entire fleet."""
+        for alien in self.aliens.sprites():
+            alien.drop(self.settings.fleet_drop_speed)
+        self.settings.fleet_direction *= -1
+
+    def _check_aliens_hit_bottom(self):
+        """Check that no alien reached the bottom edge of the screen."""
+        screen_rect = self.screen.get_rect()
+        for alien in self.aliens.sprites():
+            if alien.rect.bottom >= screen_rect.bottom:
+                raise AssertionError("the benchmark fleet never reaches the bottom")
+
+
+def _positions(count, width, height, screen_width):
+    """Return `count` positions tiled over the top of the screen, one alien away from the edges."""
+    per_row = max(1, (screen_width - 3 * width) // width)
+    index = np.arange(count)
+    return np.column_stack((width + (index % per_row) * width, height + (index // per_row) * height % 300))
+
+
+def bench(update, steps, dt):
+    """Return the mean time in ns of `update(dt)` over `steps` simulation steps."""
+    start = perf_counter_ns()
+    for _ in range(steps):
+        update(dt)
+    return (perf_counter_ns() - start) / steps
+
+
+def main(steps=200):
+    """Run both updates for a sweep of fleet sizes and print a table."""
+    settings = Settings()
+    settings.persist_scores = False
+    game = AlienInvasion(settings, headless=True)
+    dt = 1 / settings.tick_rate
+    print(f"{'aliens':>8} {'sprite group':>15} {'Fleet':>12}")
+    for count in (10, 36, 100, 200, 500, 2000, 5000):  # 36 is the fleet of the default settings
+        positions = _positions(count, game.fleet.alien_width, game.fleet.alien_height, settings.screen_width)
+        legacy = _LegacyGame(game, positions.tolist())
+        settings.fleet_direction = 1
+        game.fleet.spawn(positions)
+        legacy_ns = bench(legacy._update_aliens, steps, dt)
+        fleet_ns = bench(game._update_aliens, steps, dt)
+        print(f"{count:>8} {legacy_ns / 1e3:>12.1f} us {fleet_ns / 1e3:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,95 @@
+"""
+Benchmark the collision tests of a frame (bullets, then the ship, against the fleet) at full fleet size.
+It compares `Fleet` in "rect" and "mask" collision modes with `pygame.sprite.collide_mask` on sprites without cached
+masks, which builds both masks on every test. Run with `python benchmarks/bench_mask_collision.py`.
+"""
+
+import os
+import random
+import sys
+from time import perf_counter_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+import pygame  # noqa: E402
+
+from assets import assets  # noqa: E402
+from fleet import Fleet  # noqa: E402
+from settings import Settings  # noqa: E402
+
+
+class _Game:
+    """Minimal stand-in of `AlienInvasion` exposing what `Fleet` needs."""
+
+    def __init__(self):
+        self.settings = Settings()
+        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+        self.aliens = pygame.sprite.Group()
+
+
+def _sprite(image, rect):
+    """Return a bare sprite drawing `image` at `rect`."""
+    sprite = pygame.sprite.Sprite()
+    sprite.image, sprite.rect = image, rect
+    return sprite
+
+
+def _time(function, repeat):
+    """Return the mean time of `function()` in microseconds."""
+    start = perf_counter_ns()
+    for _ in range(repeat):
+        function()
+    return (perf_counter_ns() - start) / repeat / 1e3
+
+
+def main(repeat=200):
+    """Time a frame of collision tests for the game fleet and for denser fleets, and print a table."""
+    game = _Game()
+    settings = game.settings
+    fleet = Fleet(game)
+    rng = random.Random(0)
+    ship_image = assets.load_image("images/ship.bmp")
+    ship_rect = ship_image.get_rect(midbottom=game.screen.get_rect().midbottom)
+    ship_mask = assets.mask("images/ship.bmp")
+    bullet_image = assets.solid((settings.bullet_width, settings.bullet_height), settings.bullet_color)
+
+    print(f"{'aliens':>7} {'bullets':>8} {'rect':>11} {'mask':>11} {'collide_mask':>14} "
+          f"{'rect hits':>10} {'mask hits':>10}")
+    for num_aliens in (36, 500, 2000):  # 36 aliens is the fleet of the first level
+        positions = np.column_stack(([rng.uniform(0, 1140) for _ in range(num_aliens)],
+                                     [rng.uniform(0, 752 - ship_rect.height) for _ in range(num_aliens)]))
+        positions[:8] = np.column_stack((np.linspace(ship_rect.left - 50, ship_rect.right, 8),
+                                         np.full(8, ship_rect.top - 50)))  # Aliens grazing the ship
+        fleet.spawn(positions)
+        for num_bullets in (3, 30):
+            bullets = [pygame.Rect(rng.randrange(1200), rng.randrange(800), settings.bullet_width,
+                                   settings.bullet_height) for _ in range(num_bullets)]
+
+            def frame():
+                hits = sum(len(fleet.collide_rect(bullet)) for bullet in bullets)
+                return hits + len(fleet.collide_rect(ship_rect, ship_mask))
+
+            settings.collision_mode = "rect"
+            rect_us, rect_hits = _time(frame, repeat), frame()
+            settings.collision_mode = "mask"
+            mask_us, mask_hits = _time(frame, repeat), frame()
+
+            # Sprites without a `mask` attribute, so `collide_mask` builds the masks of both sprites on every test
+            aliens = [_sprite(sprite.image, sprite.rect) for sprite in fleet.sprites]
+            shots = [_sprite(bullet_image, bullet) for bullet in bullets] + [_sprite(ship_image, ship_rect)]
+
+            def naive_frame():
+                return sum(len(pygame.sprite.spritecollide(shot, aliens, False, pygame.sprite.collide_mask))
+                           for shot in shots)
+
+            naive_us = _time(naive_frame, max(1, repeat // 50))  # Orders of magnitude slower
+            print(f"{num_aliens:>7} {num_bullets:>8} {rect_us:>8.1f} us {mask_us:>8.1f} us {naive_us:>11.1f} us "
+                  f"{rect_hits:>10} {mask_hits:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark a frame of explosion particles (update, scene, drawing) with hundreds to thousands of particles alive.
+It compares one sprite per particle in a group, updated and drawn one at a time, with the array-backed
+`ParticleSystem` updated in one vectorized step and drawn with a single `blits`, and reports the share of a 60 FPS
+frame budget each one takes. Run with `python benchmarks/bench_particles.py`; it uses the SDL dummy video driver.
+"""
+
+import math
+import os
+import random
+import sys
+from time import perf_counter_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from particles import ParticleSystem  # noqa: E402
+from settings import Settings  # noqa: E402
+
+FRAME_BUDGET_NS = 1e9 / 60
+
+
+class _Game:
+    """Minimal stand-in of `AlienInvasion` exposing what `ParticleSystem` needs."""
+
+    def __init__(self, limit):
+        self.settings = Settings()
+        self.settings.seed = 0
+        self.settings.particle_limit = limit
+        self.settings.particle_life = 1e6  # Keep every particle alive for the whole benchmark
+        self.settings.particle_drag = 0.0  # Keep them moving so every frame does the same work
+        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+
+
+class _Particle(pygame.sprite.Sprite):
+    """A particle as a sprite, with its exact position, velocity and age."""
+
+    def __init__(self, image, x, y, vx, vy):
+        super().__init__()
+        self.image = image
+        self.rect = image.get_rect(center=(x, y))
+        self.x, self.y, self.vx, self.vy, self.age = x, y, vx, vy, 0.0
+
+    def update(self, dt):
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.age += dt
+        self.rect.center = (self.x, self.y)
+
+
+def _centers(count, rng):
+    """Return the centers of `count` explosions spread over the screen."""
+    return [(rng.uniform(100, 1100), rng.uniform(100, 700)) for _ in range(count)]
+
+
+def bench_sprites(game, centers, per_burst, frames, dt):
+    """Time a group of particle sprites: update each one, then draw them one blit at a time."""
+    settings, rng = game.settings, random.Random(0)
+    image = pygame.Surface((settings.particle_size, settings.particle_size))
+    group = pygame.sprite.Group()
+    for x, y in centers:
+        for _ in range(per_burst):
+            angle, speed = rng.uniform(0, 2 * math.pi), rng.uniform(0.2, 1.0) * settings.particle_speed
+            group.add(_Particle(image, x, y, math.cos(angle) * speed, math.sin(angle) * speed))
+    start = perf_counter_ns()
+    for _ in range(frames):
+        group.update(dt)
+        game.screen.fill(settings.bg_color)
+        group.draw(game.screen)
+    return (perf_counter_ns() - start) / frames
+
+
+def bench_arrays(game, centers, per_burst, frames, dt):
+    """Time `ParticleSystem`: vectorized update, scene of shaded squares, then a single batched `blits`."""
+    particles = ParticleSystem(game)
+    particles.burst(centers, "alien", per_burst)
+    start = perf_counter_ns()
+    for _ in range(frames):
+        particles.update(dt)
+        game.screen.fill(game.settings.bg_color)
+        game.screen.blits(particles.scene(), doreturn=False)
+    return (perf_counter_ns() - start) / frames
+
+
+def main(frames=60, per_burst=24):
+    """Run both benchmarks for a sweep of particle counts and print a table."""
+    rng = random.Random(0)
+    dt = 1 / 60
+    print(f"{'particles':>9} {'sprites':>14} {'budget':>7} {'arrays':>14} {'budget':>7}")
+    for count in (240, 960, 2400, 9600):
+        game = _Game(count)
+        centers = _centers(count // per_burst, rng)
+        sprite_ns = bench_sprites(game, centers, per_burst, frames, dt)
+        array_ns = bench_arrays(game, centers, per_burst, frames, dt)
+        print(f"{count:>9} {sprite_ns / 1e3:>11.1f} us {sprite_ns / FRAME_BUDGET_NS:>7.1%} "
+              f"{array_ns / 1e3:>11.1f} us {array_ns / FRAME_BUDGET_NS:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
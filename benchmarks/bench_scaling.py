@@ -0,0 +1,73 @@
+"""
+Benchmark drawing a game frame on displays of growing size.
+It compares drawing at the logical resolution then scaling the whole frame to the display every frame, with the
+`Viewport` drawing pre-scaled sprites straight on the display. Both redraw the whole frame on an off-screen surface of
+the display size. Run with `python benchmarks/bench_scaling.py`; it uses the SDL dummy video driver.
+"""
+
+import os
+import sys
+from time import perf_counter_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from alien_invasion import AlienInvasion  # noqa: E402
+from settings import Settings  # noqa: E402
+from viewport import Viewport  # noqa: E402
+
+FRAME_BUDGET_NS = 1e9 / 60
+
+
+def _scene():
+    """Return the logical surface and the scene of a game in progress, with bullets in flight."""
+    settings = Settings()
+    settings.persist_scores = False
+    game = AlienInvasion(settings, headless=True)
+    game._start_game()
+    for step in range(120):
+        game.set_input_state(2 | (4 if step % 20 == 0 else 0))
+        game._tick(1 / settings.tick_rate)
+    game.fleet.sync_rects()
+    return game.screen, game.settings.bg_color, game._scene()
+
+
+def bench_frame_scaling(screen, bg_color, scene, output, frames):
+    """Time drawing at the logical resolution, then scaling the frame to the display."""
+    start = perf_counter_ns()
+    for _ in range(frames):
+        screen.fill(bg_color)
+        screen.blits(scene, doreturn=False)
+        pygame.transform.smoothscale(screen, output.get_size(), output)
+    return (perf_counter_ns() - start) / frames
+
+
+def bench_viewport(screen, bg_color, scene, output, frames):
+    """Time drawing the scene mapped by the viewport, pre-scaling sprites on the first frame only."""
+    viewport = Viewport(screen.get_size(), output.get_size())
+    viewport.map(scene)  # Warm-up, as the first frame of the game does
+    start = perf_counter_ns()
+    for _ in range(frames):
+        output.fill(bg_color)
+        output.blits(viewport.map(scene), doreturn=False)
+    return (perf_counter_ns() - start) / frames
+
+
+def main(frames=60):
+    """Run both benchmarks for common display sizes and print a table."""
+    screen, bg_color, scene = _scene()
+    print(f"{'display':>10} {'frame scaling':>15} {'budget':>7} {'viewport':>13} {'budget':>7}")
+    for size in ((1200, 800), (1920, 1080), (2560, 1440), (3840, 2160)):
+        output = pygame.Surface(size, 0, screen)
+        scaling_ns = bench_frame_scaling(screen, bg_color, scene, output, frames)
+        viewport_ns = bench_viewport(screen, bg_color, scene, output, frames)
+        print(f"{size[0]:>5}x{size[1]:<4} {scaling_ns / 1e6:>12.2f} ms {scaling_ns / FRAME_BUDGET_NS:>7.1%} "
+              f"{viewport_ns / 1e6:>10.2f} ms {viewport_ns / FRAME_BUDGET_NS:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
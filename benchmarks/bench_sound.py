@@ -0,0 +1,69 @@
+"""
+Benchmark the cost of triggering a sound effect from the frame loop.
+It compares the old path (`mixer_music.load` + `play` of the MP3 per event) with `SoundEffects.play` on preloaded
+buffers. Run from anywhere with `python benchmarks/bench_sound.py`; set `SDL_AUDIODRIVER=dummy` without a sound card.
+"""
+
+import os
+import sys
+from time import perf_counter_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+
+import pygame  # noqa: E402
+
+from settings import Settings  # noqa: E402
+from sound import SoundEffects  # noqa: E402
+
+
+class _Game:
+    """Minimal stand-in of `AlienInvasion` exposing the settings only."""
+
+    def __init__(self):
+        self.settings = Settings()
+        self.settings.sound_min_interval = 0  # Measure every call, not the rate limiter
+
+
+def _report(name, samples):
+    """Print the mean, median and worst time of `samples` in microseconds."""
+    samples = sorted(samples)
+    mean = sum(samples) / len(samples)
+    print(f"{name:>24}: mean {mean / 1e3:8.1f} us  p50 {samples[len(samples) // 2] / 1e3:8.1f} us  "
+          f"max {samples[-1] / 1e3:8.1f} us")
+
+
+def bench_mixer_music(repeat):
+    """Time the legacy per-event load and play of the music channel."""
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        pygame.mixer_music.load("sounds/shoot.mp3")
+        pygame.mixer_music.play()
+        samples.append(perf_counter_ns() - start)
+    pygame.mixer_music.stop()
+    return samples
+
+
+def bench_sound_effects(repeat):
+    """Time a play request on the preloaded channel pool."""
+    sounds = SoundEffects(_Game())
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        sounds.play("shoot")
+        samples.append(perf_counter_ns() - start)
+    pygame.mixer.stop()
+    return samples
+
+
+def main(repeat=200):
+    """Run both benchmarks and print a summary."""
+    pygame.mixer.init()
+    _report("mixer_music.load + play", bench_mixer_music(repeat))
+    _report("SoundEffects.play", bench_sound_effects(repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark the cold start of the game: module imports, `AlienInvasion` initialization, time to the first frame on screen
+and the work deferred after it. Every run is a fresh interpreter so nothing is cached between runs, and the lazy
+startup is compared with an eager one initializing every pygame module, scanning the system fonts and decoding the
+sounds before the first frame, as the game used to. Run with `python benchmarks/bench_startup.py [RUNS]`; it uses the
+SDL dummy video and audio drivers.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STAGES = ("import", "init", "first_frame", "to_first_frame", "deferred")
+
+
+def child(mode):
+    """Start the game in this fresh interpreter and print the time of each stage as JSON."""
+    start = perf_counter()
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)  # Asset paths are relative to the repository root
+    import pygame
+    from alien_invasion import AlienInvasion
+    from settings import Settings
+    imported = perf_counter()
+
+    settings = Settings()
+    settings.persist_scores = False  # Don't start the background writer nor touch the real high score
+    if mode == "eager":
+        pygame.init()
+        pygame.font.SysFont(None, 48)
+    game = AlienInvasion(settings)
+    if mode == "eager":
+        game._finish_startup()
+    initialized = perf_counter()
+
+    game._update_screen()
+    first_frame = perf_counter()
+    if mode == "lazy":
+        game._finish_startup()
+    done = perf_counter()
+    times = (imported - start, initialized - imported, first_frame - initialized, first_frame - start,
+             done - first_frame)
+    print(json.dumps(dict(zip(STAGES, times))))
+
+
+def run(mode):
+    """Return the stage times of a single cold start in a new interpreter."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(runs=10):
+    """Time `runs` cold starts of each mode and print the median of every stage."""
+    modes = ("eager", "lazy")
+    results = {mode: [] for mode in modes}
+    for _ in range(runs):
+        for mode in modes:  # Interleaved so that both modes see the same disk cache and machine load
+            results[mode].append(run(mode))
+    print(f"{'mode':>6} " + " ".join(f"{stage:>15}" for stage in STAGES))
+    for mode in modes:
+        medians = [statistics.median(result[stage] for result in results[mode]) * 1e3 for stage in STAGES]
+        print(f"{mode:>6} " + " ".join(f"{median:>12.1f} ms" for median in medians))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,324 @@
+"""
+Performance regression suite: drive the game through scripted scenarios and compare them with stored baselines.
+Each scenario starts a seeded `AlienInvasion` on the SDL dummy video driver, so frames are really drawn without a
+window, and plays a fixed number of 60 FPS frames of two simulation steps, scripted like the policies of `simulation`.
+It measures the time of each call to `_update_bullets`, `_update_aliens`, `_update_screen` and `_create_fleet`, the
+whole frame time, the memory blocks each frame leaves allocated and the traced memory high-water mark. A method the
+scenario calls too rarely for a stable median, such as `_create_fleet`, is called again in a micro-run after the last
+frame until it has enough samples. Timings are the best of `--repeat` runs to filter out machine noise, and each one is
+compared with its own baseline and tolerance. Memory is measured in separate runs: retained blocks with the garbage
+collector disabled, so that its passes don't free objects of earlier frames in the middle of the count (it counts the
+blocks the frames keep, not every allocation they make), and the peak under `tracemalloc`, whose overhead would skew
+the timings. Every scenario runs in a fresh interpreter, so none of them
+depends on the caches and garbage left by the scenarios before it. Timings also vary from one interpreter to the next,
+so baselines are the best of `--retries` + 1 interpreters, and a regressed scenario is re-run as many times before
+failing.
+
+    python benchmarks/regression.py            # Compare with benchmarks/baselines.json, exit 1 on regressions
+    python benchmarks/regression.py --update   # Store the current results as the new baselines
+
+Baselines depend on the machine, regenerate them with `--update` before comparing on another one.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import inputs  # noqa: E402
+from alien_invasion import AlienInvasion  # noqa: E402
+from settings import Settings  # noqa: E402
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baselines.json")
+TIMED_METHODS = ("_update_bullets", "_update_aliens", "_update_screen", "_create_fleet")
+STEPS_PER_FRAME = 2  # Simulation steps per frame at the default tick rate and a 60 FPS frame rate
+
+# Tolerances: a metric regresses when it grows by more than the relative threshold AND the absolute slack, so that
+# tiny values jittering by a few microseconds or blocks don't fail the suite. Timings have a tolerance each, as
+# (max relative slowdown, slack in us): whole frames average many calls and are the steadiest, single methods vary
+# more from one interpreter to the next.
+TIME_TOLERANCES = {
+    "frame_median_us": (0.5, 100.0),
+    "frame_p95_us": (0.5, 200.0),
+    "_update_bullets_median_us": (1.0, 10.0),
+    "_update_aliens_median_us": (1.0, 20.0),
+    "_update_screen_median_us": (0.5, 100.0),
+    "_create_fleet_median_us": (1.0, 50.0),
+}
+MEMORY_SLACK_KIB = 64.0
+BLOCKS_SLACK = 2.0
+MIN_TIMED_CALLS = 50  # Calls of each method timed per scenario, completed by a micro-run for rarely called methods
+
+
+def idle_menu(game, frame):
+    """Stay on the Play button: only the menu is drawn."""
+    return 0
+
+
+def fleet_sweep(game, frame):
+    """Start a game and watch the full fleet sweep from edge to edge, with the aliens holding their fire."""
+    game.settings.alien_fire_rate = 0.0
+    return inputs.START if frame == 0 else 0
+
+
+def max_bullets(game, frame):
+    """Keep the most bullets in flight, tapping fire every other frame while moving back and forth."""
+    if frame == 0:
+        return inputs.START
+    direction = inputs.MOVE_RIGHT if frame // 120 % 2 else inputs.MOVE_LEFT
+    return direction | (inputs.FIRE if frame % 2 else 0)
+
+
+def mass_collisions(game, frame):
+    """Fire bullets wide enough to destroy several aliens at once, clearing fleet after fleet."""
+    return max_bullets(game, frame)
+
+
+def level_transitions(game, frame):
+    """Wipe the fleet every few frames so levels start one after the other."""
+    if frame == 0:
+        return inputs.START
+    if frame % 10 == 0 and game.state.playing and len(game.fleet):
+        game.fleet.kill(game.fleet.alive.nonzero()[0].tolist())  # The next step starts the next level
+    return 0
+
+
+def game_over(game, frame):
+    """Lose every ship in turn, then start a new game once back on the Play button."""
+    if not game.stats.game_active:
+        return inputs.START if frame % 2 == 0 else 0
+    if frame % 20 == 0 and game.state.playing:
+        game._ship_hit()
+    return 0
+
+
+# Map of scenario name to (script returning the input state of each frame, settings overrides)
+SCENARIOS = {
+    "idle_menu": (idle_menu, {}),
+    "fleet_sweep": (fleet_sweep, {}),
+    "max_bullets": (max_bullets, {"bullet_allowed": 64}),
+    "mass_collisions": (mass_collisions, {"bullet_allowed": 64, "bullet_width": 120, "level_up_delay": 0.2}),
+    "level_transitions": (level_transitions, {"level_up_delay": 0.05}),
+    "game_over": (game_over, {"ship_limit": 1, "ship_lost_delay": 0.1, "game_over_delay": 0.1}),
+}
+
+
+def _timed(method, calls, arguments):
+    """
+    Helper to wrap a bound method so that the duration of each call in ns is appended to `calls`.
+    :param arguments: Dictionary the (args, kwargs) of the last call are stored in, under the name of the method.
+    """
+    def wrapper(*args, **kwargs):
+        arguments[method.__name__] = (args, kwargs)
+        start = perf_counter_ns()
+        result = method(*args, **kwargs)
+        calls.append(perf_counter_ns() - start)
+        return result
+    return wrapper
+
+
+def play(name, frames, count_blocks=False, micro_runs=False):
+    """
+    Play the scenario `name` for `frames` frames.
+    :param count_blocks: Count the memory blocks left allocated by the frames, with the garbage collector disabled.
+    :param micro_runs: Call each method the frames called fewer than `MIN_TIMED_CALLS` times again after the last
+        frame, with the arguments of its last call, until it was timed `MIN_TIMED_CALLS` times.
+    :return: Tuple of (list of frame times in ns, dictionary of method name to the list of its call times in ns,
+        dictionary of method name to its number of calls by the frames, number of memory blocks left allocated by the
+        frames, 0 unless `count_blocks`).
+    """
+    script, overrides = SCENARIOS[name]
+    settings = Settings()
+    settings.seed = 0
+    settings.persist_scores = False  # Never touch the real high score
+    for setting, value in overrides.items():
+        setattr(settings, setting, value)
+    game = AlienInvasion(settings)
+
+    calls = {method: [] for method in TIMED_METHODS}
+    arguments = {}
+    for method in TIMED_METHODS:  # Instance attributes shadow the methods, so the game calls the wrappers
+        setattr(game, method, _timed(getattr(game, method), calls[method], arguments))
+
+    dt = game.clock.dt
+    frame_times = []
+    if count_blocks:
+        gc.collect()
+        gc.disable()
+        allocated = sys.getallocatedblocks()
+    for frame in range(frames):
+        start = perf_counter_ns()
+        game.set_input_state(script(game, frame))
+        for _ in range(STEPS_PER_FRAME):
+            game._tick(dt)
+        game.particles.update(STEPS_PER_FRAME * dt)
+        game._update_screen()
+        frame_times.append(perf_counter_ns() - start)
+    blocks = 0
+    if count_blocks:
+        blocks = sys.getallocatedblocks() - allocated
+        gc.enable()
+
+    counts = {method: len(times) for method, times in calls.items()}
+    for method in TIMED_METHODS if micro_runs else ():
+        if 0 < counts[method] < MIN_TIMED_CALLS:
+            args, kwargs = arguments[method]
+            for _ in range(MIN_TIMED_CALLS - counts[method]):
+                getattr(game, method)(*args, **kwargs)
+    return frame_times, calls, counts, blocks
+
+
+def _percentile(values, fraction):
+    """Helper to return the value at `fraction` of the sorted `values`."""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def measure(name, frames, repeat):
+    """Return the dictionary of metrics of the scenario `name`, timings being the best of `repeat` runs."""
+    runs = []
+    for _ in range(repeat):
+        frame_times, calls, counts, _ = play(name, frames, micro_runs=True)
+        metrics = {
+            "frame_median_us": statistics.median(frame_times) / 1e3,
+            "frame_p95_us": _percentile(frame_times, 0.95) / 1e3,
+        }
+        for method, times in calls.items():
+            metrics[f"{method}_calls"] = counts[method]
+            metrics[f"{method}_median_us"] = statistics.median(times) / 1e3 if times else 0.0
+        runs.append(metrics)
+    best = {key: min(run[key] for run in runs) for key in runs[0]}
+    best["retained_blocks_per_frame"] = play(name, frames, count_blocks=True)[3] / frames
+
+    tracemalloc.start()
+    play(name, frames)
+    best["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    return best
+
+
+def child(name, frames, repeat):
+    """Measure the scenario `name` in this fresh interpreter and print its metrics as JSON."""
+    print(json.dumps(measure(name, frames, repeat)))
+
+
+def run(name, frames, repeat):
+    """Return the metrics of the scenario `name`, measured in a new interpreter."""
+    command = [sys.executable, os.path.abspath(__file__), "--child", name, str(frames), str(repeat)]
+    env = dict(os.environ, PYTHONHASHSEED="0")  # Same string hashes, so sets and dicts are laid out alike in every run
+    output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def regressions(result, baseline, threshold, memory_threshold):
+    """
+    Return the list of (metric, baseline value, current value) of `result` that regressed past `baseline`.
+    :param threshold: Max relative slowdown of every timing, None for the tolerance of each in `TIME_TOLERANCES`.
+    :param memory_threshold: Max relative growth of the memory metrics.
+    """
+    found = []
+    for key, value in result.items():
+        if key not in baseline or key.endswith("_calls"):
+            continue
+        if key in TIME_TOLERANCES:
+            relative, slack = TIME_TOLERANCES[key]
+            limit = max(baseline[key] * (1 + (relative if threshold is None else threshold)), baseline[key] + slack)
+        elif key == "peak_kib":
+            limit = max(baseline[key] * (1 + memory_threshold), baseline[key] + MEMORY_SLACK_KIB)
+        else:
+            limit = max(baseline[key] * (1 + memory_threshold), baseline[key] + BLOCKS_SLACK)
+        if value > limit:
+            found.append((key, baseline[key], value))
+    return found
+
+
+def _best(result, other):
+    """Helper to return the best value of each metric of two results of the same scenario."""
+    return {key: min(value, other[key]) for key, value in result.items()}
+
+
+def _machine():
+    """Helper to describe the machine the baselines were measured on."""
+    return f"{platform.machine()} {platform.system()} Python {platform.python_version()}"
+
+
+def main(argv=None):
+    """Run the scenarios, then store them as baselines or compare them with the stored ones."""
+    parser = argparse.ArgumentParser(description="Performance regression suite of Alien Invasion.")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help=f"scenarios to run, default to all: {', '.join(SCENARIOS)}")
+    parser.add_argument("--frames", type=int, default=600, help="frames played by each scenario")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each scenario, the best timings are kept")
+    parser.add_argument("--threshold", type=float,
+                        help="max relative slowdown of every timing, default to the tolerance of each timing")
+    parser.add_argument("--memory-threshold", type=float, default=0.10, help="max relative growth of memory")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="re-runs of a regressed scenario before failing, and of every scenario with --update")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="JSON file of the baselines")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baselines")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios {', '.join(unknown)}, expected some of {', '.join(SCENARIOS)}")
+
+    try:
+        with open(args.baseline, "r") as fp:
+            stored = json.load(fp)
+    except FileNotFoundError:
+        stored = {"scenarios": {}}
+    if not args.update and stored.get("machine") not in (None, _machine()):
+        print(f"Warning: baselines were measured on {stored['machine']}, this is {_machine()}", file=sys.stderr)
+    if not args.update and stored.get("frames") not in (None, args.frames):
+        print(f"Warning: baselines were measured over {stored['frames']} frames, not {args.frames}", file=sys.stderr)
+
+    failed = False
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        result = run(name, args.frames, args.repeat)
+        for _ in range(args.retries if args.update else 0):
+            result = _best(result, run(name, args.frames, args.repeat))  # As good as a comparison can get
+        baseline = stored["scenarios"].get(name)
+        found = [] if args.update or baseline is None else regressions(result, baseline, args.threshold,
+                                                                       args.memory_threshold)
+        for _ in range(args.retries if found else 0):
+            # A regression must show again: keep the best of every run, as `measure` does within a run
+            result = _best(result, run(name, args.frames, args.repeat))
+            found = regressions(result, baseline, args.threshold, args.memory_threshold)
+            if not found:
+                break
+        results[name] = result
+        status = "stored" if args.update else "no baseline" if baseline is None else "REGRESSED" if found else "ok"
+        print(f"{name:<18} frame {result['frame_median_us']:>8.1f} us (p95 {result['frame_p95_us']:>8.1f} us) "
+              f"peak {result['peak_kib']:>8.1f} KiB  {status}")
+        for key, before, after in found:
+            print(f"    {key}: {before:.1f} -> {after:.1f}")
+        failed = failed or bool(found)
+
+    if args.update:
+        stored["machine"] = _machine()
+        stored["frames"] = args.frames
+        stored["scenarios"].update(results)
+        with open(args.baseline, "w") as fp:
+            json.dump(stored, fp, indent=2, sort_keys=True)
+            fp.write("\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+    else:
+        sys.exit(main())
@@ -5,35 +5,54 @@ like collision detection for building games. It can facilitate to perform the sa
 """
 
 import pygame
-from pygame.sprite import Sprite
 
+from assets import assets
+from entity import Entity
 
-class Bullet(Sprite):
+
+class Bullet(Entity):
     """A class to manage bullet fired from the spaceship."""
 
+    # Bullets are recycled through a `SpritePool`, so keep their state in slots rather than in an instance dict
+    __slots__ = ("context", "y", "prev_y")
+
     def __init__(self, ai_game, *groups):
         """
         Create a bullet object at the ship's current position.
         :param ai_game: Reference to the current instance of `AlienInvasion` class.
         """
         super().__init__(*groups)
-        self.screen = ai_game.screen
-        self.settings = ai_game.settings
-        self.color = self.settings.bullet_color
+        self.context = ai_game.context  # Settings shared by the whole game
+        settings = ai_game.settings
 
         # Create a bullet rect at (0, 0) and then set correct position
-        self.rect = pygame.Rect(0, 0, self.settings.bullet_width, self.settings.bullet_height)
-        self.rect.midtop = ai_game.ship.rect.midtop  # Make bullet emerges from the top of ship
+        self.rect = pygame.Rect(0, 0, settings.bullet_width, settings.bullet_height)
+        self.image = assets.solid(self.rect.size, settings.bullet_color)  # Plain rectangle shared by all bullets
+        self.y = self.prev_y = 0.0  # Placeholder
+        self.reset(ai_game.ship.rect)
 
-        # Store the bullet's position as a decimal value
+    def reset(self, ship_rect):
+        """
+        Place the bullet at the top of the ship, e.g. when it is fired again from the pool.
+        :param ship_rect: Rect of the spaceship firing the bullet.
+        """
+        self.rect.midtop = ship_rect.midtop  # Make bullet emerges from the top of ship
+
+        # Store the bullet's position as a decimal value, and the one of the previous step for interpolated drawing
         self.y = float(self.rect.y)
+        self.prev_y = self.y
 
-    def update(self, *args):
-        """Move the bullet up the screen."""
+    def update(self, dt, *args):
+        """
+        Move the bullet up the screen.
+        :param dt: Seconds elapsed in this simulation step.
+        """
         # Update the decimal position of the bullet
-        self.y -= self.settings.bullet_speed  # Decrease y coordination to move the bullet up
+        self.prev_y = self.y
+        self.y -= self.context.settings.bullet_speed * dt  # Decrease y coordination to move the bullet up
         self.rect.y = self.y  # Update the rect position for further surface rendering
 
-    def draw_bullet(self):
-        """Draw the bullet to the screen."""
-        pygame.draw.rect(self.screen, self.color, self.rect)
+    def interpolate(self, alpha):
+        """Place the rect between the previous and current positions for drawing."""
+        # Written backwards from `y` so that alpha = 1 restores the exact simulated position
+        self.rect.y = self.y - (self.y - self.prev_y) * (1 - alpha)
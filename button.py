@@ -2,6 +2,8 @@
 
 import pygame
 
+from assets import assets
+
 
 class Button:
     """Press button for game."""
@@ -19,22 +21,23 @@ class Button:
         self.width, self.height = 200, 50
         self.button_color = (0, 255, 0)  # (R,G,B)
         self.text_color = (255, 255, 255)  # (R,G,B)
-        self.text_font = pygame.font.Font(None, 48)  # Use system default font and font size = 48
+        self.text_font = assets.font(None, 48)  # Use default font and font size = 48
 
         # Build the button's rect object and center it to the screen
         self.rect = pygame.Rect(0, 0, self.width, self.height)  # Initialize at (0, 0) with width x height
         self.rect.center = self.screen_rect.center
 
         # Prepare the surface of button text
+        self.image = None  # Placeholder
         self._prep_msg(msg)
 
     def _prep_msg(self, msg):
-        """Turn specified message into a rendered image and center text on the button."""
-        self.msg_image = self.text_font.render(msg, True, self.text_color, self.button_color)
-        self.msg_image_rect = self.msg_image.get_rect()
-        self.msg_image_rect.center = self.rect.center
-
-    def draw_button(self):
-        """Draw blank button and then draw message."""
-        self.screen.fill(self.button_color, self.rect)
-        self.screen.blit(self.msg_image, self.msg_image_rect)
+        """Turn specified message into a rendered image centered on a blank button."""
+        msg_image = self.text_font.render(msg, True, self.text_color, self.button_color)
+        msg_image_rect = msg_image.get_rect()
+        msg_image_rect.center = (self.width // 2, self.height // 2)
+
+        # Compose the whole button once so that drawing it is a single blit
+        self.image = pygame.Surface(self.rect.size)
+        self.image.fill(self.button_color)
+        self.image.blit(msg_image, msg_image_rect)
@@ -0,0 +1,78 @@
+"""
+Module maintains the spatial hash used as collision broadphase.
+Note: Objects are bucketed by the grid cell holding their top-left corner. As long as no object is larger than a cell,
+an object overlapping a rect must have its corner in the cells covering the rect extended by one cell to the left and
+to the top, so a query only inspects those few buckets instead of every object.
+"""
+
+
+class SpatialHash:
+    """Uniform grid mapping cells to the keys of the objects whose top-left corner lies in them."""
+
+    def __init__(self, cell_width, cell_height):
+        """
+        Initialize an empty grid.
+        :param cell_width: Width of a cell in pixels, at least the width of the largest object.
+        :param cell_height: Height of a cell in pixels, at least the height of the largest object.
+        """
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self._cells = {}  # Map of (cell x, cell y) to the set of keys in that cell
+        self._key_cells = {}  # Map of key to the cell it is stored in
+
+    def __len__(self):
+        """Return the number of objects in the grid."""
+        return len(self._key_cells)
+
+    def cell(self, x, y):
+        """Return the (cell x, cell y) index of the point (x, y)."""
+        return int(x // self.cell_width), int(y // self.cell_height)
+
+    def insert(self, key, x, y):
+        """
+        Add an object to the grid.
+        :param key: Hashable identifier of the object, e.g. its index in the fleet arrays.
+        :param x: Horizontal position of the object's left edge.
+        :param y: Vertical position of the object's top edge.
+        """
+        cell = self.cell(x, y)
+        self._key_cells[key] = cell
+        self._cells.setdefault(cell, set()).add(key)
+
+    def move(self, key, x, y):
+        """Move an object to the position (x, y), only touching the buckets if it changed cell."""
+        cell = self.cell(x, y)
+        old_cell = self._key_cells[key]
+        if cell != old_cell:
+            self._discard(key, old_cell)
+            self._key_cells[key] = cell
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        """Remove an object from the grid."""
+        self._discard(key, self._key_cells.pop(key))
+
+    def clear(self):
+        """Remove every object from the grid."""
+        self._cells.clear()
+        self._key_cells.clear()
+
+    def query(self, rect):
+        """Return the list of keys of the objects that may overlap `rect`, a superset of the exact answer."""
+        min_x, min_y = self.cell(rect.left - self.cell_width, rect.top - self.cell_height)
+        max_x, max_y = self.cell(rect.right, rect.bottom)
+        cells = self._cells
+        keys = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    keys.extend(bucket)
+        return keys
+
+    def _discard(self, key, cell):
+        """Helper to remove `key` from the bucket of `cell`, dropping the bucket once empty."""
+        bucket = self._cells[cell]
+        bucket.discard(key)
+        if not bucket:
+            del self._cells[cell]
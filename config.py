@@ -0,0 +1,196 @@
+"""
+Module maintains the runtime configuration of Alien Invasion.
+Note: Settings are layered, each layer overriding the previous one: the defaults of `Settings`, a JSON config file,
+environment variables `ALIEN_INVASION_<NAME>` and command-line flags. Any `Settings` attribute can be set by name in
+every layer, values are converted to the type of the default and validated, and the effective configuration is shown
+at startup with the layer each value comes from, so a machine can be tuned without patching the code. Dynamic settings
+such as `alien_speed` set this way are the values every game starts from, before the levels and the speedup curve
+change them; `fleet_direction` is game state rather than a setting and is rejected.
+"""
+
+import argparse
+import ast
+import json
+import os
+
+import controls
+from enemy_fire import PATTERNS
+from settings import Settings
+
+ENV_PREFIX = "ALIEN_INVASION_"  # Prefix of the environment variables, e.g. ALIEN_INVASION_FPS_CAP=144
+ENV_CONFIG = ENV_PREFIX + "CONFIG"  # Environment variable of the config file path
+DEFAULT_CONFIG_FILE = "alien_invasion.json"  # Config file read when present and no other one is given
+
+# Performance knobs, always shown in the effective configuration
+KNOBS = ("screen_width", "screen_height", "display_size", "scale_mode", "fullscreen", "vsync", "fps_cap", "renderer",
+         "sound_enabled", "particles", "low_latency_input", "headless")
+CHOICES = {"renderer": ("dirty", "full"), "collision_mode": ("rect", "mask"), "scale_mode": ("integer", "smooth"),
+           "alien_fire_pattern": tuple(PATTERNS)}
+MINIMUMS = {"screen_width": 320, "screen_height": 240, "fps_cap": 0, "tick_rate": 1, "max_steps_per_frame": 1,
+            "sound_channels": 1, "sound_voice_limit": 1, "bullet_allowed": 1, "ship_limit": 0, "particle_limit": 1,
+            "dirty_rect_limit": 0}
+GAME_STATE = ("fleet_direction",)  # `Settings` attributes the game resets on its own, configuring them has no effect
+TRUE_WORDS = ("1", "true", "yes", "on")
+FALSE_WORDS = ("0", "false", "no", "off")
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration value is unknown or invalid."""
+
+
+def convert(settings, name, value):
+    """
+    Return `value` converted to the type of the default of setting `name`, parsing it if it is a string.
+    :param settings: Instance of `Settings` holding the defaults.
+    :param name: Name of the `Settings` attribute.
+    :param value: Value from a config file, or text from the environment or the command line.
+    """
+    if not hasattr(settings, name):
+        raise ConfigError(f"Unknown setting {name!r}")
+    if name in GAME_STATE:
+        raise ConfigError(f"Setting {name!r} is reset by every game and can't be configured")
+    default = getattr(settings, name)
+    try:
+        if isinstance(value, str):
+            if isinstance(default, bool):
+                if value.lower() not in TRUE_WORDS + FALSE_WORDS:
+                    raise ValueError(f"expected one of {', '.join(TRUE_WORDS + FALSE_WORDS)}")
+                value = value.lower() in TRUE_WORDS
+            elif isinstance(default, (int, float)):
+                value = type(default)(value)
+            elif not isinstance(default, str):  # Tuples such as colors, or None for optional paths and seeds
+                try:
+                    value = ast.literal_eval(value)
+                except (ValueError, SyntaxError):
+                    pass  # Plain text, e.g. a file path
+        elif isinstance(default, float) and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        if isinstance(default, tuple) and isinstance(value, list):
+            value = tuple(value)
+        if isinstance(default, dict) and isinstance(value, dict):
+            value = dict(default, **value)  # Tables such as key bindings are overridden entry by entry
+        if default is not None and not isinstance(value, type(default)):
+            raise ValueError(f"expected {type(default).__name__}, got {type(value).__name__}")
+    except ValueError as error:
+        raise ConfigError(f"Invalid value {value!r} for {name}: {error}") from None
+
+    if name in CHOICES and value not in CHOICES[name]:
+        raise ConfigError(f"Invalid value {value!r} for {name}, expected one of {', '.join(CHOICES[name])}")
+    if name in MINIMUMS and value < MINIMUMS[name]:
+        raise ConfigError(f"Invalid value {value!r} for {name}, expected at least {MINIMUMS[name]}")
+    if name in ("key_bindings", "gamepad_bindings"):
+        try:  # Validated by the same lookup that builds the action tables of the controls
+            controls.bind(value, controls.key_code if name == "key_bindings" else controls.gamepad_button)
+        except ValueError as error:
+            raise ConfigError(f"Invalid {name}: {error}") from None
+    if name == "display_size" and value is not None:
+        value = tuple(value) if isinstance(value, list) else value
+        if not (isinstance(value, tuple) and len(value) == 2 and all(isinstance(v, int) and v > 0 for v in value)):
+            raise ConfigError(f"Invalid value {value!r} for display_size, expected (width, height)")
+    return value
+
+
+def _expand(name, value):
+    """Helper to yield the (name, value) settings of an entry, turning "resolution" into the display size."""
+    if name != "resolution":
+        yield name, value
+        return
+    try:
+        width, height = value.lower().split("x") if isinstance(value, str) else value
+        size = (int(width), int(height))
+    except ValueError:
+        raise ConfigError(f"Invalid resolution {value!r}, expected WIDTHxHEIGHT, e.g. 1920x1080") from None
+    yield "display_size", size
+
+
+def _file_layer(path):
+    """Helper to return the list of (name, value) entries of a JSON config file."""
+    try:
+        with open(path, "r") as fp:
+            values = json.load(fp)
+    except OSError as error:
+        raise ConfigError(f"Can't read config file {path}: {error.strerror}") from None
+    except ValueError as error:
+        raise ConfigError(f"Invalid config file {path}: {error}") from None
+    if not isinstance(values, dict):
+        raise ConfigError(f"Invalid config file {path}: expected an object of setting names to values")
+    return list(values.items())
+
+
+def _env_layer(environ):
+    """Helper to return the list of (name, text) entries of the environment variables."""
+    return [(key[len(ENV_PREFIX):].lower(), text) for key, text in sorted(environ.items())
+            if key.startswith(ENV_PREFIX) and key != ENV_CONFIG]
+
+
+def build_parser():
+    """Return the parser of the command-line flags."""
+    parser = argparse.ArgumentParser(description="Play Alien Invasion.")
+    parser.add_argument("--config", metavar="PATH",
+                        help=f"JSON file of settings, default to ${ENV_CONFIG} or ./{DEFAULT_CONFIG_FILE} if present")
+    parser.add_argument("--resolution", metavar="WIDTHxHEIGHT",
+                        help="window size, e.g. 3840x2160, the game is scaled to it from its logical resolution")
+    parser.add_argument("--scale-mode", choices=CHOICES["scale_mode"],
+                        help="scale by a whole factor with sharp pixels, or smoothly to fill the display")
+    parser.add_argument("--fullscreen", action=argparse.BooleanOptionalAction, help="use the whole screen")
+    parser.add_argument("--vsync", action=argparse.BooleanOptionalAction, help="sync frames with the display refresh")
+    parser.add_argument("--fps-cap", metavar="FPS", help="max number of frames per second, 0 for uncapped")
+    parser.add_argument("--renderer", choices=CHOICES["renderer"], help="redraw changed regions or the whole screen")
+    parser.add_argument("--low-latency", dest="low_latency_input", action=argparse.BooleanOptionalAction,
+                        help="read input right before the simulation and present the frame right after it")
+    parser.add_argument("--sound", dest="sound_enabled", action=argparse.BooleanOptionalAction, help="play audio")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction,
+                        help="play a simulated game without window or audio and print its result")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE", help="override any setting")
+    parser.add_argument("--quiet", action="store_true", help="don't show the effective configuration")
+    return parser
+
+
+def load_settings(argv=None, environ=None):
+    """
+    Build the settings from the defaults, config file, environment and command line.
+    :param argv: Command-line arguments, default to `sys.argv[1:]`.
+    :param environ: Environment variables, default to `os.environ`.
+    :return: Tuple of (`Settings`, dictionary of setting name to the layer it was last set by, parsed arguments).
+    """
+    environ = os.environ if environ is None else environ
+    args = build_parser().parse_args(argv)
+
+    layers = []
+    config_path = args.config or environ.get(ENV_CONFIG)
+    if config_path is None and os.path.exists(DEFAULT_CONFIG_FILE):
+        config_path = DEFAULT_CONFIG_FILE
+    if config_path is not None:
+        layers.append((f"file {config_path}", _file_layer(config_path)))
+    layers.append(("env", _env_layer(environ)))
+    flags = [(name, value) for name, value in (("resolution", args.resolution), ("scale_mode", args.scale_mode),
+                                               ("fullscreen", args.fullscreen), ("vsync", args.vsync),
+                                               ("fps_cap", args.fps_cap), ("renderer", args.renderer),
+                                               ("low_latency_input", args.low_latency_input),
+                                               ("sound_enabled", args.sound_enabled), ("headless", args.headless))
+             if value is not None]
+    for text in args.set:
+        name, separator, value = text.partition("=")
+        if not separator:
+            raise ConfigError(f"Invalid --set {text!r}, expected NAME=VALUE")
+        flags.append((name, value))
+    layers.append(("cli", flags))
+
+    settings = Settings()
+    sources = {}
+    for layer, entries in layers:
+        for entry_name, entry_value in entries:
+            for name, value in _expand(entry_name, entry_value):
+                setattr(settings, name, convert(settings, name, value))
+                sources[name] = layer
+    return settings, sources, args
+
+
+def describe(settings, sources):
+    """Return the lines showing the performance knobs and every overridden setting, with where they come from."""
+    names = list(KNOBS) + sorted(name for name in sources if name not in KNOBS)
+    width = max(len(name) for name in names)
+    lines = ["Effective configuration:"]
+    lines.extend(f"  {name:<{width}}  {getattr(settings, name)!r:<12} ({sources.get(name, 'default')})"
+                 for name in names)
+    return lines
@@ -0,0 +1,218 @@
+"""
+Module maintains the player controls of Alien Invasion: keyboard, gamepad and mouse.
+Note: Events are translated through an action table built from `Settings.key_bindings` and `Settings.gamepad_bindings`,
+so controls are rebound from the config file instead of the code. Each event is time-stamped when it is taken off the
+SDL queue, and the time from that stamp to the first display update after it is applied is kept as its
+input-to-photon latency. SDL only delivers events to the thread that opened the window, so rather than a reader
+thread, the frame wait drains the queue in short slices in low-latency mode, input is applied right before the
+simulation and the frame is presented right after it.
+"""
+
+import warnings
+from array import array
+from collections import deque
+from time import perf_counter_ns
+
+import pygame
+
+import inputs
+
+COMMANDS = ("quit", "profiler")  # Actions run once when pressed, unlike the held `inputs.ACTIONS`
+LATENCY_SAMPLES = 600  # Number of most recent latency samples kept for the statistics
+
+
+class NullControls:
+    """Controls reading nothing, used by headless games driven by a policy or a replay."""
+
+    def ingest(self):
+        """Do nothing."""
+
+    def poll(self):
+        """Do nothing."""
+
+    def presented(self, pixels):
+        """Do nothing."""
+
+    def start_gamepads(self):
+        """Do nothing."""
+
+    def latency_summary(self):
+        """Return empty statistics."""
+        return {"samples": 0}
+
+
+class Controls(NullControls):
+    """Time-stamped keyboard, gamepad and mouse input mapped to the game actions through rebindable tables."""
+
+    def __init__(self, ai_game):
+        """
+        Build the action tables from the bindings of the settings.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        self.ai_game = ai_game
+        self.settings = ai_game.settings
+        self._keys = bind(self.settings.key_bindings, key_code)  # Map of key code to action
+        self._buttons = bind(self.settings.gamepad_bindings, gamepad_button)  # Map of gamepad button to action
+        self._held = {action: set() for action in inputs.ACTIONS}  # Inputs holding down each action
+        self._gamepads = {}  # Map of instance id to the opened gamepad, opened when it is plugged in
+        self._queue = deque()  # (time stamp in ns, event) taken off the SDL queue but not applied yet
+        self._pending = []  # Time stamps of the applied events not shown on the display yet
+        self._latency = array("q", bytes(8 * LATENCY_SAMPLES))  # Ring buffer of latencies in ns
+        self.samples = 0  # Number of latencies measured since the start
+
+    def ingest(self):
+        """Take the waiting events off the SDL queue and time-stamp them, without applying them yet."""
+        events = pygame.event.get()
+        if events:
+            now = perf_counter_ns()
+            self._queue.extend((now, event) for event in events)
+
+    def poll(self):
+        """Ingest the waiting events, then apply every event ingested so far in order."""
+        self.ingest()
+        queue = self._queue
+        while queue:
+            stamp, event = queue.popleft()
+            if self._handle(event):
+                self._pending.append(stamp)
+
+    def presented(self, pixels):
+        """
+        Record the latency of the events applied since the last frame that reached the display.
+        :param pixels: Number of pixels pushed to the display by the frame, 0 when it was skipped.
+        """
+        if not pixels or not self._pending:
+            return
+        now = perf_counter_ns()
+        for stamp in self._pending:
+            self._latency[self.samples % LATENCY_SAMPLES] = now - stamp
+            self.samples += 1
+        self._pending.clear()
+
+    def start_gamepads(self):
+        """Start the joystick module, which reports every connected gamepad as a new device."""
+        if self.settings.gamepad:
+            pygame.joystick.init()
+
+    def latency_summary(self):
+        """Return a dictionary of statistics over the most recent latencies, in milliseconds."""
+        count = min(self.samples, LATENCY_SAMPLES)
+        if not count:
+            return {"samples": 0}
+        latencies = sorted(self._latency[:count])
+        return {
+            "samples": count,
+            "ms_p50": latencies[count // 2] / 1e6,
+            "ms_p95": latencies[min(count - 1, count * 95 // 100)] / 1e6,
+            "ms_max": latencies[-1] / 1e6,
+        }
+
+    def _handle(self, event):
+        """Helper to apply a single event, return whether it had any effect on the game."""
+        game = self.ai_game
+        if event.type == pygame.QUIT:
+            game._quit()
+        elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            action = self._keys.get(event.key)
+            return action is not None and self._set(("key", event.key), action, event.type == pygame.KEYDOWN)
+        elif event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+            action = self._buttons.get(event.button)
+            source = ("button", event.instance_id, event.button)
+            return action is not None and self._set(source, action, event.type == pygame.JOYBUTTONDOWN)
+        elif event.type == pygame.JOYAXISMOTION and event.axis == self.settings.gamepad_axis:
+            return self._steer(("axis", event.instance_id), event.value)
+        elif event.type == pygame.JOYHATMOTION:
+            return self._steer(("hat", event.instance_id, event.hat), event.value[0])
+        elif event.type == pygame.JOYDEVICEADDED:
+            gamepad = pygame.joystick.Joystick(event.device_index)
+            self._gamepads[gamepad.get_instance_id()] = gamepad
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self._gamepads.pop(event.instance_id, None)
+            # Release whatever the unplugged gamepad was holding down
+            changed = False
+            for action, sources in self._held.items():
+                for source in [source for source in sources if source[1] == event.instance_id]:
+                    changed = self._set(source, action, False) or changed
+            return changed
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            # The play button is laid out at the logical resolution
+            return game._check_play_button(game.viewport.to_logical(event.pos))
+        return False
+
+    def _steer(self, source, value):
+        """Helper to hold left or right from a stick axis or a hat, releasing both within the dead zone."""
+        changed = self._set(source, "left", value < -self.settings.gamepad_deadzone)
+        return self._set(source, "right", value > self.settings.gamepad_deadzone) or changed
+
+    def _set(self, source, action, down):
+        """
+        Helper to press or release `action` from `source`, a held action stays down while any of its inputs is held.
+        :return: Whether the game reacted, i.e. the input state changed or a command ran.
+        """
+        game = self.ai_game
+        if action == "quit":
+            if down:
+                game._quit()
+            return False
+        if action == "profiler":
+            if down:
+                game.profiler.toggle_overlay()  # Show or hide the profiler statistics
+            return down
+
+        held = self._held[action]
+        if down:
+            held.add(source)
+        else:
+            held.discard(source)
+        state = 0
+        for name, sources in self._held.items():
+            if sources:
+                state |= inputs.ACTIONS[name]
+        if state == game.input_state:
+            return False
+        game.set_input_state(state)
+        return True
+
+
+def key_code(name):
+    """Return the key code of the pygame key `name`, e.g. "space" or "f3", raise ValueError for an unknown key."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # Key names don't need pygame to be initialized, as when loading the config
+        try:
+            return pygame.key.key_code(name)
+        except (ValueError, TypeError):
+            raise ValueError(f"unknown key {name!r}") from None
+
+
+def gamepad_button(button):
+    """Return the gamepad button number `button`, raise ValueError unless it is a non-negative integer."""
+    if isinstance(button, bool) or not isinstance(button, int) or button < 0:
+        raise ValueError(f"invalid gamepad button {button!r}, expected a number from 0")
+    return button
+
+
+def bind(bindings, convert):
+    """
+    Return the map of input to action of `bindings`, raise ValueError for an unknown action or input.
+    Used both to build the action tables and to validate the bindings when the configuration is loaded.
+    :param bindings: Dictionary of action name to the sequence of inputs bound to it.
+    :param convert: Function returning the input of an entry of the bindings, e.g. `key_code`.
+    """
+    table = {}
+    for action, names in bindings.items():
+        if action not in inputs.ACTIONS and action not in COMMANDS:
+            actions = ", ".join(list(inputs.ACTIONS) + list(COMMANDS))
+            raise ValueError(f"unknown action {action!r}, expected one of {actions}")
+        if not isinstance(names, (list, tuple)):
+            raise ValueError(f"expected a list of inputs for {action!r}, got {names!r}")
+        for name in names:
+            table[convert(name)] = action
+    return table
+
+
+def create_controls(ai_game):
+    """
+    Return the controls of the game, which read nothing when headless.
+    :param ai_game: Reference to the current instance of `AlienInvasion` class.
+    """
+    return NullControls() if ai_game.headless else Controls(ai_game)
@@ -0,0 +1,161 @@
+"""
+Module maintains the projectiles fired by the aliens.
+Note: Late levels can have hundreds of shots on screen, so they are not sprites. Positions and velocities live in
+fixed-capacity NumPy arrays whose first `count` entries are in flight: moving them is one vectorized operation, shots
+leaving the screen are culled by compacting the arrays in place, and the ship is tested against all of them with a
+single vectorized bounding box test, followed by a mask test of the few overlapping shots in "mask" collision mode.
+Drawing reuses one preallocated (image, rect) pair per slot.
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+from assets import assets
+
+# Directions of the shots of each firing pattern, in degrees from straight down
+PATTERNS = {
+    "straight": (0.0,),
+    "spread": (-20.0, 0.0, 20.0),
+    "fan": (-60.0, -40.0, -20.0, 0.0, 20.0, 40.0, 60.0),
+    "aimed": None,  # A single shot toward the ship
+}
+
+
+class EnemyProjectiles:
+    """Array-backed projectiles fired down at the ship by the fleet."""
+
+    def __init__(self, ai_game):
+        """
+        Initialize an empty volley.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        self.ai_game = ai_game
+        self.settings = ai_game.settings
+        self.screen_rect = ai_game.screen.get_rect()
+        self.rng = ai_game.rng  # Shooters are drawn from the game randomness so replays stay deterministic
+        self.width, self.height = self.settings.enemy_bullet_width, self.settings.enemy_bullet_height
+        self.image = assets.solid((self.width, self.height), self.settings.enemy_bullet_color)
+        self.mask = assets.solid_mask((self.width, self.height))
+
+        capacity = self.settings.enemy_bullet_limit
+        self.capacity = capacity
+        self.count = 0  # Number of shots in flight, stored in the first `count` entries of the arrays
+        self.x = np.zeros(capacity)  # Exact position of the top-left corner of each shot
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)  # Positions at the previous simulation step for interpolated drawing
+        self.prev_y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)  # Velocity of each shot in pixels per second
+        self.vy = np.zeros(capacity)
+        self.reload = 0.0  # Fraction of the next volley accumulated from the fire rate
+        self.dropped = 0  # Number of shots not fired because the arrays were full
+
+        # One (image, rect) pair per slot, created once and updated in place for drawing
+        self.items = [(self.image, pygame.Rect(0, 0, self.width, self.height)) for _ in range(capacity)]
+
+    def __len__(self):
+        """Return the number of shots in flight."""
+        return self.count
+
+    def clear(self):
+        """Remove every shot in flight, e.g. when the ship is lost or a new level starts."""
+        self.count = 0
+        self.reload = 0.0
+
+    def update(self, dt):
+        """
+        Fire the volleys due in this step, move every shot and cull those that left the screen.
+        :param dt: Seconds elapsed in this simulation step.
+        """
+        self.reload += self.settings.alien_fire_rate * dt
+        while self.reload >= 1.0:
+            self.reload -= 1.0
+            self._fire_volley()
+
+        count = self.count
+        if not count:
+            return
+        x, y = self.x[:count], self.y[:count]
+        self.prev_x[:count] = x
+        self.prev_y[:count] = y
+        x += self.vx[:count] * dt
+        y += self.vy[:count] * dt
+
+        screen_rect = self.screen_rect
+        on_screen = (y < screen_rect.bottom) & (x + self.width > screen_rect.left) & (x < screen_rect.right)
+        if not on_screen.all():
+            self._compact(on_screen)
+
+    def collide_rect(self, rect, mask=None):
+        """
+        Remove the shots colliding with `rect` and return how many there were.
+        :param rect: Rect to test, e.g. the ship rect.
+        :param mask: Collision mask of the object in `rect` in "mask" collision mode, None for a solid rectangle.
+        """
+        count = self.count
+        if not count:
+            return 0
+        x, y = self.x[:count], self.y[:count]
+        hits = (x < rect.right) & (x + self.width > rect.left) & (y < rect.bottom) & (y + self.height > rect.top)
+        if mask is not None and self.settings.collision_mode == "mask" and hits.any():
+            # Only the shots whose bounding box overlaps `rect` pay for a mask test
+            for index in np.flatnonzero(hits).tolist():
+                hits[index] = mask.overlap(self.mask, (int(x[index]) - rect.x, int(y[index]) - rect.y)) is not None
+        hit_count = int(np.count_nonzero(hits))
+        if hit_count:
+            self._compact(~hits)
+        return hit_count
+
+    def sync_rects(self, alpha=1.0):
+        """
+        Copy the array positions to the rects of the shots in flight for drawing.
+        :param alpha: Fraction of the simulation step elapsed, used to interpolate from the previous positions.
+        """
+        count = self.count
+        x, y = self.x[:count], self.y[:count]
+        x = (x - (x - self.prev_x[:count]) * (1 - alpha)).astype(int).tolist()
+        y = (y - (y - self.prev_y[:count]) * (1 - alpha)).astype(int).tolist()
+        for (_, rect), left, top in zip(self.items, x, y):
+            rect.topleft = (left, top)
+
+    def scene(self):
+        """Return the list of (image, rect) pairs of the shots in flight."""
+        return self.items[:self.count]
+
+    def _fire_volley(self):
+        """Helper to make a random alien of the fleet fire a volley of the current pattern."""
+        fleet = self.ai_game.fleet
+        shooters = np.flatnonzero(fleet.alive)
+        if not shooters.size:
+            return
+        shooter = int(shooters[self.rng.randrange(shooters.size)])
+        x = fleet.x[shooter] + (fleet.alien_width - self.width) / 2  # Fire from the bottom center of the alien
+        y = fleet.y[shooter] + fleet.alien_height
+
+        speed = self.settings.enemy_bullet_speed
+        angles = PATTERNS[self.settings.alien_fire_pattern]
+        if angles is None:
+            ship_rect = self.ai_game.ship.rect
+            angles = (math.degrees(math.atan2(x - ship_rect.centerx, ship_rect.centery - y)),)
+        for angle in angles:
+            self._spawn(x, y, -speed * math.sin(math.radians(angle)), speed * math.cos(math.radians(angle)))
+
+    def _spawn(self, x, y, vx, vy):
+        """Helper to append a shot to the arrays, dropping it if they are full."""
+        index = self.count
+        if index == self.capacity:
+            self.dropped += 1
+            return
+        self.x[index] = self.prev_x[index] = x
+        self.y[index] = self.prev_y[index] = y
+        self.vx[index] = vx
+        self.vy[index] = vy
+        self.count = index + 1
+
+    def _compact(self, keep):
+        """Helper to keep the shots of the boolean array `keep` at the front of the arrays, in the same order."""
+        kept = int(np.count_nonzero(keep))
+        for array in (self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy):
+            array[:kept] = array[:self.count][keep]
+        self.count = kept
@@ -0,0 +1,155 @@
+"""
+Module maintains the compact entity layer of Alien Invasion.
+Note: `pygame.sprite.Sprite` has no `__slots__`, so every sprite carries an instance dict and a set of its groups
+whatever its subclasses declare. `Entity` implements the part of the sprite protocol groups rely on (`add_internal`,
+`remove_internal`, `alive`, `kill`, `groups`) in slots, keeping its groups in a tuple since an entity is in at most one
+group nearly all the time. Entities keep no back-reference to the game: what they need at run time is read from the
+`Context` shared by all the entities of a game, and images come from the `assets` cache so every entity of a kind
+shares one surface. Run `python entity.py` for the memory report of each kind of entity.
+"""
+
+import sys
+import tracemalloc
+
+import pygame
+
+
+class Context:
+    """Game-wide references shared by all the entities of a game."""
+
+    __slots__ = ("screen", "screen_rect", "settings")
+
+    def __init__(self, ai_game):
+        """
+        Collect the references entities need.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        self.screen = ai_game.screen
+        self.screen_rect = ai_game.screen.get_rect()  # Logical screen area the entities move in
+        self.settings = ai_game.settings
+
+
+class Entity:
+    """Slotted sprite that pygame groups can hold, with an image and a rect."""
+
+    __slots__ = ("image", "rect", "_groups")
+
+    def __init__(self, *groups):
+        """
+        Initialize the entity and add it to `groups`.
+        :param groups: Groups to add the entity to.
+        """
+        self._groups = ()
+        self.add(*groups)
+
+    # Sprite protocol, called by the groups
+    def add_internal(self, group):
+        """Record that the entity was added to `group`."""
+        if group not in self._groups:
+            self._groups += (group,)
+
+    def remove_internal(self, group):
+        """Record that the entity was removed from `group`."""
+        self._groups = tuple(member for member in self._groups if member is not group)
+
+    def update(self, *args, **kwargs):
+        """Do nothing, subclasses move the entity."""
+
+    def add(self, *groups):
+        """Add the entity to `groups`, prefer it to `Group.add` which only has a slow path for non-`Sprite` objects."""
+        for group in groups:
+            if not group.has_internal(self):
+                group.add_internal(self)
+                self.add_internal(group)
+
+    def remove(self, *groups):
+        """Remove the entity from `groups`."""
+        for group in groups:
+            if group.has_internal(self):
+                group.remove_internal(self)
+                self.remove_internal(group)
+
+    def kill(self):
+        """Remove the entity from all its groups."""
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups = ()
+
+    def groups(self):
+        """Return the list of the groups holding the entity."""
+        return list(self._groups)
+
+    def alive(self):
+        """Return whether any group holds the entity."""
+        return bool(self._groups)
+
+
+class Icon(Entity):
+    """Still image at a fixed position, e.g. a life icon of the scoreboard."""
+
+    __slots__ = ()
+
+    def __init__(self, image, topleft, *groups):
+        """
+        Place a shared image on the screen.
+        :param image: Surface drawn by the icon, shared rather than copied.
+        :param topleft: Tuple of (x, y) of the top left corner of the icon.
+        """
+        super().__init__(*groups)
+        self.image = image
+        self.rect = image.get_rect(topleft=topleft)
+
+
+def footprint(factory, count=2000):
+    """
+    Return the bytes allocated per entity by `factory`, measured over `count` instances.
+    Shared data such as images is allocated before the measure by a first call, so only the per-entity cost remains.
+    """
+    factory()  # Warm the image and mask caches up
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(entities)
+    tracemalloc.stop()
+    return size / count
+
+
+def report(ai_game):
+    """Return the lines of the memory report of each kind of entity of `ai_game`, and of the sprites they replace."""
+    from alien import Alien  # Imported here since these modules import this one
+    from bullet import Bullet
+    from ship import Ship
+
+    image = ai_game.ship.image
+    kinds = {
+        "Alien": lambda: Alien(ai_game),
+        "Bullet": lambda: Bullet(ai_game),
+        "Ship": lambda: Ship(ai_game),
+        "Icon": lambda: Icon(image, (0, 0)),
+        "pygame Sprite (reference)": lambda: _reference_sprite(image),
+    }
+    width = max(len(name) for name in kinds)
+    return [f"{name:<{width}}  {footprint(factory):>6.0f} bytes per entity" for name, factory in kinds.items()]
+
+
+def _reference_sprite(image):
+    """Helper to return a bare pygame sprite with an image and a rect, the lightest sprite a group can hold."""
+    sprite = pygame.sprite.Sprite()
+    sprite.image = image
+    sprite.rect = image.get_rect()
+    return sprite
+
+
+def main():
+    """Print the memory report of a headless game."""
+    from alien_invasion import AlienInvasion
+    from settings import Settings
+
+    settings = Settings()
+    settings.persist_scores = False
+    for line in report(AlienInvasion(settings, headless=True)):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
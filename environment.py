@@ -0,0 +1,311 @@
+"""
+Module maintains the reinforcement learning environments of Alien Invasion.
+Note: `AlienInvasionEnv` follows the Gym API (`reset()` and `step(action)` returning observation, reward, terminated,
+truncated and info) on top of a headless `Simulation`, without depending on gym itself. Observations are either a
+compact feature vector of the ship, alien and bullet positions, or a downsampled frame drawn off-screen through a
+`Viewport`, so sprites are scaled once and no window is ever opened. `VectorEnv` steps N environments in worker
+processes that write their observations straight into a shared-memory batch, so only actions, rewards and flags
+travel through the pipes.
+"""
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+import inputs
+from simulation import Simulation
+from viewport import Viewport
+
+# Input state held down for each discrete action
+ACTIONS = (
+    0,  # Do nothing
+    inputs.MOVE_LEFT,
+    inputs.MOVE_RIGHT,
+    inputs.FIRE,
+    inputs.MOVE_LEFT | inputs.FIRE,
+    inputs.MOVE_RIGHT | inputs.FIRE,
+)
+OBSERVATIONS = ("features", "frame")
+
+
+class AlienInvasionEnv:
+    """Single headless game with the Gym `reset` / `step` API."""
+
+    def __init__(self, settings=None, observation="features", frame_size=(84, 84), grayscale=True, frame_skip=4,
+                 max_seconds=600.0, score_reward=0.01, ship_penalty=1.0, enemy_shots=8, seed=0):
+        """
+        Create the environment, `reset` must be called before the first step.
+        :param settings: Function returning a new `Settings` for each episode, default to the default settings.
+        :param observation: "features" for a vector of positions, or "frame" for a downsampled image of the screen.
+        :param frame_size: Tuple of (width, height) of the frame observations.
+        :param grayscale: Whether frames are a single luminance channel instead of RGB.
+        :param frame_skip: Number of fixed simulation steps each action is held for.
+        :param max_seconds: Simulated time after which an episode is truncated.
+        :param score_reward: Reward per point scored.
+        :param ship_penalty: Negative reward per ship lost, including the last one.
+        :param enemy_shots: Number of alien shots closest to the ship in the feature vector.
+        :param seed: Seed of the first episode, the next ones count up from it unless `reset` is given a seed.
+        """
+        if observation not in OBSERVATIONS:
+            raise ValueError(f"Unknown observation {observation!r}, expect one of {OBSERVATIONS}")
+        self.make_settings = settings
+        self.observation = observation
+        self.frame_size = tuple(frame_size)
+        self.grayscale = grayscale
+        self.frame_skip = frame_skip
+        self.max_seconds = max_seconds
+        self.score_reward = score_reward
+        self.ship_penalty = ship_penalty
+        self.enemy_shots = enemy_shots
+        self.next_seed = seed
+        self.action_count = len(ACTIONS)
+
+        self.simulation = None
+        self.game = None
+        self._viewport = None  # Maps the scene to the frame size, keeping the scaled sprites across episodes
+        self._frame = None  # Off-screen surface of the frame size the frame observations are drawn on
+        self._score = 0  # Score and ships left at the previous step, to derive the rewards
+        self._ship_left = 0
+        self._new_game()  # Build a game once to know the observation shape
+        self.next_seed = seed
+        self.observation_shape = self._observe().shape
+        self.observation_dtype = np.float32 if observation == "features" else np.uint8
+
+    def reset(self, seed=None):
+        """
+        Start a new episode.
+        :param seed: Seed of the episode, default to the next seed of the environment.
+        :return: Tuple of (observation, info).
+        """
+        if seed is not None:
+            self.next_seed = seed
+        self._new_game()
+        self.simulation.start()
+        self._score, self._ship_left = self.game.stats.score, self.game.stats.ship_left
+        return self._observe(), self._info()
+
+    def step(self, action):
+        """
+        Hold the input of `action` for `frame_skip` simulation steps.
+        :param action: Index in `ACTIONS`.
+        :return: Tuple of (observation, reward, terminated, truncated, info).
+        """
+        state = ACTIONS[action]
+        game, simulation = self.game, self.simulation
+        # Release fire first so that every firing action presses it, like tapping the key
+        game.set_input_state(game.input_state & state & ~inputs.FIRE)
+        for _ in range(self.frame_skip):
+            simulation.step(state)
+            if not game.stats.game_active:
+                break
+
+        stats = game.stats
+        ships_lost = self._ship_left - stats.ship_left
+        terminated = not stats.game_active
+        if terminated:
+            ships_lost += 1  # The last ship is lost without decrementing the ships left
+        reward = (stats.score - self._score) * self.score_reward - ships_lost * self.ship_penalty
+        self._score, self._ship_left = stats.score, stats.ship_left
+        truncated = not terminated and game.sim_time >= self.max_seconds
+        return self._observe(), reward, terminated, truncated, self._info()
+
+    def close(self):
+        """Release the game."""
+        self.simulation = self.game = None
+
+    def _new_game(self):
+        """Helper to create the headless game of a new episode."""
+        settings = self.make_settings() if self.make_settings is not None else None
+        self.simulation = Simulation(settings, seed=self.next_seed, max_seconds=self.max_seconds)
+        self.game = self.simulation.game
+        self.next_seed += 1
+
+    def _info(self):
+        """Helper to return the info dictionary of the current step."""
+        stats = self.game.stats
+        return {"score": stats.score, "level": stats.level, "ship_left": stats.ship_left, "time": self.game.sim_time}
+
+    def _observe(self):
+        """Helper to return the observation of the current state."""
+        return self._features() if self.observation == "features" else self._render_frame()
+
+    def _features(self):
+        """
+        Helper to return the feature vector, positions being scaled to [0, 1] of the screen and -1 for empty slots:
+        ship x and fleet direction, then (x, y) of every alien slot, of every player bullet, and of the alien shots
+        closest to the bottom of the screen.
+        """
+        game = self.game
+        settings, fleet, shots = game.settings, game.fleet, game.enemy_fire
+        width, height = settings.screen_width, settings.screen_height
+        alien_slots = game.levels.slots_x * game.levels.slots_y
+        features = np.full(2 + 2 * (alien_slots + settings.bullet_allowed + self.enemy_shots), -1.0, dtype=np.float32)
+        features[0] = game.ship.rect.centerx / width
+        features[1] = settings.fleet_direction
+
+        aliens = features[2:2 + 2 * alien_slots].reshape(-1, 2)
+        alive = np.flatnonzero(fleet.alive)[:alien_slots]
+        aliens[alive, 0] = (fleet.x[alive] + fleet.alien_width / 2) / width
+        aliens[alive, 1] = (fleet.y[alive] + fleet.alien_height / 2) / height
+
+        start = 2 + 2 * alien_slots
+        bullets = features[start:start + 2 * settings.bullet_allowed].reshape(-1, 2)
+        for row, bullet in zip(bullets, game.bullets.sprites()):
+            row[:] = bullet.rect.centerx / width, bullet.rect.centery / height
+
+        start += 2 * settings.bullet_allowed
+        closest = features[start:].reshape(-1, 2)
+        count = shots.count
+        if count and self.enemy_shots:
+            y = shots.y[:count]
+            nearest = np.argsort(-y)[:self.enemy_shots]  # Lowest on the screen, i.e. closest to the ship
+            closest[:len(nearest), 0] = shots.x[nearest] / width
+            closest[:len(nearest), 1] = y[nearest] / height
+        return features
+
+    def _render_frame(self):
+        """Helper to draw the scene at the frame size and return it as an array of (height, width[, 3]) bytes."""
+        game = self.game
+        if self._viewport is None:
+            self._viewport = Viewport(game.screen.get_size(), self.frame_size)
+            self._frame = pygame.Surface(self.frame_size, 0, game.screen)
+        game.fleet.sync_rects()
+        game.enemy_fire.sync_rects(1.0)
+        self._frame.fill(game.settings.bg_color)
+        self._frame.blits(self._viewport.map(game._scene()), doreturn=False)
+        pixels = pygame.surfarray.pixels3d(self._frame).transpose(1, 0, 2)  # surfarray is indexed (x, y)
+        if self.grayscale:
+            return (pixels @ np.array([77, 150, 29], dtype=np.uint16) >> 8).astype(np.uint8)  # ITU-R BT.601 luma
+        return pixels.copy()
+
+
+def _worker(first, connection, memory_name, shape, dtype, kwargs_list):
+    """
+    Run consecutive environments in a worker process, writing their observations into the shared batch.
+    :param first: Row of the batch of the first environment of the worker.
+    :param connection: End of the pipe to the `VectorEnv`.
+    :param memory_name: Name of the shared memory block of the observation batch.
+    :param shape: Shape of the observation batch.
+    :param dtype: Type of the observations.
+    :param kwargs_list: Arguments of each environment of the worker.
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    observations = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+    envs = [AlienInvasionEnv(**kwargs) for kwargs in kwargs_list]
+    try:
+        while True:
+            command, argument = connection.recv()
+            if command == "step":
+                results = []
+                for index, (env, action) in enumerate(zip(envs, argument), first):
+                    observation, reward, terminated, truncated, info = env.step(action)
+                    if terminated or truncated:
+                        # Start the next episode right away, the last observation of the episode goes with its info
+                        info["final_observation"] = observation
+                        observation, _ = env.reset()
+                    observations[index] = observation
+                    results.append((reward, terminated, truncated, info))
+                connection.send(results)
+            elif command == "reset":
+                infos = []
+                for index, env in enumerate(envs, first):
+                    observations[index], info = env.reset()
+                    infos.append(info)
+                connection.send(infos)
+            elif command == "close":
+                break
+    finally:
+        for env in envs:
+            env.close()
+        del observations
+        memory.close()
+        connection.close()
+
+
+class VectorEnv:
+    """N environments stepped together in worker processes, observations batched in shared memory."""
+
+    def __init__(self, count, processes=None, seed=0, **kwargs):
+        """
+        Start the worker processes, each running a share of the environments.
+        :param count: Number of environments.
+        :param processes: Number of worker processes, default to the number of CPUs available, at most `count`.
+        :param seed: Seed of the first environment, environment `i` starts from `seed + i * 1_000_000`.
+        :param kwargs: Arguments of every `AlienInvasionEnv`; `settings` must then be picklable, e.g. a class.
+        """
+        probe = AlienInvasionEnv(**kwargs)  # Learn the observation shape without starting a worker
+        self.count = count
+        self.action_count = probe.action_count
+        self.observation_shape = (count,) + probe.observation_shape
+        dtype = np.dtype(probe.observation_dtype)
+        probe.close()
+
+        size = int(np.prod(self.observation_shape)) * dtype.itemsize
+        self._memory = shared_memory.SharedMemory(create=True, size=size)
+        self.observations = np.ndarray(self.observation_shape, dtype=dtype, buffer=self._memory.buf)
+        processes = min(count, processes or os.cpu_count() or 1)
+        self._slices = []  # Rows of the batch of each worker
+        self._connections = []
+        self._processes = []
+        for worker in range(processes):
+            rows = slice(worker * count // processes, (worker + 1) * count // processes)
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker, daemon=True,
+                args=(rows.start, child, self._memory.name, self.observation_shape, dtype,
+                      [dict(kwargs, seed=seed + index * 1_000_000) for index in range(rows.start, rows.stop)]))
+            process.start()
+            child.close()
+            self._slices.append(rows)
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def reset(self):
+        """
+        Start a new episode in every environment.
+        :return: Tuple of (batch of observations, list of infos). The batch is the shared buffer, overwritten by the
+            next call, copy it to keep it.
+        """
+        for connection in self._connections:
+            connection.send(("reset", None))
+        infos = [info for connection in self._connections for info in connection.recv()]
+        return self.observations, infos
+
+    def step(self, actions):
+        """
+        Step every environment with its action, environments whose episode ends are reset right away.
+        :param actions: Sequence of one action index per environment.
+        :return: Tuple of (batch of observations, rewards, terminated flags, truncated flags, list of infos).
+        """
+        actions = [int(action) for action in actions]
+        for connection, rows in zip(self._connections, self._slices):
+            connection.send(("step", actions[rows]))
+        results = [result for connection in self._connections for result in connection.recv()]
+        rewards, terminated, truncated, infos = zip(*results)
+        return (self.observations, np.array(rewards, dtype=np.float32), np.array(terminated),
+                np.array(truncated), list(infos))
+
+    def close(self):
+        """Stop the workers and free the shared memory."""
+        for connection in self._connections:
+            try:
+                connection.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass  # The worker is already gone
+        for process in self._processes:
+            process.join(timeout=5)
+        for connection in self._connections:
+            connection.close()
+        self._connections, self._processes = [], []
+        del self.observations
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,190 @@
+"""
+Module maintains the fleet of aliens as a struct of arrays.
+Note: Positions and liveness of all the aliens are stored in NumPy arrays, so moving the fleet, checking the edges,
+dropping it and checking the bottom are each a single vectorized operation regardless of the fleet size. The `Alien`
+sprites only carry the image and rect used for drawing, and their rects are synced from the arrays once per frame.
+Collision queries go through a `SpatialHash` broadphase that is only updated for the aliens that changed cell, and in
+"mask" collision mode the few aliens whose rect overlaps are tested against the alien mask shared by the whole fleet.
+"""
+
+import numpy as np
+
+from alien import Alien
+from assets import assets
+from collision import SpatialHash
+from pool import SpritePool
+
+
+class Fleet:
+    """Vectorized state of the fleet of aliens."""
+
+    def __init__(self, ai_game):
+        """
+        Initialize an empty fleet.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        self.ai_game = ai_game
+        self.settings = ai_game.settings
+        self.screen_rect = ai_game.screen.get_rect()
+        self.group = ai_game.aliens  # Group of alive alien sprites used for drawing
+        self.pool = SpritePool(lambda: Alien(ai_game), self.group)  # Aliens are recycled from one fleet to the next
+
+        # Size of an alien, identical for the whole fleet
+        self.alien_width, self.alien_height = Alien(ai_game).rect.size
+        self.alien_mask = assets.mask("images/alien.bmp")  # Collision mask shared by the whole fleet
+
+        self.sprites = []  # Alien sprites, where the sprite at index `i` is described by the i-th array entries
+        self.x = np.empty(0)  # Exact horizontal position of the left edge of each alien
+        self.y = np.empty(0)  # Exact vertical position of the top edge of each alien
+        self.prev_x = np.empty(0)  # Positions at the previous simulation step for interpolated drawing
+        self.prev_y = np.empty(0)
+        self.alive = np.empty(0, dtype=bool)  # Whether each alien is still in the fleet
+
+        # Broadphase grid with cells of one alien, the smallest size keeping every alien within 2 x 2 cells
+        self.grid = SpatialHash(self.alien_width, self.alien_height)
+        self.cell_x = np.empty(0, dtype=int)  # Grid cell of each alien, to find those that moved to another cell
+        self.cell_y = np.empty(0, dtype=int)
+
+    def __len__(self):
+        """Return the number of alive aliens."""
+        return int(np.count_nonzero(self.alive))
+
+    def spawn(self, positions):
+        """
+        Replace the fleet with new aliens placed at `positions`.
+        :param positions: Array-like of shape (N, 2) of the (x, y) top-left corner of each alien.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        self.x = positions[:, 0].copy()
+        self.y = positions[:, 1].copy()
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+        self.alive = np.ones(len(positions), dtype=bool)
+
+        self.cell_x, self.cell_y = self._cells()
+        self.grid.clear()
+        for index, x, y in zip(range(len(positions)), self.x.tolist(), self.y.tolist()):
+            self.grid.insert(index, x, y)
+
+        self.pool.release_all()
+        self.sprites = [self.pool.acquire(index) for index in range(len(positions))]
+        self.sync_rects()
+
+    def update(self, dt):
+        """
+        Move the whole fleet left or right based on the fleet direction.
+        :param dt: Seconds elapsed in this simulation step.
+        """
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+        self.x += self.settings.alien_speed * self.settings.fleet_direction * dt
+        self._rehash()
+
+    def hit_edges(self):
+        """Return True if any alive alien hits the left or right edge of the screen."""
+        x = self.x[self.alive]
+        return bool(np.any((x + self.alien_width >= self.screen_rect.right) | (x <= self.screen_rect.left)))
+
+    def drop(self, distance):
+        """Move the whole fleet down by `distance` pixels."""
+        self.y += distance
+        self._rehash()
+
+    def hit_bottom(self):
+        """Return True if any alive alien has reached the bottom edge of the screen."""
+        return bool(np.any(self.y[self.alive] + self.alien_height >= self.screen_rect.bottom))
+
+    def collide_rect(self, rect, mask=None):
+        """
+        Return the sorted list of indices of the alive aliens colliding with `rect`.
+        :param rect: Rect to test, e.g. of a bullet or of the ship.
+        :param mask: Collision mask of the object in `rect` in "mask" collision mode, None for a solid rectangle.
+        """
+        hit = self._overlap_rect(rect)
+        if hit and self.settings.collision_mode == "mask":
+            # Rect overlap already narrowed the fleet down to a few candidates, only they pay for a mask test
+            if mask is None:
+                mask = assets.solid_mask(rect.size)
+            alien_mask, x, y = self.alien_mask, self.x, self.y
+            hit = [index for index in hit if alien_mask.overlap(mask, (rect.x - int(x[index]), rect.y - int(y[index])))]
+        return hit
+
+    def _overlap_rect(self, rect):
+        """Helper to return the sorted list of indices of the alive aliens whose rect overlaps `rect`."""
+        if not self.settings.collision_grid:  # Brute force over the whole fleet
+            hit = (self.alive
+                   & (self.x < rect.right) & (self.x + self.alien_width > rect.left)
+                   & (self.y < rect.bottom) & (self.y + self.alien_height > rect.top))
+            return np.flatnonzero(hit).tolist()
+
+        # Only a handful of candidates share the cells of `rect`, so test them in plain Python rather than paying the
+        # fixed cost of NumPy calls. Dead aliens are removed from the grid.
+        left, top = rect.left - self.alien_width, rect.top - self.alien_height
+        right, bottom = rect.right, rect.bottom
+        x, y = self.x, self.y
+        hit = [index for index in self.grid.query(rect) if left < x[index] < right and top < y[index] < bottom]
+        hit.sort()
+        return hit
+
+    def groupcollide(self, bullets):
+        """
+        Remove the bullets and aliens that collide, like `pygame.sprite.groupcollide(bullets, aliens, True, True)`.
+        :param bullets: Group of bullets fired by the ship.
+        :return: Dictionary mapping each bullet that hit to the list of aliens it destroyed.
+        """
+        collisions = {}
+        for bullet in bullets.sprites():
+            hit = self.collide_rect(bullet.rect)
+            if hit:
+                collisions[bullet] = self.kill(hit)
+                bullet.kill()
+        return collisions
+
+    def kill(self, indices):
+        """
+        Remove the aliens at the list of `indices` from the fleet.
+        :return: List of the removed alien sprites.
+        """
+        self.alive[indices] = False
+        for index in indices:
+            self.grid.remove(index)
+        aliens = [self.sprites[index] for index in indices]
+        for alien in aliens:
+            alien.kill()
+        return aliens
+
+    def centers(self, aliens):
+        """
+        Return the centers of the `aliens` sprites at their simulated positions.
+        :param aliens: List of alien sprites of this fleet, e.g. returned by `kill`.
+        :return: Array of shape (N, 2) of the (x, y) centers.
+        """
+        indices = [alien.index for alien in aliens]
+        return np.column_stack((self.x[indices] + self.alien_width / 2, self.y[indices] + self.alien_height / 2))
+
+    def sync_rects(self, alpha=1.0):
+        """
+        Copy the array positions to the rects of the alive aliens for drawing.
+        :param alpha: Fraction of the simulation step elapsed, used to interpolate from the previous positions.
+        """
+        indices = np.flatnonzero(self.alive)
+        x = self.prev_x[indices] + (self.x[indices] - self.prev_x[indices]) * alpha
+        y = self.prev_y[indices] + (self.y[indices] - self.prev_y[indices]) * alpha
+        sprites = self.sprites
+        for index, left, top in zip(indices.tolist(), x.astype(int).tolist(), y.astype(int).tolist()):
+            sprites[index].rect.topleft = (left, top)
+
+    def _cells(self):
+        """Helper to return the arrays of grid cell indices of all the aliens."""
+        return ((self.x // self.grid.cell_width).astype(int),
+                (self.y // self.grid.cell_height).astype(int))
+
+    def _rehash(self):
+        """Helper to move the alive aliens that crossed a cell boundary to their new grid cell."""
+        cell_x, cell_y = self._cells()
+        moved = np.flatnonzero(self.alive & ((cell_x != self.cell_x) | (cell_y != self.cell_y)))
+        if moved.size:
+            x, y = self.x, self.y
+            for index in moved.tolist():
+                self.grid.move(index, x[index], y[index])
+        self.cell_x, self.cell_y = cell_x, cell_y
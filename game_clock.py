@@ -0,0 +1,64 @@
+"""
+Module maintains the game loop scheduler.
+Note: The simulation advances in fixed steps of `1 / tick_rate` seconds, independent of how often the screen is drawn.
+Frames are capped by `pygame.time.Clock.tick`, which sleeps rather than spins, and the remaining fraction of a step is
+exposed as `alpha` so sprites can be drawn between their previous and current positions. The wait can be sliced to run
+an idle callback every millisecond, e.g. to time-stamp input events as they arrive.
+"""
+
+from time import perf_counter, sleep
+
+import pygame
+
+IDLE_SLICE = 0.001  # Seconds slept between two calls of the idle callback of `GameClock.advance`
+
+
+class GameClock:
+    """Fixed-timestep scheduler with a frame-rate cap and catch-up limit."""
+
+    def __init__(self, ai_game):
+        """
+        Initialize the scheduler from the game settings.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        self.settings = ai_game.settings
+        self.dt = 1.0 / self.settings.tick_rate  # Seconds simulated by one fixed step
+        self.alpha = 0.0  # Fraction of a step between the last simulated state and the present, in [0, 1)
+        self.frames = 0  # Number of frames scheduled so far
+        self.ticks = 0  # Number of fixed steps scheduled so far
+        self._clock = pygame.time.Clock()
+        self._accumulator = 0.0  # Real time not simulated yet
+        self._last_frame = perf_counter()  # Time the previous frame slot started
+
+    def advance(self, idle=None):
+        """
+        Wait for the next frame slot and return the number of fixed steps to simulate for it.
+        :param idle: Function called every `IDLE_SLICE` seconds of the wait and once at its end, or None to just sleep.
+        """
+        if idle is not None:
+            if self.settings.fps_cap:
+                deadline = self._last_frame + 1 / self.settings.fps_cap
+                while perf_counter() < deadline - IDLE_SLICE:
+                    idle()
+                    sleep(IDLE_SLICE)
+            idle()
+        elapsed = self._clock.tick(self.settings.fps_cap) / 1000  # Sleeps to honor the cap; 0 means uncapped
+        self._last_frame = perf_counter()
+        self._accumulator += elapsed
+
+        steps = int(self._accumulator / self.dt)
+        if steps > self.settings.max_steps_per_frame:
+            # Too far behind (e.g. the window was dragged): drop the backlog instead of spiraling
+            steps = self.settings.max_steps_per_frame
+            self._accumulator %= self.dt
+        else:
+            self._accumulator -= steps * self.dt
+
+        self.alpha = self._accumulator / self.dt
+        self.frames += 1
+        self.ticks += steps
+        return steps
+
+    def get_fps(self):
+        """Return the average frame rate over the last few frames."""
+        return self._clock.get_fps()
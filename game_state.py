@@ -0,0 +1,43 @@
+"""
+Module maintains the phases of a game in progress.
+Note: Losing a ship, moving to the next level and losing the game used to freeze the whole program with `sleep`.
+They are now timed phases counted down by the simulation steps, so events, rendering and audio keep running while the
+fleet regroups, and headless runs can set the delays to 0 to skip them entirely.
+"""
+
+
+class GameState:
+    """Current phase of the game in progress and the time left before it ends."""
+
+    PLAYING = "playing"  # The ship and the fleet move
+    SHIP_LOST = "ship_lost"  # The ship was hit, the fleet regroups when the phase ends
+    LEVEL_UP = "level_up"  # The fleet was destroyed, the next one appears when the phase ends
+    GAME_OVER = "game_over"  # The last ship was hit, the game stops when the phase ends
+
+    def __init__(self):
+        """Initialize the state in the playing phase."""
+        self.phase = GameState.PLAYING
+        self.remaining = 0.0  # Seconds of game time left in the phase
+
+    def enter(self, phase, duration=0.0):
+        """
+        Switch to a new phase.
+        :param phase: One of the phase constants.
+        :param duration: Seconds of game time before the phase ends, ignored when playing.
+        """
+        self.phase = phase
+        self.remaining = duration
+
+    def advance(self, dt):
+        """
+        Count down the phase by one simulation step.
+        :param dt: Seconds elapsed in this simulation step.
+        :return: True if the phase is over.
+        """
+        self.remaining -= dt
+        return self.remaining <= 0
+
+    @property
+    def playing(self):
+        """Return True if the ship and the fleet are moving."""
+        return self.phase == GameState.PLAYING
@@ -1,16 +1,15 @@
 """Module maintains the game statistics of alien invasion."""
 
-import json
+from score_store import create_score_store
 
 
 class GameStats:
     """Track statistics for Alien Invasion."""
 
-    HIGH_SCORE_FILE_NAME = "high_score.json"  # JSON file to record the highest score
-
     def __init__(self, ai_game):
         """Initialize statistics."""
         self.settings = ai_game.settings
+        self.store = create_score_store(ai_game)  # Saves scores in the background, nothing when headless
         self.ship_left = None  # Placeholder to let `ship_left` is defined in `__init__` explicitly
         self.score = None  # Placeholder
         self.level = None  # Placeholder
@@ -28,14 +27,17 @@ class GameStats:
         self.level = 1  # Game level
 
     def store_highest_score(self):
-        """Store the highest score to the JSON file."""
-        with open(GameStats.HIGH_SCORE_FILE_NAME, "w") as fp:
-            json.dump(self.highest_score, fp)
+        """Schedule the highest score to be saved, without waiting for the disk."""
+        self.store.submit_high_score(self.highest_score)
 
     def load_highest_score(self):
-        """Load the highest score from the JSON file."""
-        try:
-            with open(GameStats.HIGH_SCORE_FILE_NAME, "r") as fp:
-                self.highest_score = json.load(fp)
-        except FileNotFoundError:
-            self.highest_score = 0
+        """Load the highest score from the index of the store."""
+        self.highest_score = self.store.highest_score
+
+    def record_session(self, duration):
+        """
+        Schedule the session that just ended to be saved in the history.
+        :param duration: Seconds of game time the session lasted.
+        """
+        self.store.record_session({"score": self.score, "level": self.level, "duration": round(duration, 3),
+                                   "ships_used": self.settings.ship_limit + 1 - self.ship_left})
@@ -0,0 +1,24 @@
+"""
+Module maintains the player input state of Alien Invasion.
+Note: Whatever drives the game (keyboard, a scripted policy or a replay), its input is reduced to a bit mask of the
+actions currently held down. The game reacts to the transitions of that mask, so the same state sequence always
+produces the same game.
+"""
+
+# Bit flags of the actions the player can hold down
+MOVE_LEFT = 1 << 0
+MOVE_RIGHT = 1 << 1
+FIRE = 1 << 2  # A bullet is fired when the flag is pressed, like a key-press
+START = 1 << 3  # A new game starts when the flag is pressed
+
+ACTIONS = {"left": MOVE_LEFT, "right": MOVE_RIGHT, "fire": FIRE, "start": START}  # Map of action name to its flag
+
+
+def pressed(state, previous):
+    """Return the flags set in `state` that were not set in `previous`."""
+    return state & ~previous
+
+
+def released(state, previous):
+    """Return the flags set in `previous` that are no longer set in `state`."""
+    return previous & ~state
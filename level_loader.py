@@ -0,0 +1,229 @@
+"""
+Module maintains the data-driven levels of Alien Invasion.
+Note: Each level is a JSON file `levels/level_NNN.json` describing the fleet shape and the settings the level overrides,
+e.g. {"name": "Checkerboard", "shape": "checker", "settings": {"alien_points": 80}}. Settings a level doesn't override
+follow the speed and point curves of `Settings.increase_speed`, and levels past the last file repeat the last one.
+Overrides carry over to the next levels, but every new game starts again from the values the settings had before any
+level was applied.
+Files are only read when their level starts, and the spawn layout of each level is computed once as a packed array of
+coordinates, so starting a level is a single bulk placement. In dev mode, edited files are picked up without restarting.
+"""
+
+import json
+import os
+import re
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+from enemy_fire import PATTERNS
+
+FILE_PATTERN = re.compile(r"level_(\d+)\.json$")  # Name of the level files, numbered from 1
+SHAPES = ("grid", "checker", "pyramid", "diamond", "pattern")
+# Settings a level may override, the other ones are not part of the game balance
+LEVEL_SETTINGS = ("ship_speed", "bullet_speed", "alien_speed", "alien_points", "fleet_drop_speed", "speedup_scale",
+                  "score_point_scale", "alien_fire_rate", "alien_fire_pattern", "enemy_bullet_speed")
+INTEGER_SETTINGS = ("alien_points", "fleet_drop_speed")  # Level settings that are whole numbers, the others are reals
+
+
+class LevelError(Exception):
+    """Raised when a level file is invalid."""
+
+
+class Level:
+    """Fleet shape and settings of a single level."""
+
+    def __init__(self, number, spec, path=None):
+        """
+        Validate a level specification.
+        :param number: Number of the level file the specification comes from.
+        :param spec: Dictionary read from the level file.
+        :param path: Path of the level file, for error messages.
+        """
+        where = path or f"level {number}"
+        if not isinstance(spec, dict):
+            raise LevelError(f"{where}: expected an object of level properties, got {type(spec).__name__}")
+        self.number = number
+        self.name = spec.get("name", f"Level {number}")
+        self.shape = spec.get("shape", "grid")
+        if self.shape not in SHAPES:
+            raise LevelError(f"{where}: unknown shape {self.shape!r}, expected one of {', '.join(SHAPES)}")
+        self.pattern = spec.get("pattern", [])  # Rows of "X" (alien) and "." (empty slot) for the "pattern" shape
+        if not isinstance(self.pattern, list) or not all(isinstance(row, str) for row in self.pattern):
+            raise LevelError(f"{where}: expected a list of strings for the pattern, got {self.pattern!r}")
+        if self.shape == "pattern" and not any("X" in row for row in self.pattern):
+            raise LevelError(f"{where}: a pattern shape needs rows of 'X' and '.'")
+        self.columns = spec.get("columns")  # Max number of columns, None to fill the screen width
+        self.rows = spec.get("rows")  # Max number of rows, None to fill the space above the ship
+        for name in ("columns", "rows"):
+            value = getattr(self, name)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                raise LevelError(f"{where}: expected a positive whole number or null for {name}, got {value!r}")
+        self.settings = spec.get("settings", {})
+        if not isinstance(self.settings, dict):
+            raise LevelError(f"{where}: expected an object of setting names to values for the settings")
+        unknown = set(self.settings) - set(LEVEL_SETTINGS)
+        if unknown:
+            raise LevelError(f"{where}: settings {', '.join(sorted(unknown))} can't be set by a level")
+        for name, value in self.settings.items():
+            if name == "alien_fire_pattern":
+                continue
+            kind = int if name in INTEGER_SETTINGS else (int, float)
+            number = isinstance(value, kind) and not isinstance(value, bool)
+            if not number or value < 0 or (value == 0 and name != "alien_fire_rate"):  # Only a fleet may hold its fire
+                expected = "a positive whole number" if kind is int else "a positive number"
+                expected = "a number from 0" if name == "alien_fire_rate" else expected
+                raise LevelError(f"{where}: expected {expected} for {name}, got {value!r}")
+        pattern = self.settings.get("alien_fire_pattern", "straight")
+        if not isinstance(pattern, str) or pattern not in PATTERNS:  # Checked now rather than at the first volley
+            raise LevelError(f"{where}: unknown alien fire pattern {pattern!r}, expected one of {', '.join(PATTERNS)}")
+
+    def apply(self, settings):
+        """Override the settings of `settings` the level sets, any of `LEVEL_SETTINGS`, leaving the other ones as is."""
+        for name, value in self.settings.items():
+            setattr(settings, name, value)
+
+    def mask(self, slots_x, slots_y):
+        """
+        Return the boolean array of shape (rows, columns) of the slots holding an alien.
+        :param slots_x: Number of columns of aliens fitting the screen.
+        :param slots_y: Number of rows of aliens fitting the screen.
+        """
+        if self.shape == "pattern":
+            slots_y = min(slots_y, len(self.pattern))
+            slots_x = min(slots_x, max(len(row) for row in self.pattern))
+        num_x = min(slots_x, self.columns or slots_x)
+        num_y = min(slots_y, self.rows or slots_y)
+        idx_y, idx_x = np.mgrid[0:num_y, 0:num_x]
+
+        if self.shape == "checker":
+            return (idx_x + idx_y) % 2 == 0
+        if self.shape == "pyramid":  # One alien at the top, widening by two every row
+            return np.abs(2 * idx_x - (num_x - 1)) <= 2 * idx_y + 1
+        if self.shape == "diamond":
+            return np.abs(2 * idx_x - (num_x - 1)) / num_x + np.abs(2 * idx_y - (num_y - 1)) / num_y <= 1
+        if self.shape == "pattern":
+            return np.array([[x < len(row) and row[x] == "X" for x in range(num_x)] for row in self.pattern[:num_y]],
+                            dtype=bool).reshape(num_y, num_x)
+        return np.ones((num_y, num_x), dtype=bool)
+
+
+class LevelLoader:
+    """Lazy, cached access to the level files and the spawn layouts of their fleets."""
+
+    def __init__(self, ai_game, cache_size=8):
+        """
+        List the level files and measure the slots of the fleet, without reading any level yet.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        :param cache_size: Max number of levels and layouts kept in memory, for long campaigns.
+        """
+        settings = ai_game.settings
+        self.directory = settings.levels_directory
+        self.hot_reload = settings.level_hot_reload
+        self.cache_size = cache_size
+        self._paths = self._list()
+        self._levels = OrderedDict()  # Map of file number to (modification time, Level, layout), least recent first
+        self.loads = 0  # Number of level files read, to check levels are only read once
+        # Values of the settings levels may override before any level is applied, restored at the start of each game
+        self.base_settings = {name: getattr(settings, name) for name in LEVEL_SETTINGS}
+
+        # Space between each alien is equal to one alien width and height
+        self.alien_width, self.alien_height = ai_game.fleet.alien_width, ai_game.fleet.alien_height
+        available_space_x = settings.screen_width - 2 * self.alien_width  # Margin of an alien at left & right edges
+        self.slots_x = available_space_x // (2 * self.alien_width)
+        # We leave 2 aliens empty space above spaceship so the player has some time to shoot aliens
+        available_space_y = settings.screen_height - ai_game.ship.rect.height - 3 * self.alien_height
+        self.slots_y = available_space_y // (2 * self.alien_height)
+
+    def __len__(self):
+        """Return the number of level files, later levels repeat the last one."""
+        return len(self._paths)
+
+    def reset(self, settings):
+        """Restore the settings levels may override to their values before any level was applied."""
+        for name, value in self.base_settings.items():
+            setattr(settings, name, value)
+
+    def get(self, level):
+        """Return the `Level` played at game level `level`."""
+        return self._entry(level)[1]
+
+    def layout(self, level):
+        """Return the read-only array of shape (N, 2) of the top-left corner of each alien at game level `level`."""
+        return self._entry(level)[2]
+
+    def changed(self, level):
+        """Return True if the file of game level `level` was edited since it was read, always False without dev mode."""
+        if not self.hot_reload:
+            return False
+        number = self._number(level)
+        entry = self._levels.get(number)
+        return entry is not None and entry[0] != self._mtime(number)
+
+    def _entry(self, level):
+        """Helper to return the cached (modification time, Level, layout) of game level `level`, read if needed."""
+        number = self._number(level)
+        entry = self._levels.get(number)
+        if entry is not None and not self.changed(level):
+            self._levels.move_to_end(number)
+            return entry
+
+        try:
+            loaded = self._load(number)
+        except LevelError as error:
+            if entry is None:
+                raise
+            # Dev mode: keep playing the previous version until the file is fixed
+            print(f"Level file not reloaded: {error}", file=sys.stderr)
+            loaded = (self._mtime(number),) + entry[1:]
+        entry = self._levels[number] = loaded
+        if len(self._levels) > self.cache_size:
+            self._levels.popitem(last=False)  # Evict the least recently played level
+        return entry
+
+    def _load(self, number):
+        """Helper to read a level file and precompute the layout of its fleet."""
+        path = self._paths.get(number)
+        if path is None:
+            level, mtime = Level(number, {}), None  # No level files at all: a plain grid following the curves
+        else:
+            mtime = self._mtime(number)
+            with open(path, "r") as fp:
+                try:
+                    level = Level(number, json.load(fp), path)
+                except ValueError as error:
+                    raise LevelError(f"{path}: {error}") from error
+            self.loads += 1
+
+        mask = level.mask(self.slots_x, self.slots_y)
+        idx_y, idx_x = np.nonzero(mask)
+        idx_x = idx_x + (self.slots_x - mask.shape[1]) // 2  # Center fleets narrower than the screen
+        layout = np.column_stack((self.alien_width + idx_x * 2 * self.alien_width,
+                                  self.alien_height + idx_y * 2 * self.alien_height)).astype(float)
+        layout.flags.writeable = False  # Shared by every spawn of the level
+        return mtime, level, layout
+
+    def _number(self, level):
+        """Helper to return the number of the file describing game level `level`."""
+        if level in self._paths:
+            return level
+        if self.hot_reload:
+            self._paths = self._list()  # New files may have been added
+        return max((number for number in self._paths if number <= level), default=0)
+
+    def _list(self):
+        """Helper to map the number of each level file to its path, without reading them."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return {}
+        matches = (FILE_PATTERN.match(name) for name in names)
+        return {int(match.group(1)): os.path.join(self.directory, match.group(0)) for match in matches if match}
+
+    def _mtime(self, number):
+        """Helper to return the modification time of a level file."""
+        try:
+            return os.stat(self._paths[number]).st_mtime_ns
+        except (KeyError, FileNotFoundError):
+            return None
@@ -0,0 +1,152 @@
+"""
+Module maintains the explosion particles of Alien Invasion.
+Note: Particles live in preallocated NumPy arrays used as a ring buffer. Bursts are written at the ring cursor, so the
+slots about to be overwritten always hold the oldest particles: the hard cap evicts oldest first without any search.
+All particles move, slow down and age in one vectorized step per frame, and are drawn with a single batched `blits` of
+tiny pre-rendered squares, faded toward the background color in a few steps instead of per-pixel alpha blending.
+"""
+
+import numpy as np
+import pygame
+
+# Colors of the particles of each kind of explosion, one is picked at random for every particle
+PALETTES = {
+    "alien": ((60, 160, 60), (120, 200, 80), (240, 200, 60)),
+    "ship": ((80, 80, 90), (230, 120, 40), (250, 220, 90)),
+}
+FADE_STEPS = 4  # Number of pre-rendered shades of each color from full color to almost the background
+
+
+class NullParticleSystem:
+    """Particle system drawing nothing, used by headless games."""
+
+    count = 0  # Number of live particles
+
+    def burst(self, centers, kind, count):
+        """Do nothing."""
+
+    def update(self, dt):
+        """Do nothing."""
+
+    def clear(self):
+        """Do nothing."""
+
+    def scene(self):
+        """Return nothing to draw."""
+        return []
+
+
+class ParticleSystem(NullParticleSystem):
+    """Fixed-capacity ring buffer of particles with vectorized update and batched drawing."""
+
+    def __init__(self, ai_game):
+        """
+        Preallocate the particle arrays and render the particle shades.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        settings = ai_game.settings
+        self.settings = settings
+        self.capacity = settings.particle_limit
+        self.rng = np.random.default_rng(settings.seed)  # Separate from the game randomness, particles are cosmetic
+        self.cursor = 0  # Next slot to write, always holding the oldest particle once the ring wrapped around
+        self.count = 0  # Number of live particles
+        self.evicted = 0  # Number of particles overwritten before the end of their life
+
+        capacity = self.capacity
+        self.x = np.zeros(capacity)  # Position of the center of each particle
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)  # Velocity of each particle in pixels per second
+        self.vy = np.zeros(capacity)
+        self.age = np.zeros(capacity)  # Seconds since each particle was emitted
+        self.life = np.zeros(capacity)  # Seconds each particle lives, 0 for free slots
+        self.color = np.zeros(capacity, dtype=np.intp)  # Index of the color of each particle in `_shades`
+
+        # Shades of every palette color, indexed by color then fade step
+        size = settings.particle_size
+        self._colors = {}  # Map of palette name to the array of its color indices
+        self._shades = []
+        for name, palette in PALETTES.items():
+            self._colors[name] = np.arange(len(self._shades), len(self._shades) + len(palette))
+            for color in palette:
+                self._shades.append([self._shade(color, settings.bg_color, step, size) for step in range(FADE_STEPS)])
+        self._rects = [pygame.Rect(0, 0, size, size) for _ in range(capacity)]  # Reused for drawing
+
+    def burst(self, centers, kind, count):
+        """
+        Emit `count` particles from each center, all at once however many centers there are.
+        :param centers: Array-like of shape (N, 2) of the (x, y) centers of the explosions.
+        :param kind: Name of the palette in `PALETTES`, e.g. "alien".
+        :param count: Number of particles per explosion.
+        """
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        total = min(len(centers) * count, self.capacity)
+        if not total:
+            return
+        slots = (self.cursor + np.arange(total)) % self.capacity
+        self.evicted += int(np.count_nonzero(self.age[slots] < self.life[slots]))
+        self.cursor = int(slots[-1] + 1) % self.capacity
+
+        settings, rng = self.settings, self.rng
+        origins = np.repeat(centers, count, axis=0)[-total:]  # Keep the last explosions if they don't all fit
+        angle = rng.uniform(0.0, 2 * np.pi, total)
+        speed = rng.uniform(0.2, 1.0, total) * settings.particle_speed
+        self.x[slots] = origins[:, 0]
+        self.y[slots] = origins[:, 1]
+        self.vx[slots] = np.cos(angle) * speed
+        self.vy[slots] = np.sin(angle) * speed
+        self.age[slots] = 0.0
+        self.life[slots] = rng.uniform(0.5, 1.0, total) * settings.particle_life
+        self.color[slots] = rng.choice(self._colors[kind], total)
+
+    def update(self, dt):
+        """
+        Move, slow down and age every particle in one vectorized step.
+        :param dt: Seconds elapsed since the previous update, typically a whole frame.
+        """
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        drag = max(0.0, 1.0 - self.settings.particle_drag * dt)
+        self.vx *= drag
+        self.vy *= drag
+        self.age += dt
+        self.count = int(np.count_nonzero(self.age < self.life))
+
+    def clear(self):
+        """Remove every particle."""
+        self.life[:] = 0.0
+        self.count = 0
+
+    def scene(self):
+        """Return the list of (surface, rect) pairs of the live particles."""
+        if not self.count:
+            return []
+        live = np.flatnonzero(self.age < self.life)
+        half = self.settings.particle_size // 2
+        left = (self.x[live] - half).astype(int).tolist()
+        top = (self.y[live] - half).astype(int).tolist()
+        fade = np.minimum(self.age[live] / self.life[live] * FADE_STEPS, FADE_STEPS - 1).astype(int).tolist()
+        shades, rects = self._shades, self._rects
+        items = []
+        for slot, color, step, x, y in zip(live.tolist(), self.color[live].tolist(), fade, left, top):
+            rect = rects[slot]
+            rect.topleft = (x, y)
+            items.append((shades[color][step], rect))
+        return items
+
+    @staticmethod
+    def _shade(color, background, step, size):
+        """Helper to render a particle of `color` blended toward `background` by `step` of the fade steps."""
+        weight = step / FADE_STEPS
+        surface = pygame.Surface((size, size))
+        surface.fill(tuple(round(c + (b - c) * weight) for c, b in zip(color, background)))
+        return surface
+
+
+def create_particles(ai_game):
+    """
+    Return the particle system of the game, which draws nothing when headless or disabled by `Settings.particles`.
+    :param ai_game: Reference to the current instance of `AlienInvasion` class.
+    """
+    if ai_game.headless or not ai_game.settings.particles:
+        return NullParticleSystem()
+    return ParticleSystem(ai_game)
@@ -0,0 +1,66 @@
+"""
+Module maintains the sprite pools of Alien Invasion.
+Note: Bullets are fired and destroyed many times per second and the fleet is rebuilt on every level-up and ship loss.
+Instead of allocating sprites (and their rects) each time, a pool keeps released sprites on a free list and resets them
+in place when they are acquired again, so the frame loop produces no garbage for the collector to pause on.
+"""
+
+
+class SpritePool:
+    """Free list of sprites of one kind, which also keeps them in a group while they are in use."""
+
+    def __init__(self, factory, group):
+        """
+        Initialize an empty pool.
+        :param factory: Function returning a new sprite, called only when the free list is empty.
+        :param group: Group holding the sprites in use. Pooled sprites must implement `reset(*args)`.
+        """
+        self._factory = factory
+        self.group = group
+        self.live = []  # Sprites handed out and not released yet
+        self._free = []  # Released sprites ready for reuse
+        self.created = 0  # Number of sprites allocated by the factory
+        self.reused = 0  # Number of allocations avoided by reusing a released sprite
+
+    def acquire(self, *args):
+        """Return a sprite reset with `args`, reusing a released one if possible, and add it to the group."""
+        if self._free:
+            sprite = self._free.pop()
+            self.reused += 1
+        else:
+            sprite = self._factory()
+            self.created += 1
+        sprite.reset(*args)
+        sprite.add(self.group)
+        self.live.append(sprite)
+        return sprite
+
+    def release_where(self, predicate):
+        """
+        Release the sprites in use for which `predicate(sprite)` is true, compacting the live list in place.
+        :return: Number of sprites released.
+        """
+        live = self.live
+        kept = 0
+        for sprite in live:
+            if predicate(sprite):
+                sprite.kill()
+                self._free.append(sprite)
+            else:
+                live[kept] = sprite
+                kept += 1
+        released = len(live) - kept
+        del live[kept:]
+        return released
+
+    def release_all(self):
+        """Release every sprite in use."""
+        for sprite in self.live:
+            sprite.kill()
+        self._free.extend(self.live)
+        self.live.clear()
+
+    def stats(self):
+        """Return a dictionary of the pool counters."""
+        return {"live": len(self.live), "free": len(self._free), "created": self.created,
+                "allocations_avoided": self.reused}
@@ -0,0 +1,211 @@
+"""
+Module maintains the per-frame profiler of Alien Invasion.
+Note: Call sites wrap each phase of the frame in `start()` / `stop(phase)`. Times are exclusive: a phase nested in
+another (e.g. HUD preparation inside collision handling) is subtracted from its parent. The last `capacity` frames are
+kept in fixed-size ring buffers, and `NullProfiler` replaces the profiler when disabled so the instrumentation costs a
+couple of no-op calls per phase.
+"""
+
+import csv
+import json
+import sys
+from array import array
+from time import perf_counter_ns
+
+from assets import assets
+
+# Phases of a frame, in the order they run
+PHASES = ("events", "wait", "ship", "bullets", "collision", "hud", "audio", "aliens", "enemy_fire", "particles",
+          "render")
+# Columns of the exported frames
+COLUMNS = ("frame", "start_ns", "frame_ns") + PHASES + ("bullet_count", "alien_count", "allocations")
+
+
+class NullProfiler:
+    """Profiler that records nothing, used when profiling is disabled."""
+
+    enabled = False
+
+    def start(self):
+        """Do nothing."""
+
+    def stop(self, phase):
+        """Do nothing."""
+
+    def begin_frame(self):
+        """Do nothing."""
+
+    def end_frame(self, ai_game):
+        """Do nothing."""
+
+    def scene(self):
+        """Return nothing to draw."""
+        return []
+
+    def toggle_overlay(self):
+        """Do nothing."""
+
+    def export(self, path):
+        """Do nothing."""
+
+
+class FrameProfiler(NullProfiler):
+    """Ring buffers of per-phase frame times, sprite counts and allocations."""
+
+    enabled = True
+
+    def __init__(self, capacity=600, overlay=True):
+        """
+        Initialize the ring buffers.
+        :param capacity: Number of most recent frames kept.
+        :param overlay: Whether to draw the statistics overlay on screen.
+        """
+        self.capacity = capacity
+        self.overlay = overlay
+        self.frames = 0  # Number of frames recorded since the start
+        self._phases = {phase: array("q", bytes(8 * capacity)) for phase in PHASES}  # Exclusive ns per frame
+        self._frame_start = array("q", bytes(8 * capacity))  # Time stamp of each frame start in ns
+        self._frame_time = array("q", bytes(8 * capacity))  # Time of each frame in ns, excluding the "wait" phase
+        self._bullets = array("l", bytes(array("l").itemsize * capacity))  # Number of bullets drawn in each frame
+        self._aliens = array("l", bytes(array("l").itemsize * capacity))  # Number of aliens drawn in each frame
+        self._allocations = array("q", bytes(8 * capacity))  # Change of allocated memory blocks in each frame
+
+        self._current = dict.fromkeys(PHASES, 0)  # Exclusive ns of each phase in the current frame
+        self._starts = []  # Stack of start time stamps of the phases being timed
+        self._children = []  # Stack of the time spent in nested phases, to subtract from their parent
+        self._begin = 0  # Time stamp of the current frame start
+        self._blocks = 0  # Allocated memory blocks at the current frame start
+
+        self._font = None  # Font of the overlay, created on first use
+        self._overlay_items = []  # (surface, rect) pairs of the overlay
+
+    def start(self):
+        """Start timing a phase."""
+        self._starts.append(perf_counter_ns())
+        self._children.append(0)
+
+    def stop(self, phase):
+        """Stop timing the phase most recently started, and account it to `phase`."""
+        elapsed = perf_counter_ns() - self._starts.pop()
+        self._current[phase] += elapsed - self._children.pop()
+        if self._children:
+            self._children[-1] += elapsed
+
+    def begin_frame(self):
+        """Mark the start of a frame."""
+        self._begin = perf_counter_ns()
+        self._blocks = sys.getallocatedblocks()
+
+    def end_frame(self, ai_game):
+        """
+        Mark the end of a frame and store its measurements in the ring buffers.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        index = self.frames % self.capacity
+        current = self._current
+        for phase in PHASES:
+            self._phases[phase][index] = current[phase]
+            current[phase] = 0
+        self._frame_start[index] = self._begin
+        self._frame_time[index] = perf_counter_ns() - self._begin - self._phases["wait"][index]
+        self._bullets[index] = len(ai_game.bullets)
+        self._aliens[index] = len(ai_game.aliens)
+        self._allocations[index] = sys.getallocatedblocks() - self._blocks
+        self.frames += 1
+
+        if self.overlay and self.frames % 15 == 0:  # Refresh the overlay a few times per second
+            self._prep_overlay(ai_game)
+
+    def summary(self):
+        """Return a dictionary of statistics over the frames in the ring buffers."""
+        count = min(self.frames, self.capacity)
+        if not count:
+            return {"frames": 0}
+        frame_times = sorted(self._frame_time[:count])
+        first = self._frame_start[(self.frames - count) % self.capacity]
+        last = self._frame_start[(self.frames - 1) % self.capacity]
+        return {
+            "frames": count,
+            "fps": (count - 1) * 1e9 / (last - first) if last > first else 0.0,
+            "frame_ms_p50": frame_times[count // 2] / 1e6,
+            "frame_ms_p99": frame_times[min(count - 1, count * 99 // 100)] / 1e6,
+            "phase_ms_mean": {phase: sum(self._phases[phase][:count]) / count / 1e6 for phase in PHASES},
+            "allocations_mean": sum(self._allocations[:count]) / count,
+        }
+
+    def scene(self):
+        """Return the list of (surface, rect) pairs to draw the overlay."""
+        return self._overlay_items if self.overlay else []
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay."""
+        self.overlay = not self.overlay
+
+    def export(self, path):
+        """
+        Write the frames in the ring buffers to `path`, as CSV if it ends with ".csv", as Chrome trace events if it
+        ends with ".trace.json" (open it in chrome://tracing or Perfetto) and as JSON otherwise.
+        """
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as fp:
+                writer = csv.writer(fp)
+                writer.writerow(COLUMNS)
+                writer.writerows(self._rows())
+        elif path.endswith(".trace.json"):
+            with open(path, "w") as fp:
+                json.dump({"traceEvents": self._trace_events(), "displayTimeUnit": "ms"}, fp)
+        else:
+            with open(path, "w") as fp:
+                json.dump({"summary": self.summary(), "frames": [dict(zip(COLUMNS, row)) for row in self._rows()]}, fp)
+
+    def _rows(self):
+        """Helper to yield one tuple of measurements per recorded frame, oldest first."""
+        for frame in range(max(0, self.frames - self.capacity), self.frames):
+            index = frame % self.capacity
+            yield ((frame, self._frame_start[index], self._frame_time[index])
+                   + tuple(self._phases[phase][index] for phase in PHASES)
+                   + (self._bullets[index], self._aliens[index], self._allocations[index]))
+
+    def _trace_events(self):
+        """Helper to lay out the phases of each frame back to back as Chrome trace complete events."""
+        events = []
+        for row in self._rows():
+            frame, start = row[0], row[1]
+            ts = start / 1e3  # Trace time stamps are in microseconds
+            events.append({"name": "frame", "ph": "X", "ts": ts, "dur": row[2] / 1e3, "pid": 1, "tid": 1,
+                           "args": dict(zip(COLUMNS[-3:], row[-3:]), frame=frame)})
+            for phase, duration in zip(PHASES, row[3:3 + len(PHASES)]):
+                if duration:
+                    events.append({"name": phase, "ph": "X", "ts": ts, "dur": duration / 1e3, "pid": 1, "tid": 2})
+                    ts += duration / 1e3
+        return events
+
+    def _prep_overlay(self, ai_game):
+        """Helper to render the statistics overlay at the bottom left of the screen."""
+        if self._font is None:
+            self._font = assets.font(None, 22)
+        summary = self.summary()
+        lines = [f"FPS {summary['fps']:.0f}  frame p50 {summary['frame_ms_p50']:.2f} ms  "
+                 f"p99 {summary['frame_ms_p99']:.2f} ms  allocs {summary['allocations_mean']:.0f}",
+                 f"bullets {len(ai_game.bullets)}  aliens {len(ai_game.aliens)}"]
+        latency = ai_game.controls.latency_summary()
+        if latency["samples"]:
+            lines.append(f"input latency p50 {latency['ms_p50']:.1f} ms  p95 {latency['ms_p95']:.1f} ms")
+        lines.extend(f"{phase:>9} {ms:.3f} ms" for phase, ms in summary["phase_ms_mean"].items())
+
+        screen_rect = ai_game.screen.get_rect()
+        top = screen_rect.bottom - 10 - len(lines) * self._font.get_linesize()
+        self._overlay_items = []
+        for line in lines:
+            surface = self._font.render(line, True, (200, 30, 30))
+            rect = surface.get_rect(left=10, top=top)
+            self._overlay_items.append((surface, rect))
+            top = rect.bottom
+
+
+def create_profiler(ai_game):
+    """
+    Return the profiler selected by `Settings.profile`.
+    :param ai_game: Reference to the current instance of `AlienInvasion` class.
+    """
+    return FrameProfiler() if ai_game.settings.profile else NullProfiler()
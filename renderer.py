@@ -0,0 +1,122 @@
+"""
+Module maintains the renderers that present the game scene to the display.
+Note: A scene is the list of (surface, rect) pairs to draw in order. `FullRenderer` repaints and flips the whole screen
+every frame, while `DirtyRenderer` compares the scene with the previous frame and only repaints and pushes the regions
+where something moved, appeared or disappeared, falling back to a full redraw when too many regions changed (e.g. an
+explosion of particles). Both count the pixels pushed to the display so they can be compared.
+"""
+
+import pygame
+
+
+class FullRenderer:
+    """Redraw the whole screen and flip it every frame."""
+
+    def __init__(self, ai_game):
+        """
+        Initialize the renderer.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        self.screen = ai_game.display  # Scenes are drawn on the display, already mapped to its resolution
+        self.settings = ai_game.settings
+        self.pixels_pushed = 0  # Number of pixels pushed to the display by the last frame
+        self.total_pixels_pushed = 0  # Number of pixels pushed since the start
+        self.frames_presented = 0  # Number of frames pushed to the display
+        self.frames_skipped = 0  # Number of frames that didn't need to be presented
+
+    def render(self, scene):
+        """
+        Draw the scene on a cleared screen and make it visible.
+        :param scene: List of (surface, rect) pairs to draw in order.
+        """
+        self.screen.fill(self.settings.bg_color)  # Draw screen background color
+        self.screen.blits(scene, doreturn=False)
+        pygame.display.flip()  # Make the most recently drawn screen visible
+        self._count(self.screen.get_width() * self.screen.get_height())
+
+    def invalidate(self):
+        """Nothing to do since every frame is drawn from scratch."""
+
+    def _count(self, pixels):
+        """Helper to update the presentation counters."""
+        self.pixels_pushed = pixels
+        self.total_pixels_pushed += pixels
+        if pixels:
+            self.frames_presented += 1
+        else:
+            self.frames_skipped += 1
+
+
+class DirtyRenderer(FullRenderer):
+    """Only repaint and update the screen regions that changed since the previous frame."""
+
+    def __init__(self, ai_game):
+        """Initialize the renderer and its memory of the previous frame."""
+        super().__init__(ai_game)
+        self._last_items = {}  # Map of (surface id, rect) to (surface, rect) drawn by the previous frame
+        self._full_redraw = True  # Next frame must paint the whole screen, e.g. the first one
+
+    def render(self, scene):
+        """
+        Repaint the damaged regions of the screen and push only those to the display.
+        :param scene: List of (surface, rect) pairs to draw in order.
+        """
+        # Keying by the surface object catches re-rendered text at an unchanged position. The previous surfaces are
+        # kept alive in `_last_items`, so their ids can't be reused by a new surface.
+        items = {(id(surface), tuple(rect)): (surface, rect) for surface, rect in scene}
+        last_items = self._last_items
+        self._last_items = items
+
+        if self._full_redraw:
+            self._full_redraw = False
+            super().render(scene)
+            return
+
+        dirty_rects = [pygame.Rect(key[1]) for key in last_items if key not in items]  # Vacated regions
+        dirty_rects.extend(pygame.Rect(key[1]) for key in items if key not in last_items)  # Newly drawn regions
+        if not dirty_rects:  # Nothing changed, e.g. the idle menu: skip drawing and presenting
+            self._count(0)
+            return
+        if len(dirty_rects) > self.settings.dirty_rect_limit:
+            # Repainting each region costs a search of the whole scene, quadratic in the number of moving sprites,
+            # while a full redraw is linear: past the limit it is cheaper to redraw the whole frame
+            super().render(scene)
+            return
+
+        # Repaint each damaged region from the background up, clipped to the region, so neighbours overlapping it
+        # (e.g. anti-aliased text) are restored exactly instead of being blended over themselves
+        scene_rects = [rect for _, rect in scene]
+        for dirty_rect in dirty_rects:
+            self.screen.set_clip(dirty_rect)
+            self.screen.fill(self.settings.bg_color)
+            self.screen.blits([scene[i] for i in dirty_rect.collidelistall(scene_rects)], doreturn=False)
+        self.screen.set_clip(None)
+
+        screen_rect = self.screen.get_rect()
+        dirty_rects = [rect.clip(screen_rect) for rect in dirty_rects]
+        pygame.display.update(dirty_rects)
+        self._count(sum(rect.width * rect.height for rect in dirty_rects))
+
+    def invalidate(self):
+        """Force the next frame to repaint the whole screen, e.g. after the display was re-created."""
+        self._full_redraw = True
+
+
+class NullRenderer(FullRenderer):
+    """Draw nothing, for headless games that are never looked at."""
+
+    def render(self, scene):
+        """Skip the frame."""
+        self._count(0)
+
+
+def create_renderer(ai_game):
+    """
+    Return the renderer selected by `Settings.renderer`.
+    :param ai_game: Reference to the current instance of `AlienInvasion` class.
+    """
+    renderers = {"full": FullRenderer, "dirty": DirtyRenderer}
+    try:
+        return renderers[ai_game.settings.renderer](ai_game)
+    except KeyError:
+        raise ValueError(f"Unknown renderer {ai_game.settings.renderer!r}, expect one of {sorted(renderers)}") from None
@@ -0,0 +1,187 @@
+"""
+Module maintains the replay files of Alien Invasion sessions.
+Note: Since the simulation runs on fixed steps and all randomness is seeded, a session is fully described by its initial
+settings and the ticks at which the player input state changed. The file layout is:
+    header: magic b"AIRP", version byte, varint length of the zlib-compressed settings JSON, the compressed JSON
+    records: varint ticks since the previous record, then the input state byte
+    footer: a record of 0 ticks with the END state, then varints of the total number of ticks, final score and level
+A session of a few minutes takes a few kilobytes, so every session can be kept.
+"""
+
+import json
+import sys
+import zlib
+from time import perf_counter
+
+from settings import Settings
+
+MAGIC = b"AIRP"
+VERSION = 1
+END = 0xFF  # State of the footer record, real input states only use the low bits
+
+
+class ReplayError(Exception):
+    """Raised when a replay file is invalid or doesn't reproduce the recorded session."""
+
+
+def _encode_varint(value):
+    """Helper to encode a non-negative integer as LEB128 bytes."""
+    data = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            data.append(byte | 0x80)
+        else:
+            data.append(byte)
+            return bytes(data)
+
+
+def _read_varint(fp):
+    """Helper to read a LEB128 integer from the binary file `fp`."""
+    value, shift = 0, 0
+    while True:
+        byte = fp.read(1)
+        if not byte:
+            raise ReplayError("Truncated replay file")
+        value |= (byte[0] & 0x7F) << shift
+        shift += 7
+        if not byte[0] & 0x80:
+            return value
+
+
+def settings_to_dict(settings):
+    """Return the attributes of `settings` as a JSON compatible dictionary."""
+    return dict(vars(settings))
+
+
+def settings_from_dict(values):
+    """Return a new `Settings` instance with the attributes in `values`, e.g. read from a replay header."""
+    settings = Settings()
+    for name, value in values.items():
+        if hasattr(settings, name):
+            setattr(settings, name, tuple(value) if isinstance(value, list) else value)
+    return settings
+
+
+class ReplayWriter:
+    """Stream the input state transitions of a session to a replay file."""
+
+    def __init__(self, path, settings):
+        """
+        Open the replay file and write its header.
+        :param path: Path of the replay file to create.
+        :param settings: Instance of `Settings` the session starts with.
+        """
+        self._fp = open(path, "wb", buffering=64 * 1024)  # Buffered so that recording never waits on the disk
+        self._last_tick = 0
+        header = zlib.compress(json.dumps(settings_to_dict(settings)).encode())
+        self._fp.write(MAGIC + bytes((VERSION,)) + _encode_varint(len(header)) + header)
+
+    def record(self, tick, state):
+        """
+        Record that the input state became `state` before the simulation step `tick`.
+        :param tick: Number of simulation steps run so far.
+        :param state: New bit mask of the `inputs` flags held down.
+        """
+        self._fp.write(_encode_varint(tick - self._last_tick) + bytes((state,)))
+        self._last_tick = tick
+
+    def close(self, ticks, stats):
+        """
+        Write the footer and close the file.
+        :param ticks: Total number of simulation steps of the session.
+        :param stats: Instance of `GameStats` holding the final score and level.
+        """
+        if self._fp.closed:
+            return
+        self._fp.write(_encode_varint(0) + bytes((END,)) + _encode_varint(ticks) + _encode_varint(int(stats.score))
+                       + _encode_varint(stats.level))
+        self._fp.close()
+
+
+class Replay:
+    """Content of a replay file."""
+
+    def __init__(self, settings, records, ticks, score, level):
+        """
+        :param settings: Dictionary of the initial settings attributes.
+        :param records: List of (tick, input state) pairs in order.
+        :param ticks: Total number of simulation steps.
+        :param score: Final score of the session.
+        :param level: Final level of the session.
+        """
+        self.settings = settings
+        self.records = records
+        self.ticks = ticks
+        self.score = score
+        self.level = level
+
+    @classmethod
+    def load(cls, path):
+        """Read the replay file at `path`."""
+        with open(path, "rb") as fp:
+            if fp.read(len(MAGIC)) != MAGIC:
+                raise ReplayError(f"{path} is not a replay file")
+            version = fp.read(1)
+            if not version or version[0] != VERSION:
+                raise ReplayError(f"Unsupported replay version in {path}")
+            settings = json.loads(zlib.decompress(fp.read(_read_varint(fp))))
+
+            records, tick = [], 0
+            while True:
+                if not fp.peek(1):
+                    raise ReplayError(f"{path} has no footer, the session didn't end cleanly")
+                tick += _read_varint(fp)
+                state = fp.read(1)
+                if not state:
+                    raise ReplayError("Truncated replay file")
+                if state[0] == END:
+                    return cls(settings, records, _read_varint(fp), _read_varint(fp), _read_varint(fp))
+                records.append((tick, state[0]))
+
+    def play(self):
+        """
+        Re-drive a headless game with the recorded inputs as fast as possible.
+        :return: The finished `Simulation`.
+        """
+        from simulation import Simulation  # Imported here since the game itself imports this module
+
+        settings = settings_from_dict(self.settings)
+        settings.replay_path = None  # Don't record the replay itself
+        simulation = Simulation(settings, seed=settings.seed, policy=None, max_seconds=float("inf"),
+                                skip_pauses=False)  # Pauses are part of the recorded timeline
+        game = simulation.game
+        records = iter(self.records)
+        record = next(records, None)
+        for tick in range(self.ticks + 1):
+            while record is not None and record[0] == tick:
+                game.set_input_state(record[1])
+                record = next(records, None)
+            if tick < self.ticks:
+                game._tick(simulation.dt)
+        return simulation
+
+    def verify(self):
+        """Play the replay and raise `ReplayError` unless it ends with the recorded score and level."""
+        stats = self.play().game.stats
+        if (stats.score, stats.level) != (self.score, self.level):
+            raise ReplayError(f"Replay ended with score {stats.score} at level {stats.level}, "
+                              f"expected score {self.score} at level {self.level}")
+
+
+def main(argv=None):
+    """Verify the replay files given on the command line and report how fast they played."""
+    paths = sys.argv[1:] if argv is None else argv
+    for path in paths:
+        replay = Replay.load(path)
+        start = perf_counter()
+        replay.verify()
+        elapsed = perf_counter() - start
+        game_seconds = replay.ticks / replay.settings["tick_rate"]
+        print(f"{path}: score {replay.score} level {replay.level} OK, {game_seconds:.1f}s of play replayed in "
+              f"{elapsed:.2f}s ({game_seconds / elapsed:.0f}x real time)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Module maintains the persistent high score and session history of Alien Invasion.
+Note: The frame loop only hands updates over to a background writer thread. The writer coalesces bursts of high score
+updates into one write per `Settings.save_interval`, replaces the index file atomically (write a temporary file, fsync,
+rename) and appends finished sessions to an append-only log, one JSON line each, fsynced. A crash loses at most the
+last interval, and a torn last line of the log is skipped when it is read back. The index holds the highest score and
+the top sessions only, so startup never reads the history.
+"""
+
+import atexit
+import json
+import os
+import threading
+
+INDEX_FILE_NAME = "high_score.json"  # Compact index: highest score and leaderboard
+HISTORY_FILE_NAME = "sessions.jsonl"  # Append-only log of every finished session
+
+
+def _write_atomic(path, data):
+    """Helper to replace the file at `path` with `data`, so that it's never seen half-written even after a crash."""
+    temporary = path + ".tmp"
+    with open(temporary, "w") as fp:
+        fp.write(data)
+        fp.flush()
+        os.fsync(fp.fileno())
+    os.replace(temporary, path)
+
+
+def _read_index(path):
+    """Helper to read the index file, which older versions wrote as a bare highest score."""
+    try:
+        with open(path, "r") as fp:
+            index = json.load(fp)
+    except (FileNotFoundError, ValueError):
+        return {"highest_score": 0, "sessions": 0, "top": []}
+    if not isinstance(index, dict):
+        return {"highest_score": index, "sessions": 0, "top": []}
+    return index
+
+
+class NullScoreStore:
+    """Store that keeps nothing on disk, used by headless simulations."""
+
+    def __init__(self):
+        """Initialize an empty leaderboard."""
+        self.highest_score = 0
+        self.top = []
+
+    def submit_high_score(self, score):
+        """Do nothing."""
+
+    def record_session(self, session):
+        """Do nothing."""
+
+    def leaderboard(self, count=10):
+        """Return no sessions."""
+        return []
+
+    def history(self):
+        """Return no sessions."""
+        return iter(())
+
+    def close(self):
+        """Do nothing."""
+
+
+class ScoreStore(NullScoreStore):
+    """Index and session log on disk, written by a background thread."""
+
+    def __init__(self, directory=".", save_interval=1.0, leaderboard_size=10):
+        """
+        Read the index and start the writer thread.
+        :param directory: Directory holding the index and the session log.
+        :param save_interval: Min seconds between two writes, updates in between are coalesced.
+        :param leaderboard_size: Number of top sessions kept in the index.
+        """
+        super().__init__()
+        self.index_path = os.path.join(directory, INDEX_FILE_NAME)
+        self.history_path = os.path.join(directory, HISTORY_FILE_NAME)
+        self.save_interval = save_interval
+        self.leaderboard_size = leaderboard_size
+
+        index = _read_index(self.index_path)
+        self.highest_score = index["highest_score"]
+        self.sessions = index["sessions"]  # Number of sessions in the log
+        self.top = index["top"]  # Best sessions, highest score first
+        self.writes = 0  # Number of index writes, to check bursts are coalesced
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()  # Set when there is something to write
+        self._closing = threading.Event()  # Set to flush and stop the writer
+        self._dirty = False  # Whether the index changed since the last write
+        self._pending_sessions = []  # Sessions not appended to the log yet
+        self._thread = threading.Thread(target=self._run, name="score-store", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)  # Flush on a normal interpreter exit too
+
+    def submit_high_score(self, score):
+        """Schedule `score` to be saved if it beats the highest score. Never blocks on the disk."""
+        with self._lock:
+            if score > self.highest_score:
+                self.highest_score = score
+                self._dirty = True
+        self._wake.set()
+
+    def record_session(self, session):
+        """
+        Schedule a finished session to be appended to the log and ranked in the leaderboard.
+        :param session: Dictionary of "score", "level", "duration" and "ships_used".
+        """
+        with self._lock:
+            self._pending_sessions.append(session)
+            self.sessions += 1
+            self.highest_score = max(self.highest_score, session["score"])
+            self.top.append(session)
+            self.top.sort(key=lambda entry: entry["score"], reverse=True)
+            del self.top[self.leaderboard_size:]
+            self._dirty = True
+        self._wake.set()
+
+    def leaderboard(self, count=10):
+        """Return the `count` best sessions, highest score first, from the index if it keeps enough of them."""
+        with self._lock:
+            if count <= self.leaderboard_size:
+                return [dict(entry) for entry in self.top[:count]]
+        return sorted(self.history(), key=lambda entry: entry["score"], reverse=True)[:count]
+
+    def history(self):
+        """Yield every session recorded in the log, oldest first."""
+        try:
+            with open(self.history_path, "r") as fp:
+                for line in fp:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # Torn line written during a crash
+        except FileNotFoundError:
+            return
+
+    def close(self):
+        """Write everything still pending and stop the writer thread."""
+        if self._closing.is_set():
+            return
+        self._closing.set()
+        self._wake.set()
+        self._thread.join()
+
+    def _run(self):
+        """Helper run by the writer thread: wait for updates, let them pile up for an interval, then write them."""
+        while True:
+            self._wake.wait()
+            self._closing.wait(self.save_interval)  # Coalesce the burst, unless the game is closing
+            self._wake.clear()
+            self._flush()
+            if self._closing.is_set():
+                self._flush()  # Updates submitted while the last write was in progress
+                return
+
+    def _flush(self):
+        """Helper to append the pending sessions to the log and rewrite the index if it changed."""
+        with self._lock:
+            sessions, self._pending_sessions = self._pending_sessions, []
+            dirty, self._dirty = self._dirty, False
+            index = {"highest_score": self.highest_score, "sessions": self.sessions, "top": list(self.top)}
+        if sessions:
+            with open(self.history_path, "a") as fp:
+                fp.writelines(json.dumps(session) + "\n" for session in sessions)
+                fp.flush()
+                os.fsync(fp.fileno())
+        if dirty:
+            _write_atomic(self.index_path, json.dumps(index))
+            self.writes += 1
+
+
+def create_score_store(ai_game):
+    """
+    Return the store selected by `Settings.persist_scores`.
+    :param ai_game: Reference to the current instance of `AlienInvasion` class.
+    """
+    settings = ai_game.settings
+    if not settings.persist_scores:
+        return NullScoreStore()
+    return ScoreStore(settings.score_directory, settings.save_interval, settings.leaderboard_size)
+
+
+def main():
+    """Print the local leaderboard."""
+    from settings import Settings  # Imported here since the store itself doesn't depend on the settings
+
+    settings = Settings()
+    store = ScoreStore(settings.score_directory, settings.save_interval, settings.leaderboard_size)
+    print(f"Highest score {store.highest_score:,} over {store.sessions} sessions")
+    for rank, entry in enumerate(store.leaderboard(settings.leaderboard_size), 1):
+        print(f"{rank:>3}. {entry['score']:>10,}  level {entry['level']:>3}  {entry['duration']:>7.1f}s  "
+              f"{entry['ships_used']} ships")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
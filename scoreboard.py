@@ -1,9 +1,10 @@
 """Module maintains the scoreboard for Alien Invasion."""
 
-import pygame.font
 from pygame.sprite import Group
 
-from ship import Ship
+from assets import assets
+from entity import Icon
+from text_atlas import TextAtlas
 
 
 class Scoreboard:
@@ -19,13 +20,18 @@ class Scoreboard:
 
         # Font settings for scoring info
         self.text_color = (30, 30, 30)  # (R,G,B)
-        self.text_font = pygame.font.SysFont(None, 48)  # Default system font and font size = 48
+        self.text_font = assets.font(None, 48)  # Default font and font size = 48
+        self.text = TextAtlas(self.text_font, self.text_color)  # Glyphs and labels rendered once
 
         # Prepare the overall scoreboard
-        self.score_image, self.score_rect = None, None  # Placeholder
-        self.highest_score_image, self.highest_score_rect = None, None  # Placeholder
-        self.level_image, self.level_rect = None, None  # Placeholder
-        self.ships = None  # Placeholder
+        # Each text field is a list of (surface, rect) glyph blits and its bounding rect, re-laid out only when the
+        # displayed value changes
+        self.score_items, self.score_rect = [], None  # Placeholder
+        self.highest_score_items, self.highest_score_rect = [], None  # Placeholder
+        self.level_items, self.level_rect = [], None  # Placeholder
+        self._shown = {}  # Map of field name to the value it currently displays
+        self.ship_icons = []  # Life icons, created once and reused
+        self.ships = Group()  # Life icons currently displayed
         self.prep_scoreboard()
 
     def prep_scoreboard(self):
@@ -36,54 +42,63 @@ class Scoreboard:
         self.prep_ships_left()  # Prepare the number of ships left surface
 
     def prep_score(self):
-        """Turn the score into the rendered image."""
+        """Lay out the score from the glyph atlas."""
         rounded_score = round(self.stats.score, -1)  # `-1` means to round to the nearest 10, 100, 1000, and so on
-        score_str = f"Score: {rounded_score:,g}"  # Add comma separator for general number display
-        self.score_image = self.text_font.render(score_str, True, self.text_color)
-
-        # Display the score at the top right of the screen
-        self.score_rect = self.score_image.get_rect()
-        self.score_rect.right = self.screen_rect.right - 20  # Leave 20 margins at the right edge
-        self.score_rect.top = 20  # Leave 20 margins at the top edge
+        if not self._changed("score", rounded_score):
+            return
+        # Add comma separator for general number display
+        # Display the score at the top right of the screen: leave 20 margins at the right and top edges
+        self.score_items, self.score_rect = self.text.layout(
+            "Score: ", f"{rounded_score:,g}", right=self.screen_rect.right - 20, top=20)
 
     def prep_highest_score(self):
-        """Turn the highest score into the rendered image."""
+        """Lay out the highest score from the glyph atlas."""
         highest_score = round(self.stats.highest_score, -1)
-        highest_score_str = f"Highest Score: {highest_score:,g}"
-        self.highest_score_image = self.text_font.render(highest_score_str, True, self.text_color)
-
+        if not self._changed("highest_score", highest_score):
+            return
         # Create the highest score at the top of the screen
-        self.highest_score_rect = self.highest_score_image.get_rect()
-        self.highest_score_rect.centerx = self.screen_rect.centerx
-        self.highest_score_rect.top = self.score_rect.top
+        self.highest_score_items, self.highest_score_rect = self.text.layout(
+            "Highest Score: ", f"{highest_score:,g}", centerx=self.screen_rect.centerx, top=self.score_rect.top)
 
     def prep_level(self):
-        """Turn the game level into the rendered image."""
-        level_str = f"Level: {self.stats.level}"
-        self.level_image = self.text_font.render(level_str, True, self.text_color)
-        # Position the level below the current score
-        self.level_rect = self.level_image.get_rect()
-        self.level_rect.right = self.score_rect.right
-        self.level_rect.top = self.score_rect.bottom + 10  # 10 pixels below current score
+        """Lay out the game level from the glyph atlas."""
+        if not self._changed("level", self.stats.level):
+            return
+        # Position the level 10 pixels below the current score
+        self.level_items, self.level_rect = self.text.layout(
+            "Level: ", str(self.stats.level), right=self.score_rect.right, top=self.score_rect.bottom + 10)
 
     def prep_ships_left(self):
         """Show how many ships are left."""
-        self.ships = Group()
-        for i in range(self.stats.ship_left):
-            ship = Ship(self.ai_game)
-            ship.rect.x = 10 + ship.rect.width * i  # 10 pixel margins to the top left corner of the screen
-            ship.rect.y = 10
-            self.ships.add(ship)
-
-    def show_score(self):
-        """Draw score to the screen."""
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.highest_score_image, self.highest_score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self.ships.draw(self.screen)
+        image = assets.load_image("images/ship.bmp")  # The ship image, shared with the ship itself
+        while len(self.ship_icons) < self.stats.ship_left:  # Only create the icons never shown before
+            # 10 pixel margins to the top left corner
+            self.ship_icons.append(Icon(image, (10 + image.get_width() * len(self.ship_icons), 10)))
+        self.ships.empty()
+        for icon in self.ship_icons[:self.stats.ship_left]:
+            icon.add(self.ships)
+
+    def scene(self):
+        """Return the list of (surface, rect) pairs to draw the scoreboard."""
+        scene = self.score_items + self.highest_score_items + self.level_items
+        scene.extend((ship.image, ship.rect) for ship in self.ships.sprites())
+        return scene
+
+    def banner(self, message):
+        """Return the (surface, rect) pair of `message` centered on the screen, e.g. announcing the next level."""
+        image = self.text.render(message)
+        return image, image.get_rect(center=self.screen_rect.center)
 
     def check_high_score(self):
         """Check to see if there is new high score."""
         if self.stats.score > self.stats.highest_score:
             self.stats.highest_score = self.stats.score
             self.prep_highest_score()
+            self.stats.store_highest_score()  # Saved in the background, so a crash doesn't lose the record
+
+    def _changed(self, field, value):
+        """Helper to record the value displayed by `field`, returning False if it is already displayed."""
+        if self._shown.get(field) == value:
+            return False
+        self._shown[field] = value
+        return True
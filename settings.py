@@ -10,10 +10,35 @@ class Settings:
 
     def __init__(self):
         """Initialize game's static settings."""
-        # Screen settings
+        # Screen settings: logical resolution the game is laid out and simulated at, whatever the display size
         self.screen_width = 1200
         self.screen_height = 800
+        self.display_size = None  # Tuple of (width, height) of the window, None for the size of the screen settings
+        self.fullscreen = False  # Use the whole screen at its native resolution instead of a window
+        self.scale_mode = "smooth"  # "integer" to scale the screen to the display by a whole factor, or "smooth"
+        self.vsync = False  # Sync frames with the display refresh rate, on top of `fps_cap`
+        self.headless = False  # Play a simulated game without window or audio, see `simulation`
         self.bg_color = (230, 230, 230)  # (R,G,B)
+        self.renderer = "dirty"  # "dirty" to only repaint changed regions, or "full" to redraw every frame
+        self.dirty_rect_limit = 96  # Number of changed regions above which the dirty renderer redraws the whole frame
+
+        # Control settings: action name to the keys (pygame key names) or gamepad buttons bound to it, see `controls`
+        self.key_bindings = {"left": ("left",), "right": ("right",), "fire": ("space",), "start": ("p",),
+                             "quit": ("q", "escape"), "profiler": ("f3",)}
+        self.gamepad_bindings = {"fire": (0,), "start": (7,)}  # Buttons A and Start of most gamepads
+        self.gamepad = True  # Read gamepads plugged in, steering with the left stick or the d-pad
+        self.gamepad_axis = 0  # Stick axis steering the ship, 0 is the horizontal axis of the left stick
+        self.gamepad_deadzone = 0.5  # Stick deflection under which the ship doesn't move
+        self.low_latency_input = False  # Read input right before the simulation and present right after it
+
+        # Seed of all game randomness, None for a different game every time
+        self.seed = None
+        self.replay_path = None  # File to record the session inputs to for replaying it, None to disable
+
+        # Game loop settings
+        self.tick_rate = 120  # Number of fixed simulation steps per second
+        self.fps_cap = 60  # Max number of frames drawn per second, 0 for uncapped
+        self.max_steps_per_frame = 5  # Max number of simulation steps to catch up with in a single frame
 
         # Ship settings
         self.ship_speed = None  # Placeholder for dynamic settings
@@ -30,8 +55,54 @@ class Settings:
         self.alien_speed = None  # Placeholder for dynamic settings
         self.fleet_drop_speed = 10  # How quickly the fleet drops down the screen when an alien hits either edge
         self.fleet_direction = None  # Placeholder for dynamic settings
+        self.collision_grid = True  # Narrow collision tests down with a spatial hash instead of the whole fleet
+        self.collision_mode = "mask"  # "mask" to ignore the transparent corners of images, or "rect" for rect overlap
         self.alien_points = None  # Placeholder for dynamic settings
 
+        # Alien fire settings
+        self.alien_fire_rate = None  # Placeholder for dynamic settings
+        self.alien_fire_pattern = None  # Placeholder for dynamic settings
+        self.enemy_bullet_speed = None  # Placeholder for dynamic settings
+        self.enemy_bullet_width = 4
+        self.enemy_bullet_height = 10
+        self.enemy_bullet_color = (200, 40, 40)  # (R,G,B)
+        self.enemy_bullet_limit = 1024  # Max number of alien shots in flight, further shots are dropped
+
+        # Level settings
+        self.levels_directory = "levels"  # Directory of the level files, see `level_loader`
+        self.level_hot_reload = False  # Dev mode: re-read level files when they are edited while playing
+
+        # Explosion particle settings
+        self.particles = True  # Draw explosion particles, never drawn by headless games
+        self.particle_limit = 2048  # Max number of live particles, the oldest are replaced by new explosions
+        self.particles_per_alien = 24  # Particles emitted by each alien destroyed
+        self.particles_per_ship = 96  # Particles emitted when the ship is hit
+        self.particle_life = 0.6  # Max seconds a particle lives
+        self.particle_speed = 180.0  # Max initial speed of a particle in pixels per second
+        self.particle_drag = 2.5  # Fraction of its speed a particle loses per second
+        self.particle_size = 3  # Width and height of a particle in pixels
+
+        # Pauses in seconds of game time, set to 0 to skip them (e.g. in headless runs)
+        self.ship_lost_delay = 0.5  # Time for the player to notice the collision before the fleet regroups
+        self.level_up_delay = 1.0  # Time the next level is announced before its fleet appears
+        self.game_over_delay = 1.5  # Time "Game Over" is shown before going back to the Play button
+
+        # Score persistence settings
+        self.persist_scores = True  # Save the highest score and the session history, disabled in headless simulations
+        self.score_directory = "."  # Directory of the high score index and the session log
+        self.save_interval = 1.0  # Min seconds between two writes, high score updates in between are coalesced
+        self.leaderboard_size = 10  # Number of top sessions kept in the index
+
+        # Profiling settings
+        self.profile = False  # Time each phase of every frame and draw an overlay of the statistics (toggle with F3)
+        self.profile_export = None  # File to export the profile to on exit: ".csv", ".json" or ".trace.json"
+
+        # Sound settings
+        self.sound_enabled = True  # Set False to play silently, e.g. without an audio device
+        self.sound_channels = 8  # Number of mixer channels shared by all sound effects
+        self.sound_voice_limit = 3  # Max number of channels playing the same effect at once
+        self.sound_min_interval = 30  # Min milliseconds between two starts of the same effect
+
         # How quickly the game speeds up
         self.speedup_scale = 1.1
 
@@ -49,8 +120,12 @@ class Settings:
 
     def initialize_dynamic_settings(self):
         """Initialize settings that change throughout the game."""
-        self.ship_speed = 1.5  # Initial speed of spaceship: shift 1.5 pixel per LEFT/RIGHT press
-        self.bullet_speed = 1  # Initial speed of bullet move up screen
-        self.alien_speed = 1  # Initial speed of aliens of move left and right
+        # Speeds are in pixels per second so the game plays the same on any host
+        self.ship_speed = 300.0  # Initial speed of spaceship while LEFT/RIGHT is held
+        self.bullet_speed = 400.0  # Initial speed of bullet move up screen
+        self.alien_speed = 150.0  # Initial speed of aliens of move left and right
         self.fleet_direction = Settings.RIGHT  # Initial moving direction of fleet of aliens
         self.alien_points = 50  # Initial points for each alien
+        self.alien_fire_rate = 0.5  # Volleys fired by the fleet per second
+        self.alien_fire_pattern = "straight"  # Directions of the shots of a volley, see `enemy_fire.PATTERNS`
+        self.enemy_bullet_speed = 250.0  # Speed of the shots of the aliens
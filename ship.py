@@ -1,52 +1,61 @@
 """Module maintains the spaceship."""
 
-import pygame
-from pygame.sprite import Sprite  # Facilitate to maintain a list of ships
+from assets import assets
+from entity import Entity
 
 
-class Ship(Sprite):
+class Ship(Entity):
     """A class to manage the ship."""
 
+    __slots__ = ("context", "mask", "x", "prev_x", "moving_right", "moving_left")
+
     def __init__(self, ai_game, *groups):
         """
         Initialize the ship and set its start location.
         :param ai_game: Reference to the current instance of `AlienInvasion` class.
         """
         super().__init__(*groups)
-        self.screen = ai_game.screen
-        self.settings = ai_game.settings
-        self.screen_rect = self.screen.get_rect()  # Get the associated rectangle of screen
+        self.context = ai_game.context  # Screen area and settings shared by the whole game
 
-        # Load the ship image and get its associated rectangle
-        self.image = pygame.image.load("images/ship.bmp")  # Returns a surface representing the ship
+        # Get the shared ship image and its associated rectangle
+        self.image = assets.load_image("images/ship.bmp")  # Returns a surface representing the ship
         self.rect = self.image.get_rect()
+        self.mask = assets.mask("images/ship.bmp")  # Shared collision mask leaving out the image background
 
         # Place the spaceship to the middle bottom of screen
         self.x = 0  # Floating value to record the horizontal position of spaceship
+        self.prev_x = 0  # Horizontal position at the previous simulation step for interpolated drawing
         self.center_ship()
 
         # Movement flag
         self.moving_right = False  # Moving right flag
         self.moving_left = False  # Moving left flag
 
-    def update(self, *args):
-        """Update the ship's position based on the movement flag."""
+    def update(self, dt, *args):
+        """
+        Update the ship's position based on the movement flag.
+        :param dt: Seconds elapsed in this simulation step.
+        """
         # Update the ship's x value, not the rect directly
-        if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.x += self.settings.ship_speed
-        if self.moving_left and self.rect.left > self.screen_rect.left:
-            self.x -= self.settings.ship_speed
+        self.prev_x = self.x
+        screen_rect, speed = self.context.screen_rect, self.context.settings.ship_speed
+        if self.moving_right and self.rect.right < screen_rect.right:
+            self.x += speed * dt
+        if self.moving_left and self.rect.left > screen_rect.left:
+            self.x -= speed * dt
 
         # Update `rect.x` from `self.x`
         self.rect.x = self.x
 
-    def blitme(self):
-        """Draw the ship at its current location."""
-        self.screen.blit(self.image, self.rect)
+    def interpolate(self, alpha):
+        """Place the rect between the previous and current positions for drawing."""
+        # Written backwards from `x` so that alpha = 1 restores the exact simulated position
+        self.rect.x = self.x - (self.x - self.prev_x) * (1 - alpha)
 
     def center_ship(self):
         """Center the spaceship on the screen."""
         # Start each new ship at the bottom center of the screen
-        self.rect.midbottom = self.screen_rect.midbottom
+        self.rect.midbottom = self.context.screen_rect.midbottom
         # Store a float value of the ship's horizontal position because `rect.x` is an integer
         self.x = float(self.rect.x)
+        self.prev_x = self.x
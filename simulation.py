@@ -0,0 +1,109 @@
+"""
+Module maintains the headless, deterministic simulation of Alien Invasion.
+Note: A simulated game has no window, no audio and no event queue. Inputs come from a policy called once per fixed
+step, all randomness is seeded and pauses can be skipped, so the same seed, settings and policy always
+produce the same game, as fast as the CPU allows.
+"""
+
+import random
+
+import inputs
+from alien_invasion import AlienInvasion
+from settings import Settings
+
+
+def idle_policy(game, rng):
+    """Never move nor shoot."""
+    return 0
+
+
+def random_policy(game, rng):
+    """Wander randomly, keeping the previous direction most of the time, and press fire at random."""
+    state = game.input_state & (inputs.MOVE_LEFT | inputs.MOVE_RIGHT)
+    if rng.random() < 0.05:  # Change direction once in a while
+        state = rng.choice((0, inputs.MOVE_LEFT, inputs.MOVE_RIGHT))
+    if not game.input_state & inputs.FIRE and rng.random() < 0.1:
+        state |= inputs.FIRE
+    return state
+
+
+def tracker_policy(game, rng):
+    """Move under the lowest alien and keep tapping fire."""
+    fleet = game.fleet
+    state = 0
+    if len(fleet):
+        lowest = max(fleet.alive.nonzero()[0].tolist(), key=lambda index: fleet.y[index])
+        target = fleet.x[lowest] + fleet.alien_width / 2
+        if target < game.ship.rect.centerx - 5:
+            state |= inputs.MOVE_LEFT
+        elif target > game.ship.rect.centerx + 5:
+            state |= inputs.MOVE_RIGHT
+    if not game.input_state & inputs.FIRE:  # Release fire every other step so each press shoots
+        state |= inputs.FIRE
+    return state
+
+
+# Map of policy name to the policy function, to pick a policy by name (e.g. from another process)
+POLICIES = {"idle": idle_policy, "random": random_policy, "tracker": tracker_policy}
+
+
+class Simulation:
+    """A single headless game driven by a policy."""
+
+    def __init__(self, settings=None, seed=0, policy="tracker", max_seconds=600.0, skip_pauses=True):
+        """
+        Create a headless game.
+        :param settings: Instance of `Settings` to play with, default to a new one.
+        :param seed: Seed of the game and of the policy randomness.
+        :param policy: Name in `POLICIES` or function of (game, rng) returning the `inputs` bit mask for the next step.
+        :param max_seconds: Simulated time after which the game is stopped even if not over.
+        :param skip_pauses: Whether to end ship lost, level up and game over pauses right away.
+        """
+        settings = settings if settings is not None else Settings()
+        settings.seed = seed
+        settings.sound_enabled = False
+        settings.persist_scores = False  # Simulated games don't compete with the player's scores
+        if skip_pauses:
+            settings.ship_lost_delay = settings.level_up_delay = settings.game_over_delay = 0.0
+        self.game = AlienInvasion(settings, headless=True)
+        self.seed = seed
+        self.policy = POLICIES[policy] if isinstance(policy, str) else policy
+        self.policy_rng = random.Random(seed)  # Separate stream so policies don't perturb the game
+        self.max_seconds = max_seconds
+        self.dt = 1.0 / settings.tick_rate
+
+    def start(self):
+        """Press and release START to begin a new game."""
+        self.game.set_input_state(inputs.START)
+        self.game.set_input_state(0)
+
+    def step(self, state):
+        """
+        Apply the input state and advance the game by one fixed step.
+        :param state: Bit mask of the `inputs` flags held down during the step.
+        """
+        self.game.set_input_state(state)
+        self.game._tick(self.dt)
+
+    def is_over(self):
+        """Return True once the game is lost or ran out of simulated time."""
+        return not self.game.stats.game_active or self.game.sim_time >= self.max_seconds
+
+    def run(self):
+        """Play a whole game with the policy and return its result."""
+        self.start()
+        while not self.is_over():
+            self.step(self.policy(self.game, self.policy_rng))
+        return self.result()
+
+    def result(self):
+        """Return a dictionary summarizing the game."""
+        stats = self.game.stats
+        return {
+            "seed": self.seed,
+            "score": stats.score,
+            "level": stats.level,
+            "duration": self.game.sim_time,  # Simulated seconds
+            "ticks": self.game.ticks,
+            "game_over": not stats.game_active,
+        }
@@ -0,0 +1,78 @@
+"""
+Module maintains the sound effects of Alien Invasion.
+Note: `pygame.mixer_music` streams a single track, so loading an MP3 for each shot re-opened and re-decoded the file
+inside the frame loop and cut off the previous effect. Here every effect is decoded once into a `pygame.mixer.Sound`
+buffer and played on a pool of mixer channels.
+"""
+
+import pygame
+
+
+class SoundEffects:
+    """Preloaded sound effects played on a pool of mixer channels."""
+
+    # Map of effect name to the sound file it is decoded from
+    EFFECTS = {
+        "shoot": "sounds/shoot.mp3",
+        "explosion": "sounds/explosion.mp3",
+    }
+
+    def __init__(self, ai_game):
+        """
+        Decode all the effects and reserve the channel pool.
+        :param ai_game: Reference to the current instance of `AlienInvasion` class.
+        """
+        self.settings = ai_game.settings
+        pygame.mixer.set_num_channels(self.settings.sound_channels)
+
+        self.sounds = {name: pygame.mixer.Sound(path) for name, path in SoundEffects.EFFECTS.items()}
+        self._last_played = {name: -self.settings.sound_min_interval for name in self.sounds}  # Time stamps in ms
+        self.played = 0  # Number of effects actually started
+        self.dropped = 0  # Number of effects skipped by the voice or rate limit
+
+    def play(self, name):
+        """
+        Play the effect `name` unless it is over its voice limit or was started too recently.
+        :param name: Key of the effect in `EFFECTS`.
+        """
+        sound = self.sounds[name]
+        now = pygame.time.get_ticks()
+        if (now - self._last_played[name] < self.settings.sound_min_interval
+                or sound.get_num_channels() >= self.settings.sound_voice_limit):
+            self.dropped += 1
+            return
+
+        channel = pygame.mixer.find_channel()  # Returns None if every channel of the pool is busy
+        if channel is None:
+            self.dropped += 1
+            return
+        channel.play(sound)
+        self._last_played[name] = now
+        self.played += 1
+
+
+class NullSoundEffects:
+    """Silent stand-in used when sound is disabled or there is no audio device (e.g. headless runs)."""
+
+    def __init__(self, ai_game=None):
+        """Initialize the counters to keep the same interface as `SoundEffects`."""
+        self.played = 0
+        self.dropped = 0
+
+    def play(self, name):
+        """Do nothing."""
+
+
+def create_sound_effects(ai_game):
+    """
+    Return the sound effects backend for the game, falling back to the silent one without an audio device.
+    :param ai_game: Reference to the current instance of `AlienInvasion` class.
+    """
+    if not ai_game.settings.sound_enabled:
+        return NullSoundEffects(ai_game)
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        return SoundEffects(ai_game)
+    except pygame.error:  # No audio device or the sound files can't be decoded
+        return NullSoundEffects(ai_game)
@@ -0,0 +1,61 @@
+"""Tests of the simulation steps that enter a timed pause of the game state machine."""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Asset paths are relative to the repository root
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from alien_invasion import AlienInvasion  # noqa: E402
+from game_state import GameState  # noqa: E402
+from settings import Settings  # noqa: E402
+
+
+def _started_game():
+    """Helper to return a headless game that just started, with the enemy fire updates recorded."""
+    settings = Settings()
+    settings.seed = 0
+    settings.persist_scores = False
+    game = AlienInvasion(settings, headless=True)
+    game._start_game()
+    game.enemy_fire_updates = []
+    game.enemy_fire.update = game.enemy_fire_updates.append  # Called with the step duration
+    return game
+
+
+def test_enemy_fire_runs_while_playing():
+    """A step that stays in the playing phase moves the shots of the aliens."""
+    game = _started_game()
+    game._update(game.clock.dt)
+    assert game.state.playing
+    assert game.enemy_fire_updates == [game.clock.dt]
+
+
+def test_enemy_fire_frozen_when_an_alien_hits_the_ship():
+    """The shots of the aliens don't move in the step an alien hits the ship, which starts the respawn pause."""
+    game = _started_game()
+    game.fleet.spawn([game.ship.rect.topleft])  # A single alien right on the ship
+    game._update(game.clock.dt)
+    assert game.state.phase == GameState.SHIP_LOST
+    assert game.enemy_fire_updates == []
+
+
+def test_enemy_fire_frozen_when_the_last_ship_is_lost():
+    """The shots of the aliens don't move in the step the last ship is lost either."""
+    game = _started_game()
+    game.stats.ship_left = 0
+    game.fleet.spawn([game.ship.rect.topleft])
+    game._update(game.clock.dt)
+    assert game.state.phase == GameState.GAME_OVER
+    assert game.enemy_fire_updates == []
+
+
+def test_enemy_fire_frozen_when_the_last_alien_is_shot():
+    """The shots of the aliens don't move in the step the fleet is cleared, which starts the level-up pause."""
+    game = _started_game()
+    game.fleet.kill(list(range(len(game.fleet.sprites))))
+    game._update(game.clock.dt)
+    assert game.state.phase == GameState.LEVEL_UP
+    assert game.enemy_fire_updates == []
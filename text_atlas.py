@@ -0,0 +1,78 @@
+"""
+Module maintains cached text rendering for the HUD.
+Note: Rasterizing text with `Font.render` is slow enough to show up as a frame-time spike when it happens inside the
+collision handler. `TextAtlas` renders each glyph of the number charset once and lays numbers out as a list of glyph
+blits, while fixed strings such as labels go through a small LRU cache of rendered surfaces.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class TextAtlas:
+    """Pre-rendered glyphs and an LRU cache of rendered strings for a single font and color."""
+
+    # Characters produced by formatting numbers with `f"{number:,g}"`, pre-rendered at creation
+    NUMBER_CHARSET = "0123456789,.e+-"
+
+    def __init__(self, font, color, cache_size=32):
+        """
+        Initialize the atlas.
+        :param font: Instance of `pygame.font.Font` to render with.
+        :param color: Tuple of (R,G,B) of the text.
+        :param cache_size: Max number of rendered strings kept in the LRU cache.
+        """
+        self.font = font
+        self.color = color
+        self.cache_size = cache_size
+        self._strings = OrderedDict()  # Map of string to its rendered surface, from least to most recently used
+        self.renders = 0  # Number of calls to `Font.render`, to check the cache keeps the frame loop quiet
+        self._glyphs = {char: self._render(char) for char in TextAtlas.NUMBER_CHARSET}
+
+    def render(self, text):
+        """Return the rendered surface of `text`, shared with every other request of the same string."""
+        surface = self._strings.get(text)
+        if surface is not None:
+            self._strings.move_to_end(text)
+            return surface
+
+        surface = self._render(text)
+        self._strings[text] = surface
+        if len(self._strings) > self.cache_size:
+            self._strings.popitem(last=False)  # Evict the least recently used string
+        return surface
+
+    def layout(self, label, number, **position):
+        """
+        Lay out a cached label followed by a number made of pre-rendered glyphs.
+        :param label: Fixed text drawn before the number, e.g. "Score: ".
+        :param number: Formatted number, e.g. "1,230".
+        :param position: Rect attributes placing the whole text, like `Surface.get_rect`, e.g. right=100, top=20.
+        :return: Tuple of (list of (surface, rect) pairs to draw, bounding rect).
+        """
+        surfaces = [self.render(label)] + [self._glyph(char) for char in number]
+        bounding_rect = pygame.Rect(0, 0, sum(surface.get_width() for surface in surfaces), self.font.get_height())
+        for name, value in position.items():
+            setattr(bounding_rect, name, value)
+
+        items = []
+        x = bounding_rect.left
+        for surface in surfaces:
+            rect = surface.get_rect(topleft=(x, bounding_rect.top))
+            items.append((surface, rect))
+            x = rect.right
+        return items, bounding_rect
+
+    def _glyph(self, char):
+        """Helper to return the surface of a single character, rendering it once if it is outside the charset."""
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            glyph = self._glyphs[char] = self._render(char)
+        return glyph
+
+    def _render(self, text):
+        """Helper to rasterize `text` with the font."""
+        self.renders += 1
+        return self.font.render(text, True, self.color)
+
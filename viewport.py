@@ -0,0 +1,78 @@
+"""
+Module maintains the mapping from the logical resolution of the game to the display.
+Note: The game always simulates and lays out its scene at the logical size of `Settings.screen_width` x
+`Settings.screen_height`, so every display plays the same game. The viewport maps the scene to the display just before
+it is rendered: rects are scaled and letterboxed, and each surface is scaled once per display size and cached for as
+long as the surface lives, so no pixel is rescaled per frame and a 4K display costs the same blits as the logical size.
+"""
+
+import weakref
+
+import pygame
+
+
+class Viewport:
+    """Scale and offset from the logical resolution to the display, with a cache of pre-scaled surfaces."""
+
+    def __init__(self, logical_size, output_size, mode="smooth"):
+        """
+        Fit the logical resolution in the display, keeping its aspect ratio.
+        :param logical_size: Tuple of (width, height) the game is laid out at.
+        :param output_size: Tuple of (width, height) of the display.
+        :param mode: "integer" to scale by a whole factor with sharp pixels, or "smooth" to fill the display.
+        """
+        (logical_width, logical_height), (output_width, output_height) = logical_size, output_size
+        scale = min(output_width / logical_width, output_height / logical_height)
+        if mode == "integer" and scale >= 1:
+            scale = int(scale)
+        self.scale = scale
+        self.mode = mode
+        # Center the scaled frame, the bars left on the sides are painted with the background color
+        self.offset_x = (output_width - round(logical_width * scale)) // 2
+        self.offset_y = (output_height - round(logical_height * scale)) // 2
+        self.identity = scale == 1 and self.offset_x == self.offset_y == 0  # Scene can be drawn as is
+        self._surfaces = weakref.WeakKeyDictionary()  # Map of logical surface to its scaled copy, freed with it
+        self.scaled = 0  # Number of surfaces scaled so far, which stops growing once every sprite was drawn once
+
+    def map(self, scene):
+        """
+        Return the scene mapped to the display.
+        :param scene: List of (surface, rect) pairs at the logical resolution.
+        """
+        if self.identity:
+            return scene
+        surface, rect = self.surface, self.rect
+        return [(surface(image), rect(image_rect)) for image, image_rect in scene]
+
+    def surface(self, image):
+        """Return the copy of `image` scaled to the display, scaling it on the first request only."""
+        scaled = self._surfaces.get(image)
+        if scaled is None:
+            size = (round(image.get_width() * self.scale), round(image.get_height() * self.scale))
+            if self.mode == "integer" and self.scale >= 1 or image.get_bitsize() not in (24, 32):
+                scaled = pygame.transform.scale(image, size)  # Nearest neighbour keeps the pixels sharp
+            else:
+                scaled = pygame.transform.smoothscale(image, size)
+            self._surfaces[image] = scaled
+            self.scaled += 1
+        return scaled
+
+    def rect(self, rect):
+        """Return `rect` scaled and moved to the display."""
+        scale = self.scale
+        return pygame.Rect(self.offset_x + round(rect.x * scale), self.offset_y + round(rect.y * scale),
+                           round(rect.width * scale), round(rect.height * scale))
+
+    def to_logical(self, position):
+        """Return the logical coordinates of the display point `position`, e.g. of the mouse."""
+        x, y = position
+        return int((x - self.offset_x) / self.scale), int((y - self.offset_y) / self.scale)
+
+
+def create_viewport(ai_game):
+    """
+    Return the viewport from the logical resolution of the game to its display.
+    :param ai_game: Reference to the current instance of `AlienInvasion` class.
+    """
+    settings = ai_game.settings
+    return Viewport(ai_game.screen.get_size(), ai_game.display.get_size(), settings.scale_mode)